@@ -464,67 +464,57 @@ def uniform_cost_search(problem):
     return graph_search(problem, PriorityQueue(min, lambda a: a.path_cost))
 
 
+MOVES = (
+    ("Right", (1, 0)),
+    ("Left", (-1, 0)),
+    ("Up", (0, 1)),
+    ("Down", (0, -1)),
+)
+
+
+def obstacle_trajectory(obstacle, height):
+    """Positions of an obstacle bouncing up and down its column, one for
+    every time step of a full period.
+    :param obstacle: (x, y, d) where d=1 is up and d=-1 is down
+    :param height: number of rows on the board
+    :return: list of (x, y) positions, index t is the position at time t
+    :rtype: list
+    """
+    x, y, d = obstacle
+    if height < 2:
+        return [(x, y)]
+    positions = []
+    for _ in range(2 * (height - 1)):
+        positions.append((x, y))
+        if (d == 1 and y == height - 1) or (d == -1 and y == 0):
+            d = -d
+        y += d
+    return positions
+
+
 class Explorer(Problem):
     def __init__(self, initial, goal=None):
-        super().__init__(initial, goal)
+        # initial = (x, y, obstacle1, obstacle2, ...); the obstacles move
+        # periodically, so states are (x, y, t mod period) and the obstacle
+        # positions for every phase are computed once here
         self.grid_size = [8, 6]
+        self.obstacles = initial[2:]
+        trajectories = [obstacle_trajectory(obstacle, self.grid_size[1]) for obstacle in self.obstacles]
+        self.period = len(trajectories[0]) if trajectories else 1
+        self.blocked = [frozenset(trajectory[t] for trajectory in trajectories) for t in range(self.period)]
+        super().__init__((initial[0], initial[1], 0), goal)
 
     def successor(self, state):
-        # d=-1 down, d=1 up
-        # (x,y,(o1x,o1y,d),(o2x,o2y,d))
+        # (x, y, t)
         successors = dict()
-        man_x = state[0]
-        man_y = state[1]
-        obstacle1 = list(state[2])
-        obstacle2 = list(state[3])
-
-        if obstacle1[2] == 1:  # up
-            if obstacle1[1] == self.grid_size[1] - 1:
-                obstacle1[2] = -1
-                obstacle1[1] -= 1
-            else:
-                obstacle1[1] += 1
-        else: #down
-            if obstacle1[1] == 0:
-                obstacle2[2] = 1
-                obstacle1[1] += 1
-            else:
-                obstacle1[1] -= 1
-
-        if obstacle2[2] == 1:  # up
-            if obstacle2[1] == self.grid_size[1] - 1:
-                obstacle2[2] = -1
-                obstacle2[1] -= 1
-            else:
-                obstacle2[1] += 1
-        else: #down
-            if obstacle2[1] == 0:
-                obstacle2[2] = 1
-                obstacle2[1] += 1
-            else:
-                obstacle2[1] -= 1
-
-        obstacles = [(obstacle1[0], obstacle1[1]), (obstacle2[0], obstacle2[1])]
-
-        # right x = x+1
-        if man_x + 1 < self.grid_size[0] and (man_x + 1, man_y) not in obstacles:
-            successors["Right"] = (man_x + 1, man_y, (obstacle1[0], obstacle1[1], obstacle1[2]),
-                                   (obstacle2[0], obstacle2[1], obstacle2[2]))
-
-        # left x = x-1
-        if man_x - 1 > 0 and (man_x + 1, man_y) not in obstacles:
-            successors["Left"] = (man_x - 1, man_y, (obstacle1[0], obstacle1[1], obstacle1[2]),
-                                  (obstacle2[0], obstacle2[1], obstacle2[2]))
-
-        # up x = y+1
-        if man_y + 1 < self.grid_size[1] and (man_x,man_y+1) not in obstacles:
-            successors["Up"] = (man_x, man_y+1  , (obstacle1[0], obstacle1[1], obstacle1[2]),
-                                   (obstacle2[0], obstacle2[1],obstacle2[2]))
-
-        # down x = y-1
-        if man_y - 1 > 0 and (man_x,man_y-1) not in obstacles:
-            successors["Down"] = (man_x, man_y - 1, (obstacle1[0], obstacle1[1], obstacle1[2]),
-                                   (obstacle2[0], obstacle2[1],obstacle2[2]))
+        man_x, man_y, t = state
+        t = (t + 1) % self.period
+        obstacles = self.blocked[t]
+
+        for action, (dx, dy) in MOVES:
+            x, y = man_x + dx, man_y + dy
+            if 0 <= x < self.grid_size[0] and 0 <= y < self.grid_size[1] and (x, y) not in obstacles:
+                successors[action] = (x, y, t)
 
         return successors
 
@@ -313,6 +313,8 @@ class PriorityQueue(Queue):
 
 
 import sys
+from collections import deque
+from math import gcd
 
 """
 Неинформирано пребарување во рамки на дрво.
@@ -464,6 +466,36 @@ def uniform_cost_search(problem):
     return graph_search(problem, PriorityQueue(min, lambda a: a.path_cost))
 
 
+def bitset_breadth_first_search(problem, size):
+    """Пребарување прво во широчина за проблеми чии состојби се цели
+    броеви од 0 до size - 1. Посетените состојби се чуваат во битсет
+    наместо во множество, па меморијата е size / 8 бајти.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param size: број на можни состојби
+    :type size: int
+    :return: Node or None
+    :rtype: Node
+    """
+    visited = bytearray((size + 7) // 8)
+    node = Node(problem.initial)
+    visited[node.state >> 3] |= 1 << (node.state & 7)
+    if problem.goal_test(node.state):
+        return node
+    frontier = deque([node])
+    while frontier:
+        node = frontier.popleft()
+        for action, state in problem.successor(node.state).items():
+            if visited[state >> 3] & (1 << (state & 7)):
+                continue
+            visited[state >> 3] |= 1 << (state & 7)
+            child = Node(state, node, action, node.path_cost + 1)
+            if problem.goal_test(state):
+                return child
+            frontier.append(child)
+    return None
+
+
 class Container(Problem):
     def __init__(self, capacities, inital, goal=None):
         super().__init__(inital, goal)
@@ -481,11 +513,11 @@ class Container(Problem):
             successors["isprazni go sadot J1"] = (j0, 0)
 
         if j0 > 0 and j1 < c1:
-            delta = (c1 - j1, j0)
+            delta = min(c1 - j1, j0)
             successors["preturi od J0 vo J1"] = (j0 - delta, j1 + delta)
 
         if j1 > 0 and j0 < c0:
-            delta = (c0 - j0, j1)
+            delta = min(c0 - j0, j1)
             successors["preturi od J1 vo J0"] = (j0 + delta, j1 - delta)
 
         return successors
@@ -500,6 +532,98 @@ class Container(Problem):
         return state == self.goal
 
 
+class Jugs(Problem):
+    def __init__(self, capacities, initial, goal=None, fill=False):
+        """Container generalized to any number of jugs. A state is packed
+        into one mixed-radix integer, where jug i is the digit with base
+        capacities[i] + 1.
+        :param capacities: capacity of every jug
+        :param initial: amount of water in every jug
+        :param goal: wanted amount of water in every jug
+        :param fill: whether jugs can also be filled from a tap
+        """
+        self.capacities = tuple(capacities)
+        self.radix = []
+        size = 1
+        for capacity in self.capacities:
+            self.radix.append(size)
+            size *= capacity + 1
+        self.size = size
+        self.fill = fill
+        self.start = tuple(initial)
+        self.target = None if goal is None else tuple(goal)
+        super().__init__(self.encode(initial), None if goal is None else self.encode(goal))
+
+        n = len(self.capacities)
+        self.pairs = [(i, j, f"preturi od J{i} vo J{j}") for i in range(n) for j in range(n) if i != j]
+        self.emptying = [(i, f"isprazni go sadot J{i}") for i in range(n)]
+        self.filling = [(i, f"napolni go sadot J{i}") for i in range(n)] if fill else []
+
+    def encode(self, amounts):
+        return sum(amount * radix for amount, radix in zip(amounts, self.radix))
+
+    def decode(self, state):
+        return tuple(state // radix % (capacity + 1) for radix, capacity in zip(self.radix, self.capacities))
+
+    def feasible(self):
+        """Necessary conditions for the goal to be reachable. Emptying and
+        pouring (and filling) only ever produce integer combinations of the
+        capacities and the initial amounts, so every goal amount must be a
+        multiple of their gcd. Without a tap the total can only go down.
+        :return: False if the goal is certainly unreachable
+        :rtype: bool
+        """
+        if self.target is None:
+            return True
+        if len(self.target) != len(self.capacities):
+            return False
+        if any(not 0 <= amount <= capacity for amount, capacity in zip(self.target, self.capacities)):
+            return False
+        divisor = gcd(*self.capacities, *self.start)
+        if divisor and any(amount % divisor for amount in self.target):
+            return False
+        return self.fill or sum(self.target) <= sum(self.start)
+
+    def successor(self, state):
+        successors = dict()
+        amounts = self.decode(state)
+        radix = self.radix
+
+        for i, action in self.emptying:
+            if amounts[i] > 0:
+                successors[action] = state - amounts[i] * radix[i]
+
+        for i, action in self.filling:
+            if amounts[i] < self.capacities[i]:
+                successors[action] = state + (self.capacities[i] - amounts[i]) * radix[i]
+
+        for i, j, action in self.pairs:
+            delta = min(amounts[i], self.capacities[j] - amounts[j])
+            if delta > 0:
+                successors[action] = state - delta * radix[i] + delta * radix[j]
+
+        return successors
+
+    def actions(self, state):
+        return self.successor(state).keys()
+
+    def result(self, state, action):
+        return self.successor(state)[action]
+
+    def goal_test(self, state):
+        return state == self.goal
+
+    def search(self):
+        """Breadth-first search over a visited bitset of all the states,
+        after rejecting goals that fail the feasibility check.
+        :return: Node or None
+        :rtype: Node
+        """
+        if not self.feasible():
+            return None
+        return bitset_breadth_first_search(self, self.size)
+
+
 if __name__ == '__main__':
     container = Container([15, 5], (5, 5), (10, 0))
 
@@ -510,3 +634,8 @@ if __name__ == '__main__':
     result = depth_first_graph_search(container)
     print(result.solution())
     print(result.solve())
+
+    jugs = Jugs([8, 5, 3], (8, 0, 0), (4, 4, 0))
+    result = jugs.search()
+    print(result.solution())
+    print([jugs.decode(state) for state in result.solve()])
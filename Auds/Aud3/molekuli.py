@@ -70,6 +70,16 @@ class Problem:
         """
         return c + 1
 
+    def canonicalize(self, state):
+        """Врати ја каноничната форма на состојбата state. Состојбите што
+        се еквивалентни поради симетрија на проблемот треба да имаат иста
+        канонична форма, па пребарувањето во граф ги смета за една иста
+        состојба. Даденава имплементација ја враќа самата состојба.
+        :param state: дадена состојба
+        :return: канонична форма на состојбата
+        """
+        return state
+
     def value(self):
         """За проблеми на оптимизација, секоја состојба си има вредност.
         Hill-climbing и сличните алгоритми се обидуваат да ја максимизираат
@@ -382,8 +392,9 @@ def graph_search(problem, fringe):
         node = fringe.pop()
         if problem.goal_test(node.state):
             return node
-        if node.state not in closed:
-            closed.add(node.state)
+        key = problem.canonicalize(node.state)
+        if key not in closed:
+            closed.add(key)
             fringe.extend(node.expand(problem))
     return None
 
@@ -464,28 +475,75 @@ def uniform_cost_search(problem):
     return graph_search(problem, PriorityQueue(min, lambda a: a.path_cost))
 
 
-def move_right(x1, y1, x2, y2, x3, y3, obstacles):
-    while x1 < 8 and [x1 + 1, y1] not in obstacles and [x1 + 1, y1] != [x2, y2] and [x1 + 1, y1] != [y3, x3]:
-        x1 += 1
-    return x1
-
-
-def move_left(x1, y1, x2, y2, x3, y3, obstacles):
-    while x1 > 0 and [x1 - 1, y1] not in obstacles and [x1 - 1, y1] != [x2, y2] and [x1 - 1, y1] != [y3, x3]:
-        x1 -= 1
-    return x1
+GRID_WIDTH, GRID_HEIGHT = 9, 7
 
+DIRECTIONS = {
+    "Right": (1, 0),
+    "Left": (-1, 0),
+    "Up": (0, 1),
+    "Down": (0, -1),
+}
 
-def move_up(x1, y1, x2, y2, x3, y3, obstacles):
-    while y1 < 6 and [x1, y1 + 1] not in obstacles and [x1, y1 + 1] != [x2, y2] and [x1, y1 + 1] != [y3, x3]:
-        y1 += 1
-    return y1
+# Slide tables already built, keyed by obstacle layout and board size
+slide_tables = {}
 
 
-def move_down(x1, y1, x2, y2, x3, y3, obstacles):
-    while y1 > 0 and [x1, y1 - 1] not in obstacles and [x1, y1 - 1] != [x2, y2] and [x1, y1 - 1] != [y3, x3]:
-        y1 -= 1
-    return y1
+def slide_table(obstacles, width=GRID_WIDTH, height=GRID_HEIGHT):
+    """For every free cell and direction, count how many cells an atom slides
+    before it hits an obstacle or the edge of the board. The other atoms are
+    ignored here, because they move; the table only depends on the static
+    obstacles and is built once per layout.
+    :param obstacles: list of [x, y] obstacle cells
+    :param width: number of columns
+    :param height: number of rows
+    :return: dictionary {(x, y): {direction: steps}}
+    :rtype: dict
+    """
+    blocked = frozenset(tuple(cell) for cell in obstacles)
+    key = (blocked, width, height)
+    if key in slide_tables:
+        return slide_tables[key]
+    table = {}
+    for x in range(width):
+        for y in range(height):
+            if (x, y) in blocked:
+                continue
+            steps = {}
+            for direction, (dx, dy) in DIRECTIONS.items():
+                n = 0
+                while 0 <= x + (n + 1) * dx < width and 0 <= y + (n + 1) * dy < height \
+                        and (x + (n + 1) * dx, y + (n + 1) * dy) not in blocked:
+                    n += 1
+                steps[direction] = n
+            table[(x, y)] = steps
+    slide_tables[key] = table
+    return table
+
+
+def slide(table, x, y, direction, other1, other2):
+    """Position where an atom at (x, y) stops when pushed in the given direction.
+    :param table: slide table from slide_table
+    :param x: atom column
+    :param y: atom row
+    :param direction: one of DIRECTIONS
+    :param other1: (x, y) of the second atom
+    :param other2: (x, y) of the third atom
+    :return: new (x, y)
+    :rtype: tuple
+    """
+    dx, dy = DIRECTIONS[direction]
+    n = table[(x, y)][direction]
+    for ox, oy in (other1, other2):
+        # distance to the other atom if it lies on the same line ahead of us
+        if dx and oy == y:
+            k = (ox - x) * dx
+        elif dy and ox == x:
+            k = (oy - y) * dy
+        else:
+            continue
+        if 0 < k <= n:
+            n = k - 1
+    return x + n * dx, y + n * dy
 
 
 class Molecule(Problem):
@@ -493,64 +551,23 @@ class Molecule(Problem):
     def __init__(self, obstacles, initial, goal=None):
         super().__init__(initial, goal)
         self.obstacles = obstacles
+        self.table = slide_table(obstacles)
 
     def successor(self, state):
         successors = dict()
 
-        h1_x, h1_y = state[0], state[1]
-        o_x, o_y = state[2], state[3]
-        h2_x, h2_y = state[4], state[5]
-
-        # H1
-        x1_new = move_right(h1_x, h1_y, o_x, o_y, h2_x, h2_y, self.obstacles)
-        if x1_new != h1_x:
-            successors["RightH1"] = (x1_new, h1_y, o_x, o_y, h2_x, h2_y)
-
-        x1_new = move_left(h1_x, h1_y, o_x, o_y, h2_x, h2_y, self.obstacles)
-        if x1_new != h1_x:
-            successors["LeftH1"] = (x1_new, h1_y, o_x, o_y, h2_x, h2_y)
+        atoms = (("H1", (state[0], state[1])),
+                 ("O", (state[2], state[3])),
+                 ("H2", (state[4], state[5])))
 
-        y1_new = move_up(h1_x, h1_y, o_x, o_y, h2_x, h2_y, self.obstacles)
-        if y1_new != h1_y:
-            successors["UpH1"] = (h1_x, y1_new, o_x, o_y, h2_x, h2_y)
-
-        y1_new = move_down(h1_x, h1_y, o_x, o_y, h2_x, h2_y, self.obstacles)
-        if y1_new != h1_y:
-            successors["DownH1"] = (h1_x, y1_new, o_x, o_y, h2_x, h2_y)
-
-        # O
-        x_new = move_right(o_x, o_y, h1_x, h1_y, h2_x, h2_y, self.obstacles)
-        if x_new != o_x:
-            successors["RightO"] = (h1_x, h1_y, x_new, o_y, h2_x, h2_y)
-
-        x_new = move_left(o_x, o_y, h1_x, h1_y, h2_x, h2_y, self.obstacles)
-        if x_new != o_x:
-            successors["LeftO"] = (h1_x, h1_y, x_new, o_y, h2_x, h2_y)
-
-        y_new = move_up(o_x, o_y, h1_x, h1_y, h2_x, h2_y, self.obstacles)
-        if y_new != o_y:
-            successors["UpO"] = (h1_x, h1_y, o_x, y_new, h2_x, h2_y)
-
-        y_new = move_down(o_x, o_y, h1_x, h1_y, h2_x, h2_y, self.obstacles)
-        if y_new != o_y:
-            successors["DownO"] = (h1_x, h1_y, o_x, y_new, h2_x, h2_y)
-
-        # H2
-        x2_new = move_right(h2_x, h2_y, o_x, o_y, h1_x, h1_y, self.obstacles)
-        if x2_new != h2_x:
-            successors["RightH2"] = (x2_new, h2_y, o_x, o_y, h1_x, h1_y)
-
-        x2_new = move_right(h2_x, h2_y, o_x, o_y, h1_x, h1_y, self.obstacles)
-        if x2_new != h2_x:
-            successors["LeftH2"] = (x2_new, h1_y, o_x, o_y, h2_x, h2_y)
-
-        y2_new = move_up(h2_x, h2_y, o_x, o_y, h1_x, h1_y, self.obstacles)
-        if y1_new != h1_y:
-            successors["UpH2"] = (h2_x, y2_new, o_x, o_y, h1_x, h1_y)
-
-        y2_new = move_up(h2_x, h2_y, o_x, o_y, h1_x, h1_y, self.obstacles)
-        if y2_new != h2_y:
-            successors["DownH2"] = (h2_x, y2_new, o_x, o_y, h1_x, h1_y)
+        for i, (name, (x, y)) in enumerate(atoms):
+            others = [position for j, (_, position) in enumerate(atoms) if j != i]
+            for direction in DIRECTIONS:
+                new_x, new_y = slide(self.table, x, y, direction, others[0], others[1])
+                if (new_x, new_y) != (x, y):
+                    new_state = list(state)
+                    new_state[2 * i], new_state[2 * i + 1] = new_x, new_y
+                    successors[direction + name] = tuple(new_state)
 
         return successors
 
@@ -560,8 +577,16 @@ class Molecule(Problem):
     def result(self, state, action):
         return self.successor(state)[action]
 
+    def canonicalize(self, state):
+        # H1 и H2 се заменливи, па подреди ги водородните атоми
+        if (state[4], state[5]) < (state[0], state[1]):
+            return state[4], state[5], state[2], state[3], state[0], state[1]
+        return state
+
     def goal_test(self, state):
-        return state[1] == state[3] == state[5] and state[0]+1 == state[2] and state[2] == state[4]+1
+        # O е во средина, а водородните атоми се од двете страни во истиот ред
+        return state[1] == state[3] == state[5] and abs(state[0] - state[2]) == 1 \
+            and state[0] + state[4] == 2 * state[2]
 
 
 if __name__ == '__main__':
@@ -313,6 +313,7 @@ class PriorityQueue(Queue):
 
 
 import sys
+from sys import maxsize as infinity
 
 """
 Неинформирано пребарување во рамки на дрво.
@@ -465,21 +466,203 @@ def uniform_cost_search(problem):
 
 
 
+"""
+Информирано пребарување во рамки на граф
+"""
+
+
+def memoize(fn, slot=None):
+    """ Запамети ја пресметаната вредност за која била листа од
+    аргументи. Ако е специфициран slot, зачувај го резултатот во
+    тој slot на првиот аргумент. Ако slot е None, зачувај ги
+    резултатите во речник.
+
+    :param fn: зададена функција
+    :type fn: function
+    :param slot: име на атрибут во кој се чуваат резултатите од функцијата
+    :type slot: str
+    :return: функција со модификација за зачувување на резултатите
+    :rtype: function
+    """
+    if slot:
+        def memoized_fn(obj, *args):
+            if hasattr(obj, slot):
+                return getattr(obj, slot)
+            else:
+                val = fn(obj, *args)
+                setattr(obj, slot, val)
+                return val
+    else:
+        def memoized_fn(*args):
+            if args not in memoized_fn.cache:
+                memoized_fn.cache[args] = fn(*args)
+            return memoized_fn.cache[args]
+
+        memoized_fn.cache = {}
+    return memoized_fn
+
+
+def best_first_graph_search(problem, f):
+    """Пребарувај низ следбениците на даден проблем за да најдеш цел. Користи
+     функција за евалуација за да се одлучи кој е сосед најмногу ветува и
+     потоа да се истражи. Ако до дадена состојба стигнат два пата, употреби
+     го најдобриот пат.
+
+    :param problem: даден проблем
+    :type problem: Problem
+    :param f: дадена функција за евалуација (проценка)
+    :type f: function
+    :return: Node or None
+    :rtype: Node
+    """
+    f = memoize(f, 'f')
+    node = Node(problem.initial)
+    if problem.goal_test(node.state):
+        return node
+    frontier = PriorityQueue(min, f)
+    frontier.append(node)
+    # јазлите во frontier според нивната состојба
+    in_frontier = {node.state: node}
+    explored = set()
+    while frontier:
+        node = frontier.pop()
+        if in_frontier.get(node.state) is not node:
+            # јазелот бил заменет со подобар пат до истата состојба
+            continue
+        if problem.goal_test(node.state):
+            return node
+        del in_frontier[node.state]
+        explored.add(node.state)
+        for child in node.expand(problem):
+            if child.state not in explored and child.state not in in_frontier:
+                frontier.append(child)
+                in_frontier[child.state] = child
+            elif child.state in in_frontier:
+                incumbent = in_frontier[child.state]
+                if f(child) < f(incumbent):
+                    frontier.append(child)
+                    in_frontier[child.state] = child
+    return None
+
+
+def greedy_best_first_graph_search(problem, h=None):
+    """ Greedy best-first пребарување се остварува ако се специфицира дека f(n) = h(n).
+
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика
+    :type h: function
+    :return: Node or None
+    """
+    h = memoize(h or problem.h, 'h')
+    return best_first_graph_search(problem, h)
+
+
+def astar_search(problem, h=None):
+    """ A* пребарување е best-first graph пребарување каде f(n) = g(n) + h(n).
+
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика
+    :type h: function
+    :return: Node or None
+    """
+    h = memoize(h or problem.h, 'h')
+    return best_first_graph_search(problem, lambda n: n.path_cost + h(n))
+
+
+KNIGHT_MOVES = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, -1), (-1, 1))
+
+
 class Stars(Problem):
-    def __init__(self, initial, goal=None):
-        super().__init__(initial, goal)
+    def __init__(self, initial, goal=None, board_size=(8, 8)):
+        # initial = (kx, ky, bx, by, ((star1x, star1y), ...)); squares are
+        # packed as y * width + x and the remaining stars are a bitmask
+        self.width, self.height = board_size
+        kx, ky, bx, by, stars = initial
+        star_mask = 0
+        for x, y in stars:
+            star_mask |= 1 << self.square(x, y)
+        super().__init__((self.square(kx, ky), self.square(bx, by), star_mask), goal)
+
+        self.knight_moves = []
+        self.bishop_rays = []
+        for square in range(self.width * self.height):
+            x, y = self.position(square)
+            self.knight_moves.append(tuple(
+                (f"K{i + 1}", self.square(x + dx, y + dy)) for i, (dx, dy) in enumerate(KNIGHT_MOVES)
+                if self.inside(x + dx, y + dy)))
+            rays = []
+            for i, (dx, dy) in enumerate(BISHOP_DIRECTIONS):
+                ray = []
+                step = 1
+                while self.inside(x + step * dx, y + step * dy):
+                    ray.append((f"B{i + 1}-{step}", self.square(x + step * dx, y + step * dy)))
+                    step += 1
+                rays.append(tuple(ray))
+            self.bishop_rays.append(tuple(rays))
+
+        # knight_distance[star] lists the fewest knight moves from every square
+        self.knight_distance = {star: self.knight_distances(star) for star in self.stars(star_mask)}
+        self.tree_cache = {}
+        # colour_mask[c] has the squares where (x + y) % 2 == c
+        self.colour_mask = [0, 0]
+        for square in range(self.width * self.height):
+            self.colour_mask[sum(self.position(square)) % 2] |= 1 << square
+
+    def square(self, x, y):
+        return y * self.width + x
+
+    def position(self, square):
+        return square % self.width, square // self.width
+
+    def inside(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def stars(self, mask):
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(low.bit_length() - 1)
+            mask ^= low
+        return result
+
+    def knight_distances(self, source):
+        distances = [infinity] * (self.width * self.height)
+        distances[source] = 0
+        queue = [source]
+        for square in queue:
+            for _, target in self.knight_moves[square]:
+                if distances[target] == infinity:
+                    distances[target] = distances[square] + 1
+                    queue.append(target)
+        return distances
+
+    def bishop_distance(self, square, star):
+        x, y = self.position(square)
+        sx, sy = self.position(star)
+        if (x, y) == (sx, sy):
+            return 0
+        if abs(x - sx) == abs(y - sy):
+            return 1
+        if (x + y) % 2 == (sx + sy) % 2:
+            return 2
+        return infinity
 
     def successor(self, state):
         successors = dict()
-        # (kx,ky,bx,by,((star1x,star1y),...))
-
-        knight_x = state[0]
-        knight_y = state[1]
+        knight, bishop, stars = state
 
-        bishop_x = state[2]
-        bishop_y = state[3]
+        for action, target in self.knight_moves[knight]:
+            if target != bishop:
+                successors[action] = (target, bishop, stars & ~(1 << target))
 
-        star_pos = [4]
+        for ray in self.bishop_rays[bishop]:
+            for action, target in ray:
+                if target == knight:
+                    break
+                successors[action] = (knight, target, stars & ~(1 << target))
 
         return successors
 
@@ -490,4 +673,48 @@ class Stars(Problem):
         return self.successor(state)[action]
 
     def goal_test(self, state):
-        return super().goal_test(state)
+        return state[2] == 0
+
+    def knight_tree(self, mask):
+        """Weight of the minimum spanning tree over the stars in mask, with
+        knight distances as edge weights. The knight needs at least this many
+        moves between the stars when it has to collect all of them."""
+        if mask not in self.tree_cache:
+            stars = self.stars(mask)
+            best = {star: self.knight_distance[stars[0]][star] for star in stars[1:]}
+            total = 0
+            while best:
+                star = min(best, key=best.get)
+                total += best.pop(star)
+                for other in best:
+                    best[other] = min(best[other], self.knight_distance[star][other])
+            self.tree_cache[mask] = total
+        return self.tree_cache[mask]
+
+    def h(self, node):
+        # every move collects at most one star, and every star has to be
+        # reached by one of the two pieces
+        knight, bishop, stars = node.state
+        remaining = self.stars(stars)
+        value = len(remaining)
+        for star in remaining:
+            value = max(value, min(self.knight_distance[star][knight], self.bishop_distance(bishop, star)))
+
+        # the stars on the other colour can only be collected by the knight
+        knight_only = stars & self.colour_mask[1 - sum(self.position(bishop)) % 2]
+        if knight_only:
+            nearest = min(self.knight_distance[star][knight] for star in self.stars(knight_only))
+            value = max(value, nearest + self.knight_tree(knight_only))
+        return value
+
+
+if __name__ == '__main__':
+    knight_x = int(input())
+    knight_y = int(input())
+    bishop_x = int(input())
+    bishop_y = int(input())
+    star_positions = ((1, 1), (4, 3), (6, 6))
+
+    stars = Stars((knight_x, knight_y, bishop_x, bishop_y, star_positions))
+    answer = astar_search(stars)
+    print(answer.solution())
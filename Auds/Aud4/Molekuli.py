@@ -70,6 +70,16 @@ class Problem:
         """
         return c + 1
 
+    def canonicalize(self, state):
+        """Врати ја каноничната форма на состојбата state. Состојбите што
+        се еквивалентни поради симетрија на проблемот треба да имаат иста
+        канонична форма, па пребарувањето во граф ги смета за една иста
+        состојба. Даденава имплементација ја враќа самата состојба.
+        :param state: дадена состојба
+        :return: канонична форма на состојбата
+        """
+        return state
+
     def value(self):
         """За проблеми на оптимизација, секоја состојба си има вредност.
         Hill-climbing и сличните алгоритми се обидуваат да ја максимизираат
@@ -367,20 +377,27 @@ def best_first_graph_search(problem, f):
         return node
     frontier = PriorityQueue(min, f)
     frontier.append(node)
+    # јазлите во frontier според каноничната форма на нивната состојба
+    in_frontier = {problem.canonicalize(node.state): node}
     explored = set()
     while frontier:
         node = frontier.pop()
         if problem.goal_test(node.state):
             return node
-        explored.add(node.state)
+        key = problem.canonicalize(node.state)
+        del in_frontier[key]
+        explored.add(key)
         for child in node.expand(problem):
-            if child.state not in explored and child not in frontier:
+            key = problem.canonicalize(child.state)
+            if key not in explored and key not in in_frontier:
                 frontier.append(child)
-            elif child in frontier:
-                incumbent = frontier[child]
+                in_frontier[key] = child
+            elif key in in_frontier:
+                incumbent = in_frontier[key]
                 if f(child) < f(incumbent):
                     del frontier[incumbent]
                     frontier.append(child)
+                    in_frontier[key] = child
     return None
 
 
@@ -448,28 +465,75 @@ def recursive_best_first_search(problem, h=None):
     return result
 
 
-def move_right(x1, y1, x2, y2, x3, y3, obstacles):
-    while x1 < 8 and [x1 + 1, y1] not in obstacles and [x1 + 1, y1] != [x2, y2] and [x1 + 1, y1] != [y3, x3]:
-        x1 += 1
-    return x1
+GRID_WIDTH, GRID_HEIGHT = 9, 7
 
+DIRECTIONS = {
+    "Right": (1, 0),
+    "Left": (-1, 0),
+    "Up": (0, 1),
+    "Down": (0, -1),
+}
 
-def move_left(x1, y1, x2, y2, x3, y3, obstacles):
-    while x1 > 0 and [x1 - 1, y1] not in obstacles and [x1 - 1, y1] != [x2, y2] and [x1 - 1, y1] != [y3, x3]:
-        x1 -= 1
-    return x1
+# Slide tables already built, keyed by obstacle layout and board size
+slide_tables = {}
 
 
-def move_up(x1, y1, x2, y2, x3, y3, obstacles):
-    while y1 < 6 and [x1, y1 + 1] not in obstacles and [x1, y1 + 1] != [x2, y2] and [x1, y1 + 1] != [y3, x3]:
-        y1 += 1
-    return y1
-
-
-def move_down(x1, y1, x2, y2, x3, y3, obstacles):
-    while y1 > 0 and [x1, y1 - 1] not in obstacles and [x1, y1 - 1] != [x2, y2] and [x1, y1 - 1] != [y3, x3]:
-        y1 -= 1
-    return y1
+def slide_table(obstacles, width=GRID_WIDTH, height=GRID_HEIGHT):
+    """For every free cell and direction, count how many cells an atom slides
+    before it hits an obstacle or the edge of the board. The other atoms are
+    ignored here, because they move; the table only depends on the static
+    obstacles and is built once per layout.
+    :param obstacles: list of [x, y] obstacle cells
+    :param width: number of columns
+    :param height: number of rows
+    :return: dictionary {(x, y): {direction: steps}}
+    :rtype: dict
+    """
+    blocked = frozenset(tuple(cell) for cell in obstacles)
+    key = (blocked, width, height)
+    if key in slide_tables:
+        return slide_tables[key]
+    table = {}
+    for x in range(width):
+        for y in range(height):
+            if (x, y) in blocked:
+                continue
+            steps = {}
+            for direction, (dx, dy) in DIRECTIONS.items():
+                n = 0
+                while 0 <= x + (n + 1) * dx < width and 0 <= y + (n + 1) * dy < height \
+                        and (x + (n + 1) * dx, y + (n + 1) * dy) not in blocked:
+                    n += 1
+                steps[direction] = n
+            table[(x, y)] = steps
+    slide_tables[key] = table
+    return table
+
+
+def slide(table, x, y, direction, other1, other2):
+    """Position where an atom at (x, y) stops when pushed in the given direction.
+    :param table: slide table from slide_table
+    :param x: atom column
+    :param y: atom row
+    :param direction: one of DIRECTIONS
+    :param other1: (x, y) of the second atom
+    :param other2: (x, y) of the third atom
+    :return: new (x, y)
+    :rtype: tuple
+    """
+    dx, dy = DIRECTIONS[direction]
+    n = table[(x, y)][direction]
+    for ox, oy in (other1, other2):
+        # distance to the other atom if it lies on the same line ahead of us
+        if dx and oy == y:
+            k = (ox - x) * dx
+        elif dy and ox == x:
+            k = (oy - y) * dy
+        else:
+            continue
+        if 0 < k <= n:
+            n = k - 1
+    return x + n * dx, y + n * dy
 
 
 class Molecule(Problem):
@@ -477,64 +541,23 @@ class Molecule(Problem):
     def __init__(self, obstacles, initial, goal=None):
         super().__init__(initial, goal)
         self.obstacles = obstacles
+        self.table = slide_table(obstacles)
 
     def successor(self, state):
         successors = dict()
 
-        h1_x, h1_y = state[0], state[1]
-        o_x, o_y = state[2], state[3]
-        h2_x, h2_y = state[4], state[5]
-
-        # H1
-        x1_new = move_right(h1_x, h1_y, o_x, o_y, h2_x, h2_y, self.obstacles)
-        if x1_new != h1_x:
-            successors["RightH1"] = (x1_new, h1_y, o_x, o_y, h2_x, h2_y)
-
-        x1_new = move_left(h1_x, h1_y, o_x, o_y, h2_x, h2_y, self.obstacles)
-        if x1_new != h1_x:
-            successors["LeftH1"] = (x1_new, h1_y, o_x, o_y, h2_x, h2_y)
-
-        y1_new = move_up(h1_x, h1_y, o_x, o_y, h2_x, h2_y, self.obstacles)
-        if y1_new != h1_y:
-            successors["UpH1"] = (h1_x, y1_new, o_x, o_y, h2_x, h2_y)
-
-        y1_new = move_down(h1_x, h1_y, o_x, o_y, h2_x, h2_y, self.obstacles)
-        if y1_new != h1_y:
-            successors["DownH1"] = (h1_x, y1_new, o_x, o_y, h2_x, h2_y)
-
-        # O
-        x_new = move_right(o_x, o_y, h1_x, h1_y, h2_x, h2_y, self.obstacles)
-        if x_new != o_x:
-            successors["RightO"] = (h1_x, h1_y, x_new, o_y, h2_x, h2_y)
+        atoms = (("H1", (state[0], state[1])),
+                 ("O", (state[2], state[3])),
+                 ("H2", (state[4], state[5])))
 
-        x_new = move_left(o_x, o_y, h1_x, h1_y, h2_x, h2_y, self.obstacles)
-        if x_new != o_x:
-            successors["LeftO"] = (h1_x, h1_y, x_new, o_y, h2_x, h2_y)
-
-        y_new = move_up(o_x, o_y, h1_x, h1_y, h2_x, h2_y, self.obstacles)
-        if y_new != o_y:
-            successors["UpO"] = (h1_x, h1_y, o_x, y_new, h2_x, h2_y)
-
-        y_new = move_down(o_x, o_y, h1_x, h1_y, h2_x, h2_y, self.obstacles)
-        if y_new != o_y:
-            successors["DownO"] = (h1_x, h1_y, o_x, y_new, h2_x, h2_y)
-
-        # H2
-        x2_new = move_right(h2_x, h2_y, o_x, o_y, h1_x, h1_y, self.obstacles)
-        if x2_new != h2_x:
-            successors["RightH2"] = (x2_new, h2_y, o_x, o_y, h1_x, h1_y)
-
-        x2_new = move_right(h2_x, h2_y, o_x, o_y, h1_x, h1_y, self.obstacles)
-        if x2_new != h2_x:
-            successors["LeftH2"] = (x2_new, h1_y, o_x, o_y, h2_x, h2_y)
-
-        y2_new = move_up(h2_x, h2_y, o_x, o_y, h1_x, h1_y, self.obstacles)
-        if y1_new != h1_y:
-            successors["UpH2"] = (h2_x, y2_new, o_x, o_y, h1_x, h1_y)
-
-        y2_new = move_up(h2_x, h2_y, o_x, o_y, h1_x, h1_y, self.obstacles)
-        if y2_new != h2_y:
-            successors["DownH2"] = (h2_x, y2_new, o_x, o_y, h1_x, h1_y)
+        for i, (name, (x, y)) in enumerate(atoms):
+            others = [position for j, (_, position) in enumerate(atoms) if j != i]
+            for direction in DIRECTIONS:
+                new_x, new_y = slide(self.table, x, y, direction, others[0], others[1])
+                if (new_x, new_y) != (x, y):
+                    new_state = list(state)
+                    new_state[2 * i], new_state[2 * i + 1] = new_x, new_y
+                    successors[direction + name] = tuple(new_state)
 
         return successors
 
@@ -544,68 +567,44 @@ class Molecule(Problem):
     def result(self, state, action):
         return self.successor(state)[action]
 
+    def canonicalize(self, state):
+        # H1 и H2 се заменливи, па подреди ги водородните атоми
+        if (state[4], state[5]) < (state[0], state[1]):
+            return state[4], state[5], state[2], state[3], state[0], state[1]
+        return state
+
     def goal_test(self, state):
-        return state[1] == state[3] == state[5] and state[0]+1 == state[2] and state[2] == state[4]+1
+        # O е во средина, а водородните атоми се од двете страни во истиот ред
+        return state[1] == state[3] == state[5] and abs(state[0] - state[2]) == 1 \
+            and state[0] + state[4] == 2 * state[2]
 
     def h(self, node):
-        # Хевристичка функција која за секоја состојба пресметува минимален
-        # број на турнувања на паровите од атоми за тие да се спојат
+        # Хевристичка функција: секое турнување поместува еден атом или
+        # хоризонтално или вертикално. Атомите што не се во целниот ред мора
+        # барем еднаш да се турнат вертикално, а атомите што не се во својата
+        # целна колона барем еднаш хоризонтално, па збирот на двата броја е
+        # допуштлива и конзистентна проценка.
+        # H1 и H2 се заменливи, па се зема подобриот од двата распореди
         state = node.state
         h1 = state[0], state[1]
         o = state[2], state[3]
         h2 = state[4], state[5]
-        value = 0
-
-        # проверка за позициите на H1 и O и потребниот број на чекори за да се спојат
-        if h1[0] != o[0]:
-            if h1[1] != (o[1] - 1):
-                # ако атомот на водорот не е во иста редица и во колона веднаш до атомот
-                # на кислород ни требаат најмалку 2 турнувања (turn down/up + left/right)
-                # за да се спојат
-                value += 2
-            else:
-                # ако атомот на водорот не е во иста редица, но е во колона веднаш до атомот
-                # на кислород ни треба најмалку 1 турнувањe (turn up or down) за да се спојат
-                value += 1
-        else:  # h1[0] == o[0]
-            if h1[1] > o[1]:
-                # ако атомот на водорот е во иста редица, но во колона од десна страна на
-                # атомот на кислород ни требаат најмалку 3 турнувања (turn 2 x down/up + left/right)
-                # за да се спојат
-                value += 3
-            elif h1[1] < (o[1] - 1):
-                # ако атомот на водорот е во иста редица, но во колона од лева страна на
-                # атомот на кислород ни треба најмалку 1 турнување (turn right) за да се спојат
-                value += 1
-
-        # проверка за позициите на H2 и O и потребниот број на чекори за да се спојат
-        if h2[0] != o[0]:
-            if h2[1] != (o[1] + 1):
-                # ако атомот на водорот не е во иста редица и во колона веднаш до атомот
-                # на кислород ни требаат најмалку 2 турнувања (turn down/up + left/right)
-                # за да се спојат
-                value += 2
-            else:
-                # ако атомот на водорот не е во иста редица, но е во колона веднаш до атомот
-                # на кислород ни треба најмалку 1 турнувањe (turn up or down) за да се спојат
-                value += 1
-        else:  # h2[0] == o[0]
-            if h2[1] < o[1]:  # ако атомот на водорот е во иста редица, но во колона од лева страна на
-                # атомот на кислород ни требаат најмалку 3 турнувања (turn 2 x down/up + left/right)
-                # за да се спојат
-                value += 3
-            elif h2[1] > (o[1] + 1):
-                # ако атомот на водорот е во иста редица, но во колона од десна страна на
-                # атомот на кислород ни треба најмалку 1 турнување (turn left) за да се спојат
-                value += 1
+        return self.row_cost(h1, o, h2) + min(self.column_cost(h1, o, h2), self.column_cost(h2, o, h1))
 
-        if h1[0] == h2[0] and h1[0] != o[0]:
-            # ако водородните атоми се во ист ред тогаш можеме да имаме само едно турнување на
-            # атомот на кислород up/down (а претходно сме пресметале турнување на H1 и турнување на H2)
-            value -= 1
-
-        return value
+    @staticmethod
+    def row_cost(h1, o, h2):
+        # најмал број на атоми надвор од заедничкиот целен ред
+        rows = (h1[1], o[1], h2[1])
+        return 3 - max(rows.count(row) for row in rows)
 
+    @staticmethod
+    def column_cost(h1, o, h2):
+        # најмал број на атоми што не се во својата колона кога H1 е лево,
+        # а H2 десно од O; целната колона на O е една од трите што ги дозволуваат
+        best = 3
+        for column in (h1[0] + 1, o[0], h2[0] - 1):
+            best = min(best, (h1[0] != column - 1) + (o[0] != column) + (h2[0] != column + 1))
+        return best
 
 
 if __name__ == "__main__":
@@ -616,8 +615,11 @@ if __name__ == "__main__":
     h2_atom_column = int(input())
     h2_atom_row = int(input())
 
-    molecule = Molecule((h1_atom_column, h1_atom_row, o_atom_column,
-                         o_atom_row, h2_atom_column, h2_atom_row))
+    obstacle_list = [[0, 1], [1, 1], [1, 3], [2, 5], [3, 1], [3, 6], [4, 2], [5, 6], [6, 1], [6, 2], [6, 3],
+                     [7, 3], [7, 6], [8, 5]]
+
+    molecule = Molecule(obstacle_list, (h1_atom_column, h1_atom_row, o_atom_column,
+                                        o_atom_row, h2_atom_column, h2_atom_row))
 
     answer = astar_search(molecule)
     print(answer.solution())
@@ -1,4 +1,9 @@
 import bisect
+try:
+    import numpy as np
+except ImportError:
+    # numpy се користи само за h_batch, без него h се пресметува за секој јазол
+    np = None
 
 """
 Дефинирање на класа за структурата на проблемот кој ќе го решаваме со пребарување.
@@ -349,7 +354,7 @@ def memoize(fn, slot=None):
     return memoized_fn
 
 
-def best_first_graph_search(problem, f):
+def best_first_graph_search(problem, f, f_batch=None):
     """Пребарувај низ следбениците на даден проблем за да најдеш цел. Користи
      функција за евалуација за да се одлучи кој е сосед најмногу ветува и
      потоа да се истражи. Ако до дадена состојба стигнат два пата, употреби
@@ -358,6 +363,9 @@ def best_first_graph_search(problem, f):
     :type problem: Problem
     :param f: дадена функција за евалуација (проценка)
     :type f: function
+    :param f_batch: опционална функција која ги проценува сите деца од едно
+                    проширување со еден повик и враќа листа од f вредности
+    :type f_batch: function
     :return: Node or None
     :rtype: Node
     """
@@ -373,7 +381,13 @@ def best_first_graph_search(problem, f):
         if problem.goal_test(node.state):
             return node
         explored.add(node.state)
-        for child in node.expand(problem):
+        children = node.expand(problem)
+        if f_batch is not None:
+            fresh = [child for child in children if child.state not in explored]
+            # вредностите се запишуваат во слотот 'f', па memoize повеќе не ја повикува f
+            for child, value in zip(fresh, f_batch(fresh) if fresh else ()):
+                child.f = value
+        for child in children:
             if child.state not in explored and child not in frontier:
                 frontier.append(child)
             elif child in frontier:
@@ -386,26 +400,43 @@ def best_first_graph_search(problem, f):
 
 def greedy_best_first_graph_search(problem, h=None):
     """ Greedy best-first пребарување се остварува ако се специфицира дека f(n) = h(n).
+    Ако h не е зададена, numpy е инсталиран и проблемот има метод
+    h_batch(states), децата од секое проширување се проценуваат заедно со
+    еден NumPy повик.
     :param problem: даден проблем
     :type problem: Problem
     :param h: дадена функција за хевристика
     :type h: function
     :return: Node or None
     """
+    h_batch = None if h or np is None else getattr(problem, 'h_batch', None)
     h = memoize(h or problem.h, 'h')
-    return best_first_graph_search(problem, h)
+    f_batch = None
+    if h_batch is not None:
+        def f_batch(nodes):
+            return np.asarray(h_batch([n.state for n in nodes])).tolist()
+    return best_first_graph_search(problem, h, f_batch)
 
 
 def astar_search(problem, h=None):
     """ A* пребарување е best-first graph пребарување каде f(n) = g(n) + h(n).
+    Ако h не е зададена, numpy е инсталиран и проблемот има метод
+    h_batch(states), децата од секое проширување се проценуваат заедно со
+    еден NumPy повик.
     :param problem: даден проблем
     :type problem: Problem
     :param h: дадена функција за хевристика
     :type h: function
     :return: Node or None
     """
+    h_batch = None if h or np is None else getattr(problem, 'h_batch', None)
     h = memoize(h or problem.h, 'h')
-    return best_first_graph_search(problem, lambda n: n.path_cost + h(n))
+    f_batch = None
+    if h_batch is not None:
+        def f_batch(nodes):
+            values = np.asarray(h_batch([n.state for n in nodes])).tolist()
+            return [n.path_cost + value for n, value in zip(nodes, values)]
+    return best_first_graph_search(problem, lambda n: n.path_cost + h(n), f_batch)
 
 
 def recursive_best_first_search(problem, h=None):
@@ -448,67 +479,57 @@ def recursive_best_first_search(problem, h=None):
     return result
 
 
+MOVES = (
+    ("Right", (1, 0)),
+    ("Left", (-1, 0)),
+    ("Up", (0, 1)),
+    ("Down", (0, -1)),
+)
+
+
+def obstacle_trajectory(obstacle, height):
+    """Positions of an obstacle bouncing up and down its column, one for
+    every time step of a full period.
+    :param obstacle: (x, y, d) where d=1 is up and d=-1 is down
+    :param height: number of rows on the board
+    :return: list of (x, y) positions, index t is the position at time t
+    :rtype: list
+    """
+    x, y, d = obstacle
+    if height < 2:
+        return [(x, y)]
+    positions = []
+    for _ in range(2 * (height - 1)):
+        positions.append((x, y))
+        if (d == 1 and y == height - 1) or (d == -1 and y == 0):
+            d = -d
+        y += d
+    return positions
+
+
 class Explorer(Problem):
     def __init__(self, initial, goal):
-        super().__init__(initial, goal)
+        # initial = (x, y, obstacle1, obstacle2, ...); the obstacles move
+        # periodically, so states are (x, y, t mod period) and the obstacle
+        # positions for every phase are computed once here
         self.grid_size = [8, 6]
+        self.obstacles = initial[2:]
+        trajectories = [obstacle_trajectory(obstacle, self.grid_size[1]) for obstacle in self.obstacles]
+        self.period = len(trajectories[0]) if trajectories else 1
+        self.blocked = [frozenset(trajectory[t] for trajectory in trajectories) for t in range(self.period)]
+        super().__init__((initial[0], initial[1], 0), goal)
 
     def successor(self, state):
-        # d=-1 down, d=1 up
-        # (x,y,(o1x,o1y,d),(o2x,o2y,d))
+        # (x, y, t)
         successors = dict()
-        man_x = state[0]
-        man_y = state[1]
-        obstacle1 = list(state[2])
-        obstacle2 = list(state[3])
-
-        if obstacle1[2] == 1:  # up
-            if obstacle1[1] == self.grid_size[1] - 1:
-                obstacle1[2] = -1
-                obstacle1[1] -= 1
-            else:
-                obstacle1[1] += 1
-        else:
-            if obstacle1[1] == 0:
-                obstacle2[2] = 1
-                obstacle1[1] += 1
-            else:
-                obstacle1[1] -= 1
+        man_x, man_y, t = state
+        t = (t + 1) % self.period
+        obstacles = self.blocked[t]
 
-        if obstacle2[2] == 1:  # up
-            if obstacle2[1] == self.grid_size[1] - 1:
-                obstacle2[2] = -1
-                obstacle2[1] -= 1
-            else:
-                obstacle2[1] += 1
-        else:
-            if obstacle2[1] == 0:
-                obstacle2[2] = 1
-                obstacle2[1] += 1
-            else:
-                obstacle2[1] -= 1
-
-        obstacles = [(obstacle1[0], obstacle1[1]), (obstacle2[0], obstacle2[1])]
-
-        # right x = x+1
-        if man_x + 1 < self.grid_size[0] and (man_x + 1, man_y) not in obstacles:
-            successors["Right"] = (man_x + 1, man_y, (obstacle1[0], obstacle1[1], obstacle1[2]),
-                                   (obstacle2[0], obstacle2[1], obstacle2[2]))
-
-        # left x = x-1
-        if man_x - 1 > 0 and (man_x + 1, man_y) not in obstacles:
-            successors["Left"] = (man_x - 1, man_y, (obstacle1[0], obstacle1[1], obstacle1[2]),
-                                  (obstacle2[0], obstacle2[1], obstacle2[2]))
-
-        # up x = y+1
-        if man_y + 1 < self.grid_size[1] and (man_x,man_y+1) not in obstacles:
-            successors["Up"] = (man_x, man_y+1  , (obstacle1[0], obstacle1[1], obstacle1[2]),
-                                   (obstacle2[0], obstacle2[1],obstacle2[2]))
-
-        # down x = y-1
-        if man_y - 1 > 0 and (man_x,man_y-1) not in obstacles:
-            successors["Down"] = (man_x, man_y - 1, (obstacle1[0], obstacle1[1], obstacle1[2]),
-                                   (obstacle2[0], obstacle2[1],obstacle2[2]))
+        for action, (dx, dy) in MOVES:
+            x, y = man_x + dx, man_y + dy
+            if 0 <= x < self.grid_size[0] and 0 <= y < self.grid_size[1] and (x, y) not in obstacles:
+                successors[action] = (x, y, t)
 
         return successors
 
@@ -528,6 +549,10 @@ class Explorer(Problem):
         y_house = self.goal[1]
         return abs(x_explorer - x_house) + abs(y_explorer - y_house)
 
+    def h_batch(self, states):
+        positions = np.array(states)[:, :2]
+        return np.abs(positions - self.goal[:2]).sum(axis=1)
+
 
 if __name__ == '__main__':
     man_x = int(input())
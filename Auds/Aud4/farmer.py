@@ -448,6 +448,91 @@ def recursive_best_first_search(problem, h=None):
     return result
 
 
+"""
+Неинформирано пребарување во рамки на граф
+Основната разлика е во тоа што овде не дозволуваме јамки,
+т.е. повторување на состојби
+"""
+
+
+def graph_search(problem, fringe):
+    """Пребарувај низ следбениците на даден проблем за да најдеш цел.
+     Ако до дадена состојба стигнат два пата, употреби го најдобриот пат.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param fringe:  празна редица (queue)
+    :type fringe: FIFOQueue or Stack or PriorityQueue
+    :return: Node or None
+    :rtype: Node
+    """
+    closed = set()
+    fringe.append(Node(problem.initial))
+    while fringe:
+        node = fringe.pop()
+        if problem.goal_test(node.state):
+            return node
+        if node.state not in closed:
+            closed.add(node.state)
+            fringe.extend(node.expand(problem))
+    return None
+
+
+def breadth_first_graph_search(problem):
+    """Експандирај го прво најплиткиот јазол во пребарувачкиот граф.
+    :param problem: даден проблем
+    :type problem: Problem
+    :return: Node or None
+    :rtype: Node
+    """
+    return graph_search(problem, FIFOQueue())
+
+
+def bidirectional_breadth_first_search(problem):
+    """Пребарување прво во широчина истовремено од почетната и од целната
+    состојба, секогаш по едно цело ниво од помалата граница. Проблемот
+    треба да има една целна состојба problem.goal и метод
+    problem.predecessor(state) кој враќа речник {акција : претходна состојба}.
+    :param problem: даден проблем
+    :type problem: Problem
+    :return: Node or None
+    :rtype: Node
+    """
+    start, goal = Node(problem.initial), Node(problem.goal)
+    if problem.goal_test(start.state):
+        return start
+    # јазлите од назад чуваат состојба од која со акцијата се стигнува до родителот
+    forward, backward = {start.state: start}, {goal.state: goal}
+    forward_layer, backward_layer = [start], [goal]
+    while forward_layer and backward_layer:
+        expand_forward = len(forward_layer) <= len(backward_layer)
+        if expand_forward:
+            layer, seen, other, moves = forward_layer, forward, backward, problem.successor
+        else:
+            layer, seen, other, moves = backward_layer, backward, forward, problem.predecessor
+        next_layer, meeting, best = [], None, infinity
+        for node in layer:
+            for action, state in moves(node.state).items():
+                if state in seen:
+                    continue
+                child = Node(state, node, action, node.path_cost + 1)
+                seen[state] = child
+                next_layer.append(child)
+                if state in other and child.path_cost + other[state].path_cost < best:
+                    meeting, best = state, child.path_cost + other[state].path_cost
+        if meeting is not None:
+            node, back = forward[meeting], backward[meeting]
+            while back.parent:
+                node = Node(back.parent.state, node, back.action,
+                            problem.path_cost(node.path_cost, node.state, back.action, back.parent.state))
+                back = back.parent
+            return node
+        if expand_forward:
+            forward_layer = next_layer
+        else:
+            backward_layer = next_layer
+    return None
+
+
 def valid(state):
     farmer, volk, jare, zelka = state
 
@@ -505,16 +590,109 @@ class Farmer(Problem):
         state = node.state
         goal = self.goal
         value = 0
-        for x, y in zip(state, goal):
+        #Farmerot se vozi so sekoj tovar, pa ne se broi
+        for x, y in zip(state[1:], goal[1:]):
             if x != y:
                 value += 1
 
         return value
 
+
+class RiverCrossing(Problem):
+    def __init__(self, items, rules=(), capacity=2, drivers=None, bank_safe=None):
+        """Generalized river crossing. A state is an integer: bit i is set
+        when items[i] is on the far bank, and bit len(items) is set when the
+        boat is on the far bank. Everything starts on the near bank.
+        :param items: names of the items (people, animals, ...)
+        :param rules: pairs (group, guards) of item names; a bank is unsafe
+                      if it has the whole group and none of the guards
+        :param capacity: how many items fit in the boat
+        :param drivers: names of the items that can row, all of them if None
+        :param bank_safe: optional extra function mask -> bool for one bank
+        """
+        self.items = tuple(items)
+        n = len(self.items)
+        self.full = (1 << n) - 1
+        self.boat = 1 << n
+        super().__init__(0, self.full | self.boat)
+        self.capacity = capacity
+
+        bit = {name: 1 << i for i, name in enumerate(self.items)}
+        self.rules = [(sum(bit[name] for name in group), sum(bit[name] for name in guards))
+                      for group, guards in rules]
+        driver_mask = self.full if drivers is None else sum(bit[name] for name in drivers)
+
+        # safe[mask]: both banks are safe when the far bank holds mask
+        bank_ok = bytearray(1 << n)
+        for mask in range(1 << n):
+            bank_ok[mask] = all(mask & group != group or mask & guards for group, guards in self.rules) \
+                and (bank_safe is None or bank_safe(mask))
+        self.safe = bytearray(bank_ok[mask] and bank_ok[self.full ^ mask] for mask in range(1 << n))
+
+        # every boat load: 1 to capacity items with at least one driver
+        self.loads = []
+        for load in range(1, 1 << n):
+            if load & driver_mask and bin(load).count("1") <= capacity:
+                names = [name for name in self.items if load & bit[name]]
+                self.loads.append((load, "Prevezi " + ", ".join(names)))
+
+    def successor(self, state):
+        successors = dict()
+        mask = state & self.full
+        if state & self.boat:
+            for load, action in self.loads:
+                if mask & load == load and self.safe[mask ^ load]:
+                    successors[action] = mask ^ load
+        else:
+            for load, action in self.loads:
+                if mask & load == 0 and self.safe[mask | load]:
+                    successors[action] = (mask | load) | self.boat
+        return successors
+
+    def predecessor(self, state):
+        # every crossing can be undone by taking the same load back
+        return self.successor(state)
+
+    def actions(self, state):
+        return self.successor(state).keys()
+
+    def result(self, state, action):
+        return self.successor(state)[action]
+
+    def goal_test(self, state):
+        return state == self.goal
+
+    def h(self, node):
+        # every crossing to the far bank takes at most capacity items and
+        # every crossing after the first needs a return trip before it
+        left = bin(self.full & ~node.state).count("1")
+        if left == 0:
+            return 0
+        trips = -(-left // self.capacity)
+        return 2 * trips - (0 if node.state & self.boat else 1)
+
+
 if __name__ == '__main__':
     initial_state = ('e', 'e', 'e', 'e')
     goal_state = ('w', 'w', 'w', 'w')
 
     farmer = Farmer(initial_state, goal_state)
     answer = astar_search(farmer)
-    print(answer.solution())
\ No newline at end of file
+    print(answer.solution())
+
+    farmer = RiverCrossing(["farmer", "volk", "jare", "zelka"],
+                           rules=[(("volk", "jare"), ("farmer",)), (("jare", "zelka"), ("farmer",))],
+                           capacity=2, drivers=["farmer"])
+    print(breadth_first_graph_search(farmer).solution())
+    print(astar_search(farmer).solution())
+    print(bidirectional_breadth_first_search(farmer).solution())
+
+    missionaries, cannibals = ["m1", "m2", "m3"], ["c1", "c2", "c3"]
+
+    def no_one_eaten(bank):
+        m = sum(1 for i in range(3) if bank >> i & 1)
+        c = sum(1 for i in range(3, 6) if bank >> i & 1)
+        return m == 0 or m >= c
+
+    crossing = RiverCrossing(missionaries + cannibals, capacity=2, bank_safe=no_one_eaten)
+    print(bidirectional_breadth_first_search(crossing).solution())
@@ -488,7 +488,7 @@ class Puzzle(Problem):
             tmp = list(state)
             tmp[ind], tmp[ind + 1] = tmp[ind + 1], tmp[ind]
             new_state = ''.join(tmp)
-            succ["Left"] = new_state
+            succ["Right"] = new_state
 
         return succ
 
@@ -501,6 +501,13 @@ class Puzzle(Problem):
     def goal_test(self, state):
         return super().goal_test(state)
 
+    def pack_state(self, state):
+        # the tiles are 1-8 and the blank becomes 0, one hex digit per cell
+        return int(state.replace('*', '0'), 16)
+
+    def unpack_state(self, code):
+        return format(code, '09x').replace('0', '*')
+
     def h(self, node):
         counter = 0
         '''
@@ -508,7 +515,8 @@ class Puzzle(Problem):
         zip(a,b) = [(1,a),(2,b)...)]
         '''
         for x, y in zip(node.state, self.goal):
-            if x != y:
+            # празното поле не е плочка, со него h не би била допуштлива
+            if x != y and x != '*':
                 counter += 1
 
         return counter
@@ -524,7 +532,7 @@ class Puzzle_h2(Puzzle):
         x1 ,y1 = Puzzle_h2.coordinates[n]
         x2, y2 = Puzzle_h2.coordinates[m]
 
-        return abs(x1-x2) + (y1-y2)
+        return abs(x1-x2) + abs(y1-y2)
 
     def h(self, node):
         sum_value = 0
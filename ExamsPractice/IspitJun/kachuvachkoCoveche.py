@@ -1,5 +1,10 @@
 import bisect
 import math
+try:
+    import numpy as np
+except ImportError:
+    # numpy се користи само за h_batch, без него h се пресметува за секој јазол
+    np = None
 
 """
 Дефинирање на класа за структурата на проблемот кој ќе го решаваме со пребарување.
@@ -350,7 +355,7 @@ def memoize(fn, slot=None):
     return memoized_fn
 
 
-def best_first_graph_search(problem, f):
+def best_first_graph_search(problem, f, f_batch=None):
     """Пребарувај низ следбениците на даден проблем за да најдеш цел. Користи
      функција за евалуација за да се одлучи кој е сосед најмногу ветува и
      потоа да се истражи. Ако до дадена состојба стигнат два пата, употреби
@@ -359,6 +364,9 @@ def best_first_graph_search(problem, f):
     :type problem: Problem
     :param f: дадена функција за евалуација (проценка)
     :type f: function
+    :param f_batch: опционална функција која ги проценува сите деца од едно
+                    проширување со еден повик и враќа листа од f вредности
+    :type f_batch: function
     :return: Node or None
     :rtype: Node
     """
@@ -374,7 +382,13 @@ def best_first_graph_search(problem, f):
         if problem.goal_test(node.state):
             return node
         explored.add(node.state)
-        for child in node.expand(problem):
+        children = node.expand(problem)
+        if f_batch is not None:
+            fresh = [child for child in children if child.state not in explored]
+            # вредностите се запишуваат во слотот 'f', па memoize повеќе не ја повикува f
+            for child, value in zip(fresh, f_batch(fresh) if fresh else ()):
+                child.f = value
+        for child in children:
             if child.state not in explored and child not in frontier:
                 frontier.append(child)
             elif child in frontier:
@@ -387,26 +401,43 @@ def best_first_graph_search(problem, f):
 
 def greedy_best_first_graph_search(problem, h=None):
     """ Greedy best-first пребарување се остварува ако се специфицира дека f(n) = h(n).
+    Ако h не е зададена, numpy е инсталиран и проблемот има метод
+    h_batch(states), децата од секое проширување се проценуваат заедно со
+    еден NumPy повик.
     :param problem: даден проблем
     :type problem: Problem
     :param h: дадена функција за хевристика
     :type h: function
     :return: Node or None
     """
+    h_batch = None if h or np is None else getattr(problem, 'h_batch', None)
     h = memoize(h or problem.h, 'h')
-    return best_first_graph_search(problem, h)
+    f_batch = None
+    if h_batch is not None:
+        def f_batch(nodes):
+            return np.asarray(h_batch([n.state for n in nodes])).tolist()
+    return best_first_graph_search(problem, h, f_batch)
 
 
 def astar_search(problem, h=None):
     """ A* пребарување е best-first graph пребарување каде f(n) = g(n) + h(n).
+    Ако h не е зададена, numpy е инсталиран и проблемот има метод
+    h_batch(states), децата од секое проширување се проценуваат заедно со
+    еден NumPy повик.
     :param problem: даден проблем
     :type problem: Problem
     :param h: дадена функција за хевристика
     :type h: function
     :return: Node or None
     """
+    h_batch = None if h or np is None else getattr(problem, 'h_batch', None)
     h = memoize(h or problem.h, 'h')
-    return best_first_graph_search(problem, lambda n: n.path_cost + h(n))
+    f_batch = None
+    if h_batch is not None:
+        def f_batch(nodes):
+            values = np.asarray(h_batch([n.state for n in nodes])).tolist()
+            return [n.path_cost + value for n, value in zip(nodes, values)]
+    return best_first_graph_search(problem, lambda n: n.path_cost + h(n), f_batch)
 
 
 def recursive_best_first_search(problem, h=None):
@@ -467,71 +498,100 @@ Result:
 """
 
 
+MOVES = (
+    ("stoi vo mesto", (0, 0)),
+    ("pravo za 1", (0, 1)),
+    ("pravo za 2", (0, 2)),
+    ("gore-desno za 1", (1, 1)),
+    ("gore-desno za 2", (2, 2)),
+    ("gore-levo za 1", (-1, 1)),
+    ("gore-levo za 2", (-2, 2)),
+)
+
+
+def house_trajectory(house_state, width):
+    """Positions of the house moving left and right along its row, one for
+    every time step of a full period.
+    :param house_state: (x, y, direction) where direction is "levo" or "desno"
+    :param width: number of columns on the board
+    :return: list of (x, y) positions, index t is the position at time t
+    :rtype: list
+    """
+    x, y, direction = house_state
+    if width < 2:
+        return [(x, y)]
+    step = -1 if direction == "levo" else 1
+    positions = []
+    for _ in range(2 * (width - 1)):
+        positions.append((x, y))
+        if (step == -1 and x == 0) or (step == 1 and x == width - 1):
+            step = -step
+        x += step
+    return positions
+
+
 class Rock(Problem):
-    def __init__(self, allowed_pos, initial, goal=None):
-        super().__init__(initial, goal)
+    def __init__(self, allowed_pos, initial, goal=None, grid_size=(5, 9)):
+        # initial = (man_pos, (house_x, house_y, direction)); the house moves
+        # periodically, so states are (man_x, man_y, t mod period)
         self.allowed_pos = allowed_pos
-        self.grid_size = [5, 9]
+        self.grid_size = list(grid_size)
+        width, height = self.grid_size
+        self.house = house_trajectory(initial[1], width)
+        self.period = len(self.house)
+        self.top = self.house[0][1]
+
+        self.allowed = 0
+        for x, y in allowed_pos:
+            if 0 <= x < width and 0 <= y < height:
+                self.allowed |= 1 << (y * width + x)
+
+        self.climb = self.climb_distances()
+        self.climb_table = None if np is None else np.array(self.climb)
+        super().__init__((initial[0][0], initial[0][1], 0), goal)
+
+    def climb_distances(self):
+        """Fewest moves from every cell to the row of the house, using only
+        the allowed cells on the way. The man never moves down, so the rows
+        are filled from the top.
+        :return: list of distances indexed by cell, infinity if unreachable
+        :rtype: list
+        """
+        width, height = self.grid_size
+        distances = [infinity] * (width * height)
+        for x in range(width):
+            distances[self.top * width + x] = 0
+        for y in range(self.top - 1, -1, -1):
+            for x in range(width):
+                if not self.allowed >> (y * width + x) & 1:
+                    continue
+                best = infinity
+                for _, (dx, dy) in MOVES:
+                    nx, ny = x + dx, y + dy
+                    if dy == 0 or not (0 <= nx < width and ny <= self.top):
+                        continue
+                    best = min(best, distances[ny * width + nx])
+                if best != infinity:
+                    distances[y * width + x] = best + 1
+        return distances
 
     def check_valid(self, state):
-        man_x, man_y = state[0]
-        house_x, house_y, house_dir = state[1]
-
-        if (man_x, man_y) not in self.allowed_pos:
-            return False
-
-        if man_x < 0 or man_x > 4 or man_y < 0 or man_y > 8 or house_x < 0 or house_y > 4:
+        man_x, man_y, t = state
+        width, height = self.grid_size
+        if not (0 <= man_x < width and 0 <= man_y < height):
             return False
-
-        return True
-
-    def house_mover(self, house_state):
-        x, y, pos = house_state
-        if pos == "levo":
-            x -= 1
-            if x == 0:
-                pos = "desno"
-
-        if pos == "desno":
-            x += 1
-            if x == 4:
-                pos = "levo"
-
-        new_pos = (x, y, pos)
-
-        return new_pos
+        return bool(self.allowed >> (man_y * width + man_x) & 1) or (man_x, man_y) == self.house[t]
 
     def successor(self, state):
-        # ((1,0), (1,8,desno))
-        # problem = Rock(allowed, (man_pos, (house_pos[0], house_pos[1], direction)))
+        # (man_x, man_y, t)
         successors = dict()
-        man_x, man_y = state[0]
-        house_x, house_y, house_pos = state[1]
-        house_state = state[1]
-
-        # Man stand still
-        new_state = (state[0], state[1])
-        if self.check_valid(new_state):
-            new_house_pos = self.house_mover(house_state)
-            successors["stoi vo mesto"] = (new_state, new_house_pos)
-
-        # Move Up 1 and 2 steps
-        for i in range(0, 2):
-            new_state = ((man_x, man_y + i), self.house_mover(house_state))
-            if self.check_valid(new_state):
-                successors[f'pravo za {i}'] = ((man_x, man_y + i), self.house_mover(house_state))
-
-            # Move Up  Right 1 and 2 steps
-        for i in range(0, 2):
-            new_state = ((man_x + i, man_y + i), self.house_mover(house_state))
-            if self.check_valid(new_state):
-                successors[f'gore-desno za {i}'] = ((man_x + i, man_y + i), self.house_mover(house_state))
+        man_x, man_y, t = state
+        t = (t + 1) % self.period
 
-            # Move Up  Levo 1 and 2 steps
-        for i in range(0, 2):
-            new_state = ((man_x - i, man_y + i), self.house_mover(house_state))
+        for action, (dx, dy) in MOVES:
+            new_state = (man_x + dx, man_y + dy, t)
             if self.check_valid(new_state):
-                successors[f'gore-levo za {i}'] = ((man_x - i, man_y + i), self.house_mover(house_state))
+                successors[action] = new_state
 
         return successors
 
@@ -542,14 +602,16 @@ class Rock(Problem):
         return self.successor(state)[action]
 
     def goal_test(self, state):
-        man_x, man_y = state[0]
-        house_x, house_y, dir = state[1]
-        return man_x == house_x and man_y == house_y
+        man_x, man_y, t = state
+        return (man_x, man_y) == self.house[t]
 
     def h(self, node):
-        man_x, man_y = node.state[0]
-        house_x, house_y, dir = node.state[1]
-        return (abs(house_x - man_x) + abs(house_y - man_y))/2
+        man_x, man_y, t = node.state
+        return self.climb[man_y * self.grid_size[0] + man_x]
+
+    def h_batch(self, states):
+        states = np.array(states)
+        return self.climb_table[states[:, 1] * self.grid_size[0] + states[:, 0]]
 
 
 if __name__ == '__main__':
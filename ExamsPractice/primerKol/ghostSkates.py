@@ -1,4 +1,9 @@
 import bisect
+try:
+    import numpy as np
+except ImportError:
+    # numpy се користи само за h_batch, без него h се пресметува за секој јазол
+    np = None
 
 """
 Дефинирање на класа за структурата на проблемот кој ќе го решаваме со пребарување.
@@ -367,7 +372,7 @@ def memoize(fn, slot=None):
     return memoized_fn
 
 
-def best_first_graph_search(problem, f):
+def best_first_graph_search(problem, f, f_batch=None):
     """Пребарувај низ следбениците на даден проблем за да најдеш цел. Користи
      функција за евалуација за да се одлучи кој е сосед најмногу ветува и
      потоа да се истражи. Ако до дадена состојба стигнат два пата, употреби
@@ -377,6 +382,9 @@ def best_first_graph_search(problem, f):
     :type problem: Problem
     :param f: дадена функција за евалуација (проценка)
     :type f: function
+    :param f_batch: опционална функција која ги проценува сите деца од едно
+                    проширување со еден повик и враќа листа од f вредности
+    :type f_batch: function
     :return: Node or None
     :rtype: Node
     """
@@ -386,47 +394,79 @@ def best_first_graph_search(problem, f):
         return node
     frontier = PriorityQueue(min, f)
     frontier.append(node)
+    # јазлите во frontier според нивната состојба
+    in_frontier = {node.state: node}
     explored = set()
     while frontier:
         node = frontier.pop()
+        if in_frontier.get(node.state) is not node:
+            # јазелот бил заменет со подобар пат до истата состојба
+            continue
         if problem.goal_test(node.state):
             return node
+        del in_frontier[node.state]
         explored.add(node.state)
-        for child in node.expand(problem):
-            if child.state not in explored and child not in frontier:
+        children = node.expand(problem)
+        if f_batch is not None:
+            fresh = [child for child in children if child.state not in explored]
+            # вредностите се запишуваат во слотот 'f', па memoize повеќе не ја повикува f
+            for child, value in zip(fresh, f_batch(fresh) if fresh else ()):
+                child.f = value
+        for child in children:
+            if child.state not in explored and child.state not in in_frontier:
                 frontier.append(child)
-            elif child in frontier:
-                incumbent = frontier[child]
+                in_frontier[child.state] = child
+            elif child.state in in_frontier:
+                incumbent = in_frontier[child.state]
                 if f(child) < f(incumbent):
-                    del frontier[incumbent]
                     frontier.append(child)
+                    in_frontier[child.state] = child
     return None
 
 
 def greedy_best_first_graph_search(problem, h=None):
     """ Greedy best-first пребарување се остварува ако се специфицира дека f(n) = h(n).
 
+    Ако h не е зададена, numpy е инсталиран и проблемот има метод
+    h_batch(states), децата од секое проширување се проценуваат заедно со
+    еден NumPy повик.
+
     :param problem: даден проблем
     :type problem: Problem
     :param h: дадена функција за хевристика
     :type h: function
     :return: Node or None
     """
+    h_batch = None if h or np is None else getattr(problem, 'h_batch', None)
     h = memoize(h or problem.h, 'h')
-    return best_first_graph_search(problem, h)
+    f_batch = None
+    if h_batch is not None:
+        def f_batch(nodes):
+            return np.asarray(h_batch([n.state for n in nodes])).tolist()
+    return best_first_graph_search(problem, h, f_batch)
 
 
 def astar_search(problem, h=None):
     """ A* пребарување е best-first graph пребарување каде f(n) = g(n) + h(n).
 
+    Ако h не е зададена, numpy е инсталиран и проблемот има метод
+    h_batch(states), децата од секое проширување се проценуваат заедно со
+    еден NumPy повик.
+
     :param problem: даден проблем
     :type problem: Problem
     :param h: дадена функција за хевристика
     :type h: function
     :return: Node or None
     """
+    h_batch = None if h or np is None else getattr(problem, 'h_batch', None)
     h = memoize(h or problem.h, 'h')
-    return best_first_graph_search(problem, lambda n: n.path_cost + h(n))
+    f_batch = None
+    if h_batch is not None:
+        def f_batch(nodes):
+            values = np.asarray(h_batch([n.state for n in nodes])).tolist()
+            return [n.path_cost + value for n, value in zip(nodes, values)]
+    return best_first_graph_search(problem, lambda n: n.path_cost + h(n), f_batch)
 
 
 def recursive_best_first_search(problem, h=None):
@@ -470,51 +510,102 @@ def recursive_best_first_search(problem, h=None):
     return result
 
 
+ACTIONS = ("Gore 1", "Gore 2", "Gore 3", "Desno 1", "Desno 2", "Desno 3")
+
+# MASK_ACTIONS[mask] -> codes of the actions whose bit is set in mask
+MASK_ACTIONS = tuple(tuple(code for code in range(len(ACTIONS)) if mask >> code & 1)
+                     for mask in range(1 << len(ACTIONS)))
+
+
 class GhostOnSkates(Problem):
-    def __init__(self, initial, walls, n, goal=None):
-        super().__init__(initial, goal)
+    def __init__(self, initial, walls, n, goal=None, prune=False):
+        # Cells are packed as y * n + x and actions are integer codes into
+        # ACTIONS; the names are only needed when the solution is printed
         self.walls = walls
         self.n = n
+        self.wall_map = bytearray(n * n)
+        for x, y in walls:
+            if 0 <= x < n and 0 <= y < n:
+                self.wall_map[y * n + x] = 1
+        self.offsets = (n, 2 * n, 3 * n, 1, 2, 3)
+        self.jumps = self.jump_table()
+        super().__init__(initial[1] * n + initial[0], None if goal is None else goal[1] * n + goal[0])
+        if prune and self.goal is not None:
+            self.prune_dead_ends()
+        if self.goal is not None:
+            # h for every cell at once, so that h_batch is a single lookup per state
+            gy, gx = divmod(self.goal, n)
+            self.h_table = [-(-abs(gx - x) // 3) - (-abs(gy - y) // 3) for y in range(n) for x in range(n)]
+        else:
+            # without a goal there is nothing to estimate
+            self.h_table = [0] * (n * n)
+
+    def jump_table(self):
+        """For every cell, a bitmask of the jumps in ACTIONS that land inside
+        the board on a cell without a hole.
+        :return: bytearray of masks indexed by cell
+        :rtype: bytearray
+        """
+        n, wall_map = self.n, self.wall_map
+        table = bytearray(n * n)
+        for y in range(n):
+            for x in range(n):
+                mask = 0
+                for i in range(3):
+                    if y + i + 1 < n and not wall_map[(y + i + 1) * n + x]:
+                        mask |= 1 << i
+                    if x + i + 1 < n and not wall_map[y * n + x + i + 1]:
+                        mask |= 1 << (i + 3)
+                table[y * n + x] = mask
+        return table
+
+    def prune_dead_ends(self):
+        """Drop the jumps that lead to cells from which the goal can no longer
+        be reached. The ghost only moves up and right, so the cells are
+        visited from the goal backwards in decreasing index order.
+        """
+        reaches_goal = bytearray(self.n * self.n)
+        reaches_goal[self.goal] = 1
+        for cell in range(self.n * self.n - 1, -1, -1):
+            if self.wall_map[cell]:
+                continue
+            mask = 0
+            for code in MASK_ACTIONS[self.jumps[cell]]:
+                if reaches_goal[cell + self.offsets[code]]:
+                    mask |= 1 << code
+            self.jumps[cell] = mask
+            if mask:
+                reaches_goal[cell] = 1
 
     def actions(self, state):
-        return self.successor(state).keys()
+        return MASK_ACTIONS[self.jumps[state]]
 
     def result(self, state, action):
-        return self.successor(state)[action]
+        return state + self.offsets[action]
 
     def goal_test(self, state):
         return state == self.goal
 
-    @staticmethod
-    def check_valid(state, walls, n):
-        if state[0] > 0 and state[0] < n and state[1] > 0 and state[1] < n and state not in walls:
-            return True
-        else:
-            return False
-
     def successor(self, state):
-        successors = dict()
-        ghost_state = state[0]
-        ghost_x = ghost_state[0]
-        ghost_y = ghost_state[1]
+        offsets = self.offsets
+        return {code: state + offsets[code] for code in MASK_ACTIONS[self.jumps[state]]}
 
-        for x in range (0,3):
-            #move up
-            if self.check_valid((ghost_x, ghost_y + x), self.walls, self.n):
-                successors[f"Gore {x}"] = ((ghost_x, ghost_y + x), self.walls, self.n)
+    def solution(self, node):
+        return [ACTIONS[code] for code in node.solution()]
 
-            # move right
-            if self.check_valid((ghost_x  + x, ghost_y), self.walls, self.n):
-                successors[f"Desno {x}"] = ((ghost_x  + x, ghost_y), self.walls, self.n)
-
-        return successors
+    def h(self, node):
+        if self.goal is None:
+            return 0
+        py, px = divmod(node.state, self.n)
+        gy, gx = divmod(self.goal, self.n)
 
+        # every jump moves at most 3 cells along one axis
+        return -(-abs(gx - px) // 3) - (-abs(gy - py) // 3)
 
-    def h(self, node):
-        px, py = node.state
-        gx, gy = self.goal
+    def h_batch(self, states):
+        h_table = self.h_table
+        return [h_table[state] for state in states]
 
-        return (abs(px -gx) + abs(gy - py))/3
 
 if __name__ == '__main__':
     n = int(input())
@@ -527,5 +618,5 @@ if __name__ == '__main__':
         holes.append(tuple(map(int, input().split(','))))
 
     problem = GhostOnSkates(ghost_pos, holes, n, goal_pos)
-    print(astar_search(problem).solution())
+    print(problem.solution(astar_search(problem)))
 
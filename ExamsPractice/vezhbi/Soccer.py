@@ -467,81 +467,89 @@ check_valid. Треба да имплементирате информирано
 """
 
 
+MOVES = (
+    ("gore", (0, 1)),
+    ("dolu", (0, -1)),
+    ("desno", (1, 0)),
+    ("gore-desno", (1, 1)),
+    ("dolu-desno", (1, -1)),
+)
+
+
 class Football(Problem):
 
-    def __init__(self, opponents_pos, initial, goal):
+    def __init__(self, opponents_pos, initial, goal, grid_size=(8, 6)):
         super().__init__(initial, goal)
         self.opponents_pos = opponents_pos
-
-    @staticmethod
-    def check_valid(state, opponents):
-        man_pos = state[0]
-        ball_pos = state[1]
-        op_defended_pos = []
-
-        for oppnent in opponents:
-            op_defended_pos.append((oppnent[0] - 1, oppnent[1] + 1))
-            op_defended_pos.append((oppnent[0], oppnent[1] + 1))
-            op_defended_pos.append((oppnent[0] + 1, oppnent[1] + 1))
-            op_defended_pos.append((oppnent[0] - 1, oppnent[1]))
-            op_defended_pos.append((oppnent[0] + 1, oppnent[1]))
-            op_defended_pos.append((oppnent[0] - 1, oppnent[1] - 1))
-            op_defended_pos.append((oppnent[0], oppnent[1] - 1))
-            op_defended_pos.append((oppnent[0] + 1, oppnent[1] - 1))
-
-        op_defended_pos = tuple(op_defended_pos)
-
-        return man_pos[0] >= 0 and man_pos[0] < 8 and \
-               man_pos[1] >= 0 and man_pos[1] < 6 and \
-               ball_pos[0] >= 0 and ball_pos[0] < 8 and \
-               ball_pos[1] >= 0 and ball_pos[1] < 6 and (ball_pos[0], ball_pos[1]) not in op_defended_pos and \
-               man_pos[0] != ball_pos[0] and man_pos[1] != ball_pos[1] and \
-               (man_pos[0], man_pos[1]) not in opponents
+        self.width, self.height = grid_size
+
+        # Static maps over the cells, built once: the man may not stand on an
+        # opponent and the ball may not be on or next to one
+        self.forbidden_man = bytearray(self.width * self.height)
+        self.forbidden_ball = bytearray(self.width * self.height)
+        for opponent_x, opponent_y in opponents_pos:
+            if self.inside(opponent_x, opponent_y):
+                self.forbidden_man[self.index(opponent_x, opponent_y)] = 1
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    if self.inside(opponent_x + dx, opponent_y + dy):
+                        self.forbidden_ball[self.index(opponent_x + dx, opponent_y + dy)] = 1
+
+        self.ball_distance = self.goal_distances()
+
+    def index(self, x, y):
+        return y * self.width + x
+
+    def inside(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def goal_distances(self):
+        """Number of pushes the ball needs from every cell to reach a goal
+        cell, ignoring where the man has to stand. Computed with breadth-first
+        search backwards from the goal cells.
+        :return: list of distances indexed by cell, infinity if unreachable
+        :rtype: list
+        """
+        distances = [infinity] * (self.width * self.height)
+        queue = []
+        for x, y in self.goal:
+            if self.inside(x, y) and not self.forbidden_ball[self.index(x, y)]:
+                distances[self.index(x, y)] = 0
+                queue.append((x, y))
+        for x, y in queue:
+            step = distances[self.index(x, y)] + 1
+            for _, (dx, dy) in MOVES:
+                prev_x, prev_y = x - dx, y - dy
+                if not self.inside(prev_x, prev_y):
+                    continue
+                i = self.index(prev_x, prev_y)
+                if self.forbidden_ball[i] or distances[i] != infinity:
+                    continue
+                distances[i] = step
+                queue.append((prev_x, prev_y))
+        return distances
+
+    def check_valid(self, state):
+        man_pos, ball_pos = state
+        return self.inside(*man_pos) and not self.forbidden_man[self.index(*man_pos)] and \
+            self.inside(*ball_pos) and not self.forbidden_ball[self.index(*ball_pos)] and \
+            man_pos != ball_pos
 
     def successor(self, state):
-        man_pos = state[0]
-        ball_pos = state[1]
-        opponents = self.opponents_pos
         successors = dict()
-        man_pos_x = man_pos[0]
-        man_pos_y = man_pos[1]
-
-        ball_pos_x = ball_pos[0]
-        ball_pos_y = ball_pos[1]
-
-        #Choveche Movement
-        #Gore
-        if self.check_valid(((man_pos_x, man_pos_y + 1), (ball_pos[0], ball_pos[1])), opponents):
-            successors["Pomesti choveche gore"] = (opponents, ((man_pos[0], man_pos[1] + 1), (ball_pos[0], ball_pos[1])))
-        #Dolu
-        if self.check_valid(((man_pos[0], man_pos[1] - 1), (ball_pos[0], ball_pos[1])), opponents):
-            successors["Pomesti choveche dolu"] = (opponents, ((man_pos[0], man_pos[1] - 1), (ball_pos[0], ball_pos[1])))
-        #Desno
-        if self.check_valid(((man_pos[0] + 1, man_pos[1]), (ball_pos[0], ball_pos[1])), opponents):
-            successors["Pomesti choveche desno"] = (opponents, ((man_pos[0] + 1, man_pos[1]), (ball_pos[0], ball_pos[1])))
-        #Gore-Desno
-        if self.check_valid(((man_pos[0] + 1, man_pos[1] + 1), (ball_pos[0], ball_pos[1])), opponents):
-            successors["Pomesti choveche gore-desno"] = (opponents, ((man_pos[0] + 1, man_pos[1] + 1), (ball_pos[0], ball_pos[1])))
-        #Dolu-Desno
-        if self.check_valid(((man_pos[0] + 1, man_pos[1] - 1), (ball_pos[0], ball_pos[1])), opponents):
-            successors["Pomesti choveche gore-desno"] = (opponents, ((man_pos[0] + 1, man_pos[1] - 1), (ball_pos[0], ball_pos[1])))
-
-        #Topka Movement
-        #Gore
-        if self.check_valid(((man_pos[0], man_pos[1] + 1), (ball_pos[0], ball_pos[1] + 1)), opponents):
-            successors["Turni topka gore"] = (opponents, ((man_pos[0], man_pos[1] + 1), (ball_pos[0], ball_pos[1] + 1)))
-        #Dolu
-        if self.check_valid(((man_pos[0], man_pos[1] - 1), (ball_pos[0], ball_pos[1] - 1)), opponents):
-            successors["Turni topka dolu"] = (opponents, ((man_pos[0], man_pos[1] - 1), (ball_pos[0], ball_pos[1] - 1)))
-        #Desno
-        if self.check_valid(((man_pos[0] + 1, man_pos[1]), (ball_pos[0] + 1, ball_pos[1])), opponents):
-            successors["Turni topka desno"] = (opponents, ((man_pos[0] + 1, man_pos[1]), (ball_pos[0] + 1, ball_pos[1])))
-        #Gore-desno
-        if self.check_valid(((man_pos[0] + 1, man_pos[1] + 1), (ball_pos[0] + 1, ball_pos[1])), opponents):
-            successors["Turni topka gore-desno"] = (opponents, ((man_pos[0] + 1, man_pos[1] + 1), (ball_pos[0] + 1, ball_pos[1])))
-        #Dolu-Desno
-        if self.check_valid(((man_pos[0] + 1, man_pos[1] - 1), (ball_pos[0] + 1, ball_pos[1])), opponents):
-            successors["Turni topka gore-desno"] = (opponents, ((man_pos[0] + 1, man_pos[1] - 1), (ball_pos[0] + 1, ball_pos[1])))
+        man_x, man_y = state[0]
+        ball_pos = state[1]
+
+        for name, (dx, dy) in MOVES:
+            new_man = (man_x + dx, man_y + dy)
+            if new_man == ball_pos:
+                new_state = (new_man, (ball_pos[0] + dx, ball_pos[1] + dy))
+                action = "Turni topka " + name
+            else:
+                new_state = (new_man, ball_pos)
+                action = "Pomesti choveche " + name
+            if self.check_valid(new_state):
+                successors[action] = new_state
 
         return successors
 
@@ -552,10 +560,10 @@ class Football(Problem):
         return self.successor(state)[action]
 
     def goal_test(self, state):
-        return state[1] == (7, 2) or state[1] == (7, 3)
+        return state[1] in self.goal
 
     def h(self, node):
-        return 1
+        return self.ball_distance[self.index(*node.state[1])]
 
 
 if __name__ == '__main__':
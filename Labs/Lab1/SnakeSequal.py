@@ -1,5 +1,7 @@
 import bisect
 
+from snake_engine import SnakeEngine
+
 """
 Defining a class for the problem structure that we will solve with a search.
 The Problem class is an abstract class from which we make inheritance to define the basic
@@ -359,412 +361,13 @@ def breadth_first_graph_search(problem):
 
 class Snake(Problem):
 
-    def __init__(self,crveni_jabolki_list, initial, goal=None):
-        super().__init__( initial, goal)
+    def __init__(self, crveni_jabolki_list, initial, goal=None):
+        self.engine = SnakeEngine(crveni_jabolki_list)
+        super().__init__(self.engine.encode(*initial), goal)
         self.crveni_jabolki_list = crveni_jabolki_list
 
     def successor(self, state):
-        #snake = Snake(new_crveni_jabolki, (snake_man_head, tuple(snake_man_body), snake_man_direction, new_zeleni_jabolki))
-        grid_size = (10, 10)
-        successors = dict()
-        snake_head = state[0]
-        snake_head_x = snake_head[0]
-        snake_head_y = snake_head[1]
-        snake_body = state[1]
-        snake_direction = state[2]
-        zeleni_jabolki_list = state[3]
-
-        #This is for snake direction  = "Down"
-        #Move Forward
-        if snake_head[1] - 1 >= 0 and snake_direction == "down" and (
-        snake_head_x, snake_head_y - 1) not in self.crveni_jabolki_list and (
-        snake_head_x, snake_head_y - 1) not in snake_body:
-            new_snake_head = (snake_head_x, snake_head_y - 1)
-            new_snake_body = []
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            for part in snake_body:
-                new_part = list(part)
-                if new_part[0] != snake_head_x:
-                    new_part[0] -= 1
-                elif new_part[0] == snake_head_x:
-                    new_part[1] -= 1
-                new_snake_body.append((new_part[0], new_part[1]))
-
-            if (snake_head_x, snake_head_y - 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y - 1))
-                last_part = new_snake_body[-1]
-                if last_part[0] != snake_head_x:
-                    new_snake_body.append((last_part[0]-1, last_part[1]))
-                elif last_part[0] == snake_head_x:
-                    new_snake_body.append((last_part[0], last_part[1]-1))
-
-            #print("The head is")
-            #print(new_snake_head)
-            #print("The body is")
-            #print(new_snake_body)
-            #print("The apples are")
-            #print(new_zeleni_jabolki)
-
-            successors["ProdolzhiPravo"] = (new_snake_head, tuple(new_snake_body), "down", tuple(new_zeleni_jabolki))
-
-            # This is for snake direction  = "Down"
-            # Move Left
-            if snake_head[0] + 1 < grid_size[0] and snake_direction == "down" and (snake_head_x+1, snake_head_y) not in self.crveni_jabolki_list and (snake_head_x+1, snake_head_y) not in snake_body:
-                new_snake_head = (snake_head_x + 1, snake_head_y)
-                new_snake_body = []
-                new_zeleni_jabolki = list(zeleni_jabolki_list)
-                for part in snake_body:
-                    new_part = list(part)
-                    if new_part[1] != snake_head_y:
-                        new_part[1] -= 1
-                    elif new_part[1] == snake_head_y:
-                        new_part[0] += 1
-                    new_snake_body.append((new_part[0], new_part[1]))
-
-                if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                    new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-                    last_part = new_snake_body[-1]
-                    if last_part[1] != snake_head_y:
-                        new_snake_body.append((last_part[0], last_part[1] - 1))
-                    elif last_part[1] == snake_head_y:
-                        new_snake_body.append((last_part[0] - 1, last_part[1]))
-
-                # print("The head is")
-                # print(new_snake_head)
-                # print("The body is")
-                # print(new_snake_body)
-                # print("The apples are")
-                # print(new_zeleni_jabolki)
-
-                successors["SvrtiLevo"] = (new_snake_head, tuple(new_snake_body), "right", tuple(new_zeleni_jabolki))
-
-                # This is for snake direction  = "Down"
-                # Move Right
-                if snake_head[0] - 1 > 0 and snake_direction == "down" and (snake_head_x-1, snake_head_y) not in self.crveni_jabolki_list and (snake_head_x-1, snake_head_y) not in snake_body:
-                    new_snake_head = (snake_head_x - 1, snake_head_y)
-                    new_snake_body = []
-                    new_zeleni_jabolki = list(zeleni_jabolki_list)
-                    for part in snake_body:
-                        new_part = list(part)
-                        if new_part[1] != snake_head_y:
-                            new_part[1] -= 1
-                        elif new_part[1] == snake_head_y:
-                            new_part[0] -= 1
-                        new_snake_body.append((new_part[0], new_part[1]))
-
-                    if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                        new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-                        last_part = new_snake_body[-1]
-                        if last_part[1] != snake_head_y:
-                            new_snake_body.append((last_part[0], last_part[1] + 1))
-                        elif last_part[1] == snake_head_y:
-                            new_snake_body.append((last_part[0] + 1, last_part[1]))
-
-                    # print("The head is")
-                    # print(new_snake_head)
-                    # print("The body is")
-                    # print(new_snake_body)
-                    # print("The apples are")
-                    # print(new_zeleni_jabolki)
-
-                    successors["SvrtiLevo"] = (new_snake_head, tuple(new_snake_body), "left", tuple(new_zeleni_jabolki))
-
-                # This is for snake direction  = "Up"
-                # Move Forward
-                if snake_head[1] + 1 < grid_size[0] and snake_direction == "up" and (
-                        snake_head_x, snake_head_y + 1) not in self.crveni_jabolki_list and (
-                        snake_head_x, snake_head_y + 1) not in snake_body:
-                    new_snake_head = (snake_head_x, snake_head_y + 1)
-                    new_snake_body = []
-                    new_zeleni_jabolki = list(zeleni_jabolki_list)
-                    for part in snake_body:
-                        new_part = list(part)
-                        if new_part[1] != snake_head_y:
-                            new_part[0] -= 1
-                        elif new_part[0] == snake_head_x:
-                            new_part[1] += 1
-                        new_snake_body.append((new_part[0], new_part[1]))
-
-                    if (snake_head_x, snake_head_y + 1) in zeleni_jabolki_list:
-                        new_zeleni_jabolki.remove((snake_head_x, snake_head_y + 1))
-                        last_part = new_snake_body[-1]
-                        if last_part[0] != snake_head_x:
-                            new_snake_body.append((last_part[0] + 1, last_part[1]))
-                        elif last_part[0] == snake_head_x:
-                            new_snake_body.append((last_part[0], last_part[1] + 1))
-
-                    # print("The head is")
-                    # print(new_snake_head)
-                    # print("The body is")
-                    # print(new_snake_body)
-                    # print("The apples are")
-                    # print(new_zeleni_jabolki)
-
-                    successors["ProdolzhiPravo"] = (new_snake_head, tuple(new_snake_body), "up", tuple(new_zeleni_jabolki))
-
-
-                # This is for snake direction  = "Up"
-                # Move Left
-                if snake_head[0] - 1 > 0 and snake_direction == "up" and (
-                snake_head_x - 1, snake_head_y) not in self.crveni_jabolki_list and (
-                snake_head_x - 1, snake_head_y) not in snake_body:
-                    new_snake_head = (snake_head_x - 1, snake_head_y)
-                    new_snake_body = []
-                    new_zeleni_jabolki = list(zeleni_jabolki_list)
-                    for part in snake_body:
-                        new_part = list(part)
-                        if new_part[1] != snake_head_y:
-                            new_part[1] += 1
-                        elif new_part[1] == snake_head_y:
-                            new_part[0] -= 1
-                        new_snake_body.append((new_part[0], new_part[1]))
-
-                    if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                        new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-                        last_part = new_snake_body[-1]
-                        if last_part[1] != snake_head_y:
-                            new_snake_body.append((last_part[0], last_part[1] + 1))
-                        elif last_part[1] == snake_head_y:
-                            new_snake_body.append((last_part[0] - 1, last_part[1]))
-
-                    # print("The head is")
-                    # print(new_snake_head)
-                    # print("The body is")
-                    # print(new_snake_body)
-                    # print("The apples are")
-                    # print(new_zeleni_jabolki)
-
-                    successors["SvrtiLevo"] = (new_snake_head, tuple(new_snake_body), "left", tuple(new_zeleni_jabolki))
-
-
-                # This is for snake direction  = "Up"
-                # Move Right
-                if snake_head[0] + 1 > grid_size[0] and snake_direction == "up" and (
-                snake_head_x + 1, snake_head_y) not in self.crveni_jabolki_list and (
-                snake_head_x + 1, snake_head_y) not in snake_body:
-                    new_snake_head = (snake_head_x + 1, snake_head_y)
-                    new_snake_body = []
-                    new_zeleni_jabolki = list(zeleni_jabolki_list)
-                    for part in snake_body:
-                        new_part = list(part)
-                        if new_part[1] != snake_head_y:
-                            new_part[1] += 1
-                        elif new_part[1] == snake_head_y:
-                            new_part[0] += 1
-                        new_snake_body.append((new_part[0], new_part[1]))
-
-                    if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                        new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-                        last_part = new_snake_body[-1]
-                        if last_part[1] != snake_head_y:
-                            new_snake_body.append((last_part[0], last_part[1] + 1))
-                        elif last_part[1] == snake_head_y:
-                            new_snake_body.append((last_part[0] + 1, last_part[1]))
-
-                    # print("The head is")
-                    # print(new_snake_head)
-                    # print("The body is")
-                    # print(new_snake_body)
-                    # print("The apples are")
-                    # print(new_zeleni_jabolki)
-
-                    successors["SvrtiDesno"] = (new_snake_head, tuple(new_snake_body), "left", tuple(new_zeleni_jabolki))
-
-            # This is for snake direction  = "Left"
-            # Go Forward
-            if snake_head[0] - 1 >= 0 and snake_direction == "left" and (
-                    snake_head_x - 1, snake_head_y) not in self.crveni_jabolki_list and (
-                    snake_head_x - 1, snake_head_y) not in snake_body:
-                new_snake_head = (snake_head_x - 1, snake_head_y)
-                new_snake_body = []
-                new_zeleni_jabolki = list(zeleni_jabolki_list)
-                for part in snake_body:
-                    new_part = list(part)
-                    if new_part[1] != snake_head_y:
-                        new_part[1] += 1
-                    elif new_part[0] == snake_head_x:
-                        new_part[0] -= 1
-                    new_snake_body.append((new_part[0], new_part[1]))
-
-                if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                    new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-                    last_part = new_snake_body[-1]
-                    if last_part[1] != snake_head_y:
-                        new_snake_body.append((last_part[0], last_part[1] + 1))
-                    elif last_part[0] == snake_head_x:
-                        new_snake_body.append((last_part[0] + 1, last_part[1]))
-
-                # print("The head is")
-                # print(new_snake_head)
-                # print("The body is")
-                # print(new_snake_body)
-                # print("The apples are")
-                # print(new_zeleni_jabolki)
-
-                successors["ProdolzhiPravo"] = (new_snake_head, tuple(new_snake_body), "left", tuple(new_zeleni_jabolki))
-
-            # This is for snake direction  = "Left"
-            # Turn Left
-            if snake_head[1] - 1 >= 0 and snake_direction == "left" and (
-                    snake_head_x, snake_head_y - 1) not in self.crveni_jabolki_list and (
-                    snake_head_x, snake_head_y - 1) not in snake_body:
-                new_snake_head = (snake_head_x, snake_head_y - 1)
-                new_snake_body = []
-                new_zeleni_jabolki = list(zeleni_jabolki_list)
-                for part in snake_body:
-                    new_part = list(part)
-                    if new_part[0] != snake_head_x:
-                        new_part[0] -= 1
-                    elif new_part[1] == snake_head_y:
-                        new_part[1] -= 1
-                    new_snake_body.append((new_part[0], new_part[1]))
-
-                if (snake_head_x, snake_head_y  - 1) in zeleni_jabolki_list:
-                    new_zeleni_jabolki.remove((snake_head_x, snake_head_y - 1))
-                    last_part = new_snake_body[-1]
-                    if last_part[1] != snake_head_y:
-                        new_snake_body.append((last_part[0] + 1, last_part[1]))
-                    elif last_part[1] == snake_head_y:
-                        new_snake_body.append((last_part[0], last_part[1] + 1))
-
-                # print("The head is")
-                # print(new_snake_head)
-                # print("The body is")
-                # print(new_snake_body)
-                # print("The apples are")
-                # print(new_zeleni_jabolki)
-
-                successors["SvrtiLevo"] = (new_snake_head, tuple(new_snake_body), "up", tuple(new_zeleni_jabolki))
-
-
-            # This is for snake direction  = "Right"
-            # Turn Right
-            if snake_head[0] + 1 < grid_size[0] and snake_direction == "right" and (
-                    snake_head_x + 1, snake_head_y) not in self.crveni_jabolki_list and (
-                    snake_head_x + 1, snake_head_y) not in snake_body:
-                new_snake_head = (snake_head_x + 1, snake_head_y)
-                new_snake_body = []
-                new_zeleni_jabolki = list(zeleni_jabolki_list)
-                for part in snake_body:
-                    new_part = list(part)
-                    if new_part[1] != snake_head_y:
-                        new_part[1] -= 1
-                    elif new_part[1] == snake_head_y:
-                        new_part[0] += 1
-                    new_snake_body.append((new_part[0], new_part[1]))
-
-                if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                    new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-                    last_part = new_snake_body[-1]
-                    if last_part[1] != snake_head_y:
-                        new_snake_body.append((last_part[0], last_part[1] - 1))
-                    elif last_part[1] == snake_head_y:
-                        new_snake_body.append((last_part[0] + 1, last_part[1]))
-
-                # print("The head is")
-                # print(new_snake_head)
-                # print("The body is")
-                # print(new_snake_body)
-                # print("The apples are")
-                # print(new_zeleni_jabolki)
-
-                successors["SvrtiDesno"] = (new_snake_head, tuple(new_snake_body), "down", tuple(new_zeleni_jabolki))
-
-                # This is for snake direction  = "Left"
-                # Go Forward
-                if snake_head[0] - 1 > 0 and snake_direction == "left" and (
-                        snake_head_x - 1, snake_head_y) not in self.crveni_jabolki_list and (
-                        snake_head_x - 1, snake_head_y) not in snake_body:
-                    new_snake_head = (snake_head_x - 1, snake_head_y)
-                    new_snake_body = []
-                    new_zeleni_jabolki = list(zeleni_jabolki_list)
-                    for part in snake_body:
-                        new_part = list(part)
-                        if new_part[1] != snake_head_y:
-                            new_part[1] += 1
-                        elif new_part[0] == snake_head_x:
-                            new_part[0] -= 1
-                        new_snake_body.append((new_part[0], new_part[1]))
-
-                    if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                        new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-                        last_part = new_snake_body[-1]
-                        if last_part[1] != snake_head_y:
-                            new_snake_body.append((last_part[0], last_part[1] - 1))
-                        elif last_part[0] == snake_head_x:
-                            new_snake_body.append((last_part[0] + 1, last_part[1]))
-
-                    # print("The head is")
-                    # print(new_snake_head)
-                    # print("The body is")
-                    # print(new_snake_body)
-                    # print("The apples are")
-                    # print(new_zeleni_jabolki)
-
-                    successors["ProdolzhiPravo"] = (new_snake_head, tuple(new_snake_body), "left", tuple(new_zeleni_jabolki))
-
-                # This is for snake direction  = "Left"
-                # Turn Left
-                if snake_head[1] - 1 >= 0 and snake_direction == "left" and (
-                snake_head_x, snake_head_y - 1) not in self.crveni_jabolki_list and (
-                snake_head_x, snake_head_y - 1) not in snake_body:
-                    new_zeleni_jabolki = list(zeleni_jabolki_list)
-                    new_snake_head = (snake_head_x, snake_head_y - 1)
-                    new_snake_body = []
-                    new_zeleni_jabolki = list(zeleni_jabolki_list)
-                    for part in snake_body:
-                        new_part = list(part)
-                        if new_part[1] != snake_head_y:
-                            new_part[0] += 1
-                        elif new_part[0] == snake_head_x:
-                            new_part[1] += 1
-                        new_snake_body.append((new_part[0], new_part[1]))
-
-                    if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                        new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-                        last_part = new_snake_body[-1]
-                        if last_part[1] != snake_head_y:
-                            new_snake_body.append((last_part[0], last_part[1] - 1))
-                        elif last_part[0] == snake_head_x:
-                            new_snake_body.append((last_part[0] + 1, last_part[1]))
-
-                    successors["SvrtiLevo"] = (new_snake_head, tuple(new_snake_body), "down", tuple(new_zeleni_jabolki))
-
-
-                # This is for snake direction  = "Left"
-                # Turn Right
-                if snake_head[1] + 1 < grid_size[1] and snake_direction == "left" and (
-                        snake_head_x, snake_head_y + 1) not in self.crveni_jabolki_list and (
-                        snake_head_x, snake_head_y + 1) not in snake_body:
-                    new_snake_head = (snake_head_x, snake_head_y  + 1)
-                    new_snake_body = []
-                    new_zeleni_jabolki = list(zeleni_jabolki_list)
-                    for part in snake_body:
-                        new_part = list(part)
-                        if new_part[1] != snake_head_y:
-                            new_part[0] -= 1
-                        elif new_part[1] == snake_head_y:
-                            new_part[1] += 1
-                        new_snake_body.append((new_part[0], new_part[1]))
-
-                    if (snake_head_x, snake_head_y + 1) in zeleni_jabolki_list:
-                        new_zeleni_jabolki.remove((snake_head_x, snake_head_y + 1))
-                        last_part = new_snake_body[-1]
-                        if last_part[1] != snake_head_y:
-                            new_snake_body.append((last_part[0] + 1, last_part[1]))
-                        elif last_part[1] == snake_head_y:
-                            new_snake_body.append((last_part[0], last_part[1] - 1))
-
-                    # print("The head is")
-                    # print(new_snake_head)
-                    # print("The body is")
-                    # print(new_snake_body)
-                    # print("The apples are")
-                    # print(new_zeleni_jabolki)
-
-                    successors["SvrtiDesno"] = (new_snake_head, tuple(new_snake_body), "up", tuple(new_zeleni_jabolki))
-
-        return successors
+        return self.engine.successor(state)
 
     def actions(self, state):
         return self.successor(state).keys()
@@ -773,7 +376,7 @@ class Snake(Problem):
         return self.successor(state)[action]
 
     def goal_test(self, state):
-            return len(state[3]) == 0
+        return self.engine.goal_test(state)
 
     def path_cost(self, c, state1, action, state2):
         return super().path_cost(c, state1, action, state2)
@@ -1,5 +1,7 @@
 import bisect
 
+from snake_engine import SnakeEngine
+
 """
 Defining a class for the problem structure that we will solve with a search.
 The Problem class is an abstract class from which we make inheritance to define the basic
@@ -341,305 +343,12 @@ def breadth_first_graph_search(problem):
 class Snake(Problem):
 
     def __init__(self, crveni_jabolki_list, initial, goal=None):
-        super().__init__(initial, goal)
+        self.engine = SnakeEngine(crveni_jabolki_list)
+        super().__init__(self.engine.encode(*initial), goal)
         self.crveni_jabolki_list = crveni_jabolki_list
 
     def successor(self, state):
-        # snake = Snake(new_crveni_jabolki, (snake_man_head, tuple(snake_man_body), snake_man_direction, new_zeleni_jabolki))
-        grid_size = (10, 10)
-        successors = dict()
-        snake_head = state[0]
-        snake_head_x = snake_head[0]
-        snake_head_y = snake_head[1]
-        snake_body = state[1]
-        snake_direction = state[2]
-        zeleni_jabolki_list = state[3]
-
-
-        # snake_direction  = "down"
-        # Move Forward
-        if snake_head[1] - 1 >= 0 and snake_direction == "down" and (
-                snake_head_x, snake_head_y - 1) not in self.crveni_jabolki_list and (
-                snake_head_x, snake_head_y - 1) not in snake_body:
-            new_snake_head = (snake_head_x, snake_head_y - 1)
-            new_snake_body = []
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            snakeBodyLen = len(snake_body)
-            snake_tail = tuple(snake_man_body[0])
-
-            new_snake_body.append(snake_head)
-            for x in range(snakeBodyLen - 1):
-                new_snake_body.append(snake_body[x])
-
-            if (snake_head_x, snake_head_y - 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y - 1))
-                new_snake_body.append(snake_tail)
-                #print("Body is now:")
-                #print(new_snake_body)
-
-            successors["ProdolzhiPravo"] = (new_snake_head, tuple(new_snake_body), "down", tuple(new_zeleni_jabolki))
-
-        # snake_direction = "up"
-        # Move Forward
-        if snake_head[1] + 1 < grid_size[1] and snake_direction == "up" and (
-                    snake_head_x, snake_head_y + 1) not in self.crveni_jabolki_list and (
-                    snake_head_x, snake_head_y + 1) not in snake_body:
-                new_snake_head = (snake_head_x, snake_head_y + 1)
-                new_snake_body = []
-                new_zeleni_jabolki = list(zeleni_jabolki_list)
-                snakeBodyLen = len(snake_body)
-                snake_tail = tuple(snake_man_body[0])
-
-                new_snake_body.append(snake_head)
-                for x in range(snakeBodyLen - 1):
-                    new_snake_body.append(snake_body[x])
-
-                if (snake_head_x, snake_head_y + 1) in zeleni_jabolki_list:
-                    new_zeleni_jabolki.remove((snake_head_x, snake_head_y + 1))
-                    new_snake_body.append(snake_tail)
-                    # print("Body is now:")
-                    # print(new_snake_body)
-
-                successors["ProdolzhiPravo"] = (new_snake_head, tuple(new_snake_body), "up", tuple(new_zeleni_jabolki))
-
-        # snake_direction = "left"
-        # Move Forward
-        if snake_head[0] - 1 >= 0 and snake_direction == "left" and (
-                snake_head_x - 1, snake_head_y) not in self.crveni_jabolki_list and (
-                snake_head_x - 1, snake_head_y) not in snake_body:
-            new_snake_head = (snake_head_x - 1, snake_head_y)
-            new_snake_body = []
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            snakeBodyLen = len(snake_body)
-            snake_tail = tuple(snake_man_body[0])
-
-            new_snake_body.append(snake_head)
-            for x in range(snakeBodyLen - 1):
-                new_snake_body.append(snake_body[x])
-
-            if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-                new_snake_body.append(snake_tail)
-                # print("Body is now:")
-                # print(new_snake_body)
-
-            successors["ProdolzhiPravo"] = (new_snake_head, tuple(new_snake_body), "left", tuple(new_zeleni_jabolki))
-
-        # snake_direction = "right"
-        # Move Forward
-            if snake_head[0] + 1 < grid_size[0] and snake_direction == "right" and (
-                    snake_head_x + 1, snake_head_y) not in self.crveni_jabolki_list and (
-                    snake_head_x + 1, snake_head_y) not in snake_body:
-                new_snake_head = (snake_head_x + 1, snake_head_y)
-                new_snake_body = []
-                new_zeleni_jabolki = list(zeleni_jabolki_list)
-                snakeBodyLen = len(snake_body)
-                snake_tail = tuple(snake_man_body[0])
-
-                new_snake_body.append(snake_head)
-                for x in range(snakeBodyLen - 1):
-                    new_snake_body.append(snake_body[x])
-
-                if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                    new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-                    new_snake_body.append(snake_tail)
-                    # print("Body is now:")
-                    # print(new_snake_body)
-
-                successors["ProdolzhiPravo"] = (
-                new_snake_head, tuple(new_snake_body), "right", tuple(new_zeleni_jabolki))
-
-        # snake_direction  = "down"
-            # Turn Right
-        if snake_head[0] - 1 >= 0 and snake_direction == "down" and (
-                    snake_head_x - 1, snake_head_y) not in self.crveni_jabolki_list and (
-                    snake_head_x - 1, snake_head_y) not in snake_body:
-                new_snake_head = (snake_head_x - 1, snake_head_y)
-                new_snake_body = []
-                new_zeleni_jabolki = list(zeleni_jabolki_list)
-                snakeBodyLen = len(snake_body)
-                snake_tail = tuple(snake_man_body[0])
-
-                new_snake_body.append(snake_head)
-                for x in range(snakeBodyLen - 1):
-                    new_snake_body.append(snake_body[x])
-
-                if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                    new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-                    new_snake_body.append(snake_tail)
-                    # print("Body is now:")
-                    # print(new_snake_body)
-
-                successors["SvrtiDesno"] = (new_snake_head, tuple(new_snake_body), "left", tuple(new_zeleni_jabolki))
-
-
-        # snake_direction = "up"
-        # Turn Right
-        if snake_head[0] + 1 < grid_size[0] and snake_direction == "up" and (
-                snake_head_x + 1, snake_head_y) not in self.crveni_jabolki_list and (
-                snake_head_x + 1, snake_head_y) not in snake_body:
-            new_snake_head = (snake_head_x + 1, snake_head_y)
-            new_snake_body = []
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            snakeBodyLen = len(snake_body)
-            snake_tail = tuple(snake_man_body[0])
-
-            new_snake_body.append(snake_head)
-            for x in range(snakeBodyLen - 1):
-                new_snake_body.append(snake_body[x])
-
-            if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-                new_snake_body.append(snake_tail)
-                # print("Body is now:")
-                # print(new_snake_body)
-
-            successors["SvrtiDesno"] = (new_snake_head, tuple(new_snake_body), "right", tuple(new_zeleni_jabolki))
-
-        # snake_direction = "left"
-        # Turn Right
-        if snake_head[1] + 1 < grid_size[1] and snake_direction == "left" and (
-                    snake_head_x + 1, snake_head_y) not in self.crveni_jabolki_list and (
-                    snake_head_x + 1, snake_head_y) not in snake_body:
-                new_snake_head = (snake_head_x + 1, snake_head_y)
-                new_snake_body = []
-                new_zeleni_jabolki = list(zeleni_jabolki_list)
-                snakeBodyLen = len(snake_body)
-                snake_tail = tuple(snake_man_body[0])
-
-                new_snake_body.append(snake_head)
-                for x in range(snakeBodyLen - 1):
-                    new_snake_body.append(snake_body[x])
-
-                if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                    new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-                    new_snake_body.append(snake_tail)
-                    # print("Body is now:")
-                    # print(new_snake_body)
-
-                successors["SvrtiDesno"] = (new_snake_head, tuple(new_snake_body), "up", tuple(new_zeleni_jabolki))
-
-        # snake_direction = "right"
-        # Turn Right
-        if snake_head[1] - 1 >= 0 and snake_direction == "right" and (
-                snake_head_x, snake_head_y - 1) not in self.crveni_jabolki_list and (
-                snake_head_x, snake_head_y - 1) not in snake_body:
-            new_snake_head = (snake_head_x, snake_head_y - 1)
-            new_snake_body = []
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            snakeBodyLen = len(snake_body)
-            snake_tail = tuple(snake_man_body[0])
-
-            new_snake_body.append(snake_head)
-            for x in range(snakeBodyLen - 1):
-                new_snake_body.append(snake_body[x])
-
-            if (snake_head_x, snake_head_y - 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y - 1))
-                new_snake_body.append(snake_tail)
-                # print("Body is now:")
-                # print(new_snake_body)
-
-            successors["SvrtiDesno"] = (new_snake_head, tuple(new_snake_body), "down", tuple(new_zeleni_jabolki))
-
-
-        # snake_direction  = "down"
-        # Turn Left
-        if snake_head[0] + 1 < grid_size[0] and snake_direction == "down" and (
-                snake_head_x + 1, snake_head_y) not in self.crveni_jabolki_list and (
-                snake_head_x + 1, snake_head_y) not in snake_body:
-            new_snake_head = (snake_head_x + 1, snake_head_y)
-            new_snake_body = []
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            snakeBodyLen = len(snake_body)
-            snake_tail = tuple(snake_man_body[0])
-
-            new_snake_body.append(snake_head)
-            for x in range(snakeBodyLen - 1):
-                new_snake_body.append(snake_body[x])
-
-            if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-                new_snake_body.append(snake_tail)
-                #print("Body is now:")
-                #print(new_snake_body)
-
-            successors["SvrtiLevo"] = (new_snake_head, tuple(new_snake_body), "right", tuple(new_zeleni_jabolki))
-
-
-        # snake_direction = "up"
-        # Turn Left
-        if snake_head[0] - 1 >= 0 and snake_direction == "up" and (
-                snake_head_x - 1, snake_head_y) not in self.crveni_jabolki_list and (
-                snake_head_x - 1, snake_head_y) not in snake_body:
-            new_snake_head = (snake_head_x - 1, snake_head_y)
-            new_snake_body = []
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            snakeBodyLen = len(snake_body)
-            snake_tail = tuple(snake_man_body[0])
-
-            new_snake_body.append(snake_head)
-            for x in range(snakeBodyLen - 1):
-                new_snake_body.append(snake_body[x])
-
-            if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-                new_snake_body.append(snake_tail)
-                #print("Body is now:")
-                #print(new_snake_body)
-
-            successors["SvrtiLevo"] = (new_snake_head, tuple(new_snake_body), "left", tuple(new_zeleni_jabolki))
-
-        # snake_direction = "left"
-        # Turn Left
-        if snake_head[1] - 1 >= 0 and snake_direction == "left" and (
-                snake_head_x, snake_head_y - 1) not in self.crveni_jabolki_list and (
-                snake_head_x, snake_head_y - 1) not in snake_body:
-            new_snake_head = (snake_head_x, snake_head_y - 1)
-            new_snake_body = []
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            snakeBodyLen = len(snake_body)
-            snake_tail = tuple(snake_man_body[0])
-
-            new_snake_body.append(snake_head)
-            for x in range(snakeBodyLen - 1):
-                new_snake_body.append(snake_body[x])
-
-            if (snake_head_x, snake_head_y - 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y - 1))
-                new_snake_body.append(snake_tail)
-                #print("Body is now:")
-                #print(new_snake_body)
-
-            successors["SvrtiLevo"] = (new_snake_head, tuple(new_snake_body), "down", tuple(new_zeleni_jabolki))
-
-
-        # snake_direction = "right"
-        # Turn Left
-        if snake_head[1] + 1 < grid_size[1] and snake_direction == "right" and (
-                snake_head_x, snake_head_y + 1) not in self.crveni_jabolki_list and (
-                snake_head_x, snake_head_y + 1) not in snake_body:
-            new_snake_head = (snake_head_x, snake_head_y + 1)
-            new_snake_body = []
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            snakeBodyLen = len(snake_body)
-            snake_tail = tuple(snake_man_body[0])
-
-            new_snake_body.append(snake_head)
-            for x in range(snakeBodyLen - 1):
-                new_snake_body.append(snake_body[x])
-
-            if (snake_head_x, snake_head_y + 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y + 1))
-                new_snake_body.append(snake_tail)
-                #print("Body is now:")
-                #print(new_snake_body)
-
-            successors["SvrtiLevo"] = (new_snake_head, tuple(new_snake_body), "up", tuple(new_zeleni_jabolki))
-
-
-
-        return successors
+        return self.engine.successor(state)
 
     def actions(self, state):
         return self.successor(state).keys()
@@ -648,7 +357,7 @@ class Snake(Problem):
         return self.successor(state)[action]
 
     def goal_test(self, state):
-        return len(state[3]) == 0
+        return self.engine.goal_test(state)
 
     def path_cost(self, c, state1, action, state2):
         return super().path_cost(c, state1, action, state2)
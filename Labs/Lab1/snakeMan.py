@@ -1,5 +1,7 @@
 import bisect
 
+from snake_engine import SnakeEngine
+
 """
 Defining a class for the problem structure that we will solve with a search.
 The Problem class is an abstract class from which we make inheritance to define the basic
@@ -359,191 +361,13 @@ def breadth_first_graph_search(problem):
 
 class Snake(Problem):
 
-    def __init__(self,crveni_jabolki_list, initial, goal=None):
-        super().__init__( initial, goal)
+    def __init__(self, crveni_jabolki_list, initial, goal=None):
+        self.engine = SnakeEngine(crveni_jabolki_list)
+        super().__init__(self.engine.encode(*initial), goal)
         self.crveni_jabolki_list = crveni_jabolki_list
 
     def successor(self, state):
-        #snake = Snake((snake_man_head, snake_man_body, snake_man_direction, zeleni_jabolki, crveni_jabolki))
-        grid_size = (10, 10)
-        successors = dict()
-        snake_head = state[0]
-        snake_head_x = snake_head[0]
-        snake_head_y = snake_head[1]
-        snake_body = state[1]
-        snake_direction = state[2]
-        zeleni_jabolki_list = state[3]
-        #crveni_jabolki_list = state[4]
-
-        #snake_direction Down
-        #Move Forward
-        if snake_head[1] - 1 >= 0 and snake_direction == "down" and (snake_head_x, snake_head_y - 1) not in self.crveni_jabolki_list and (snake_head_x, snake_head_y - 1) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            for body_part in snake_body:
-                body_part[1] -= 1
-            if (snake_head_x, snake_head_y - 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y - 1))
-            successors["ProdolzhiPravo"] = ((snake_head_x,snake_head_y - 1), "down", tuple(new_zeleni_jabolki))
-
-        # Move Left
-        if snake_head[0] + 1 > grid_size[0] and snake_direction == "down" and (snake_head_x+1, snake_head_y) not in self.crveni_jabolki_list and (snake_head_x+1, snake_head_y) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            #first_body_part = new_snake_body[0]
-            #first_body_part[0] += 1
-            #first_body_part[1] -= 1
-            for body_part in new_snake_body:
-                body_part[1] -= 1
-            #new_snake_body[0] = first_body_part
-            if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-            successors["SvrtiDesno"] = ((snake_head_x + 1, snake_head_y), "right", tuple(new_zeleni_jabolki))
-
-
-        #Move Right
-        if snake_head[0] - 1 > 0 and snake_direction == "down" and (snake_head_x-1, snake_head_y) not in self.crveni_jabolki_list and (snake_head_x-1, snake_head_y) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            # first_body_part = new_snake_body[0]
-            # first_body_part[0] += 1
-            # first_body_part[1] -= 1
-            for body_part in new_snake_body:
-                body_part[1] -= 1
-            # new_snake_body[0] = first_body_part
-            if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-            successors["SvrtiLevo"] = ((snake_head_x + 1, snake_head_y), "left", tuple(new_zeleni_jabolki))
-
-
-        #snake_direction Up
-        # Move Forward
-        if snake_head[1] + 1 > grid_size[0] and snake_direction == "up" and (
-        snake_head_x + 1, snake_head_y) not in self.crveni_jabolki_list and (
-        snake_head_x + 1, snake_head_y - 1) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            for body_part in snake_body:
-                body_part[1] += 1
-            if (snake_head_x, snake_head_y + 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x , snake_head_y + 1))
-            successors["ProdolzhiPravo"] = ((snake_head_x, snake_head_y + 1,), "up", tuple(new_zeleni_jabolki))
-
-        # Move Right
-        if snake_head[0] + 1 > grid_size[0] and snake_direction == "up" and (snake_head_x+1, snake_head_y) not in self.crveni_jabolki_list and (snake_head_x+1, snake_head_y) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            #first_body_part = new_snake_body[0]
-            #first_body_part[0] += 1
-            #first_body_part[1] -= 1
-            for body_part in new_snake_body:
-                body_part[1] += 1
-            #new_snake_body[0] = first_body_part
-            if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-            successors["SvrtiDesno"] = ((snake_head_x + 1, snake_head_y), "right", tuple(new_zeleni_jabolki))
-
-        # Move Left
-        if snake_head[0] - 1 >= 0 and snake_direction == "up" and (snake_head_x+1, snake_head_y) not in self.crveni_jabolki_list and (snake_head_x - 1, snake_head_y) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            #first_body_part = new_snake_body[0]
-            #first_body_part[0] += 1
-            #first_body_part[1] -= 1
-            for body_part in new_snake_body:
-                body_part[1] += 1
-            #new_snake_body[0] = first_body_part
-            if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-            successors["SvrtiLevo"] = ((snake_head_x - 1, snake_head_y), "left", tuple(new_zeleni_jabolki))
-
-        #snake_direction Left
-        # Move Forward
-        if snake_head[0] - 1 > 0 and snake_direction == "left" and (
-                snake_head_x + 1, snake_head_y) not in self.crveni_jabolki_list and (
-                snake_head_x + 1, snake_head_y) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            for body_part in snake_body:
-                body_part[0] -= 1
-            if (snake_head_x - 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x - 1, snake_head_y))
-            successors["ProdolzhiPravo"] = ((snake_head_x - 1, snake_head_y,), "left", tuple(new_zeleni_jabolki))
-        # Move Right
-        if snake_head[1] + 1 < grid_size[1] and snake_direction == "left" and (
-        snake_head_x, snake_head_y + 1) not in self.crveni_jabolki_list and (
-        snake_head_x, snake_head_y + 1) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            # first_body_part = new_snake_body[0]
-            # first_body_part[0] += 1
-            # first_body_part[1] -= 1
-            for body_part in new_snake_body:
-                body_part[0] -= 1
-            # new_snake_body[0] = first_body_part
-            if (snake_head_x , snake_head_y + 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y + 1))
-            successors["SvrtiDesno"] = ((snake_head_x, snake_head_y + 1), "up", tuple(new_zeleni_jabolki))
-
-        # Move Left
-        if snake_head[1] >= 0 and snake_direction == "left" and (snake_head_x, snake_head_y - 1) not in self.crveni_jabolki_list and (snake_head_x, snake_head_y - 1) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            #first_body_part = new_snake_body[0]
-            #first_body_part[0] += 1
-            #first_body_part[1] -= 1
-            for body_part in new_snake_body:
-                body_part[0] -= 1
-            #new_snake_body[0] = first_body_part
-            if (snake_head_x, snake_head_y  - 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y  - 1))
-            successors["SvrtiLevo"] = ((snake_head_x , snake_head_y - 1), "down", tuple(new_zeleni_jabolki))
-
-        #snake_direction Right
-        # Move Forward
-        if snake_head[0] + 1 > grid_size[0] and snake_direction == "right" and (
-                snake_head_x + 1, snake_head_y) not in self.crveni_jabolki_list and (
-                snake_head_x + 1, snake_head_y) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            for body_part in snake_body:
-                body_part[0] += 1
-            if (snake_head_x + 1, snake_head_y) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x + 1, snake_head_y))
-            successors["ProdolzhiPravo"] = ((snake_head_x + 1, snake_head_y,), "right", tuple(new_zeleni_jabolki))
-
-        # Move Right
-        if snake_head[1] - 1 >= 0 and snake_direction == "right" and (
-                snake_head_x, snake_head_y - 1) not in self.crveni_jabolki_list and (
-                snake_head_x, snake_head_y - 1) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            # first_body_part = new_snake_body[0]
-            # first_body_part[0] += 1
-            # first_body_part[1] -= 1
-            for body_part in new_snake_body:
-                body_part[0] -= 1
-            # new_snake_body[0] = first_body_part
-            if (snake_head_x, snake_head_y - 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y - 1))
-            successors["SvrtiDesno"] = ((snake_head_x, snake_head_y - 1), "down", tuple(new_zeleni_jabolki))
-        # Move Left
-        if snake_head[1] + 1 < grid_size[1] and snake_direction == "right" and (
-        snake_head_x, snake_head_y + 1) not in self.crveni_jabolki_list and (
-        snake_head_x, snake_head_y + 1) not in snake_body:
-            new_zeleni_jabolki = list(zeleni_jabolki_list)
-            new_snake_body = snake_body
-            # first_body_part = new_snake_body[0]
-            # first_body_part[0] += 1
-            # first_body_part[1] -= 1
-            for body_part in new_snake_body:
-                body_part[0] -= 1
-            # new_snake_body[0] = first_body_part
-            if (snake_head_x, snake_head_y + 1) in zeleni_jabolki_list:
-                new_zeleni_jabolki.remove((snake_head_x, snake_head_y + 1))
-            successors["SvrtiLevo"] = ((snake_head_x, snake_head_y + 1), "up", tuple(new_zeleni_jabolki))
-
-        return successors
+        return self.engine.successor(state)
 
     def actions(self, state):
         return self.successor(state).keys()
@@ -552,7 +376,7 @@ class Snake(Problem):
         return self.successor(state)[action]
 
     def goal_test(self, state):
-        return len(state[3]) == 0
+        return self.engine.goal_test(state)
 
     def path_cost(self, c, state1, action, state2):
         return super().path_cost(c, state1, action, state2)
@@ -0,0 +1,133 @@
+"""
+State engine for the Snake problems in Lab1.
+
+Cells are packed into integers (index = y * width + x). A state is the tuple
+(head, body, direction, green_apples, occupied) where body is the tuple of
+packed cells from the neck to the tail, direction is an index into
+DIRECTIONS, and green_apples and occupied are bitmasks over the cells.
+"""
+
+# Clockwise order, so turning right is +1 and turning left is -1
+DIRECTIONS = ("up", "right", "down", "left")
+
+DIRECTION_VECTORS = {
+    "up": (0, 1),
+    "right": (1, 0),
+    "down": (0, -1),
+    "left": (-1, 0),
+}
+
+RELATIVE_TURNS = (
+    ("ProdolzhiPravo", 0),
+    ("SvrtiDesno", 1),
+    ("SvrtiLevo", -1),
+)
+
+# TURN_TABLE[direction] -> ((action, new_direction), ...)
+TURN_TABLE = tuple(
+    tuple((action, (d + turn) % len(DIRECTIONS)) for action, turn in RELATIVE_TURNS)
+    for d in range(len(DIRECTIONS))
+)
+
+
+class SnakeEngine:
+    def __init__(self, red_apples=(), grid_size=(10, 10)):
+        """Precompute the move table and the red apple mask for a board.
+
+        :param red_apples: cells (x, y) the snake must never enter
+        :param grid_size: (width, height) of the board
+        """
+        self.width, self.height = grid_size
+        self.red_mask = self.mask(red_apples)
+        # moves[cell][direction] -> neighbouring cell, or -1 outside the board
+        self.moves = []
+        for cell in range(self.width * self.height):
+            x, y = cell % self.width, cell // self.width
+            row = []
+            for name in DIRECTIONS:
+                dx, dy = DIRECTION_VECTORS[name]
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.width and 0 <= ny < self.height:
+                    row.append(ny * self.width + nx)
+                else:
+                    row.append(-1)
+            self.moves.append(tuple(row))
+
+    def cell(self, position):
+        return position[1] * self.width + position[0]
+
+    def position(self, cell):
+        return cell % self.width, cell // self.width
+
+    def mask(self, positions):
+        result = 0
+        for position in positions:
+            result |= 1 << self.cell(position)
+        return result
+
+    def positions(self, mask):
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(self.position(low.bit_length() - 1))
+            mask ^= low
+        return tuple(result)
+
+    def encode(self, head, body, direction, green_apples):
+        """Convert a state written with coordinates into an engine state.
+
+        :param head: (x, y) of the head
+        :param body: cells (x, y) from the neck to the tail
+        :param direction: one of DIRECTIONS
+        :param green_apples: cells (x, y) with green apples
+        :return: engine state
+        :rtype: tuple
+        """
+        head = self.cell(head)
+        body = tuple(self.cell(part) for part in body)
+        occupied = 1 << head
+        for part in body:
+            occupied |= 1 << part
+        return head, body, DIRECTIONS.index(direction), self.mask(green_apples), occupied
+
+    def decode(self, state):
+        """Convert an engine state back into coordinates.
+
+        :param state: engine state
+        :return: (head, body, direction, green_apples)
+        :rtype: tuple
+        """
+        head, body, direction, green_apples, _ = state
+        return (self.position(head), tuple(self.position(part) for part in body),
+                DIRECTIONS[direction], self.positions(green_apples))
+
+    def successor(self, state):
+        """Return the {action: state} pairs reachable from the given state.
+
+        :param state: engine state
+        :return: dictionary of {action: state} pairs
+        :rtype: dict
+        """
+        successors = dict()
+        head, body, direction, green_apples, occupied = state
+        blocked = occupied | self.red_mask
+        moves = self.moves[head]
+        tail = body[-1] if body else head
+        for action, new_direction in TURN_TABLE[direction]:
+            new_head = moves[new_direction]
+            if new_head < 0:
+                continue
+            bit = 1 << new_head
+            if blocked & bit:
+                continue
+            if green_apples & bit:
+                # The snake grows: keep the tail where it is
+                successors[action] = (new_head, (head,) + body, new_direction,
+                                      green_apples ^ bit, occupied | bit)
+            else:
+                successors[action] = (new_head, ((head,) + body)[:len(body)], new_direction,
+                                      green_apples, (occupied ^ (1 << tail)) | bit)
+        return successors
+
+    def goal_test(self, state):
+        return state[3] == 0
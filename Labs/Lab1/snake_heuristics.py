@@ -0,0 +1,101 @@
+"""
+Heuristics for the Snake problems built on top of SnakeEngine.
+
+The distances are true shortest paths around the red apples (the body is
+ignored because it moves), so every estimate stays admissible.
+"""
+
+from collections import deque
+
+UNREACHABLE = 10 ** 9
+
+
+def distance_map(engine, source):
+    """Breadth-first distances from source to every cell, avoiding red apples.
+
+    :param engine: SnakeEngine with the static board
+    :param source: packed cell to start from
+    :return: list of distances indexed by cell, UNREACHABLE for blocked cells
+    :rtype: list
+    """
+    distances = [UNREACHABLE] * (engine.width * engine.height)
+    distances[source] = 0
+    queue = deque([source])
+    while queue:
+        cell = queue.popleft()
+        step = distances[cell] + 1
+        for neighbour in engine.moves[cell]:
+            if neighbour < 0 or distances[neighbour] != UNREACHABLE:
+                continue
+            if engine.red_mask >> neighbour & 1:
+                continue
+            distances[neighbour] = step
+            queue.append(neighbour)
+    return distances
+
+
+class SnakeHeuristic:
+    def __init__(self, engine, green_apples):
+        """Precompute a distance map for each green apple of the initial state.
+
+        :param engine: SnakeEngine with the static board
+        :param green_apples: bitmask of the green apples to collect
+        """
+        self.engine = engine
+        self.apples = []
+        mask = green_apples
+        while mask:
+            low = mask & -mask
+            self.apples.append(low.bit_length() - 1)
+            mask ^= low
+        self.distances = {apple: distance_map(engine, apple) for apple in self.apples}
+        # Minimum spanning tree weight of the remaining apples, keyed by their mask
+        self.mst_cache = {0: 0}
+
+    def remaining(self, mask):
+        return [apple for apple in self.apples if mask >> apple & 1]
+
+    def spanning_tree(self, mask):
+        """Weight of the minimum spanning tree over the apples left in mask.
+
+        Any order of collecting the apples walks at least this far between them.
+
+        :param mask: bitmask of the remaining green apples
+        :return: tree weight
+        :rtype: int
+        """
+        if mask in self.mst_cache:
+            return self.mst_cache[mask]
+        apples = self.remaining(mask)
+        # Prim's algorithm on the complete graph of apple-to-apple distances
+        best = {apple: self.distances[apples[0]][apple] for apple in apples[1:]}
+        total = 0
+        while best:
+            apple = min(best, key=best.get)
+            total += best.pop(apple)
+            row = self.distances[apple]
+            for other in best:
+                if row[other] < best[other]:
+                    best[other] = row[other]
+        self.mst_cache[mask] = total
+        return total
+
+    def __call__(self, node):
+        """Lower bound on the moves needed to eat every remaining green apple.
+
+        The snake reaches some apple first (at least the nearest one) and then
+        covers the rest (at least the spanning tree); it also has to reach the
+        farthest apple at some point.
+
+        :param node: search node with an engine state
+        :return: admissible estimate
+        :rtype: int
+        """
+        head, mask = node.state[0], node.state[3]
+        if mask == 0:
+            return 0
+        to_apples = [self.distances[apple][head] for apple in self.remaining(mask)]
+        nearest, farthest = min(to_apples), max(to_apples)
+        if farthest >= UNREACHABLE:
+            return UNREACHABLE
+        return max(nearest + self.spanning_tree(mask), farthest)
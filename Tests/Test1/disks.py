@@ -313,6 +313,7 @@ class PriorityQueue(Queue):
 
 
 import sys
+from array import array
 
 """
 Неинформирано пребарување во рамки на дрво.
@@ -463,13 +464,205 @@ def uniform_cost_search(problem):
     """
     return graph_search(problem, PriorityQueue(min, lambda a: a.path_cost))
 
+
+def bitset_breadth_first_search(problem, size):
+    """Пребарување прво во широчина за проблеми чии состојби се цели
+    броеви од 0 до size - 1. Посетените состојби се чуваат во битсет
+    наместо во множество (size / 8 бајти), а нивоата во низи од цели
+    броеви наместо како јазли (8 бајти по достигната состојба). Патот до
+    целта се гради наназад, со по едно поминување низ секое ниво.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param size: број на можни состојби
+    :type size: int
+    :return: Node or None
+    :rtype: Node
+    """
+    visited = bytearray((size + 7) // 8)
+    start = problem.initial
+    visited[start >> 3] |= 1 << (start & 7)
+    if problem.goal_test(start):
+        return Node(start)
+    layers = [array('Q', [start])]
+    while layers[-1]:
+        layer = array('Q')
+        for state in layers[-1]:
+            for child in problem.successor(state).values():
+                if visited[child >> 3] & (1 << (child & 7)):
+                    continue
+                visited[child >> 3] |= 1 << (child & 7)
+                if problem.goal_test(child):
+                    return layered_path(problem, layers, child)
+                layer.append(child)
+        layers.append(layer)
+    return None
+
+
+def layered_path(problem, layers, goal):
+    """Пат од почетната состојба до goal, кој е во нивото по последното
+    во layers: во секое претходно ниво се бара состојба чиј следбеник е
+    тековната.
+    :return: Node
+    :rtype: Node
+    """
+    steps = []
+    target = goal
+    for layer in reversed(layers):
+        for state in layer:
+            action = next((action for action, child in problem.successor(state).items() if child == target), None)
+            if action is not None:
+                steps.append((action, target))
+                target = state
+                break
+    node = Node(problem.initial)
+    for action, state in reversed(steps):
+        node = Node(state, node, action, problem.path_cost(node.path_cost, node.state, action, state))
+    return node
+
+
+def bidirectional_breadth_first_search(problem):
+    """Пребарување прво во широчина истовремено од почетната и од целната
+    состојба, секогаш по едно цело ниво од помалата граница. Проблемот
+    треба да има една целна состојба problem.goal и метод
+    problem.predecessor(state) кој враќа речник {акција : претходна состојба}.
+    :param problem: даден проблем
+    :type problem: Problem
+    :return: Node or None
+    :rtype: Node
+    """
+    start, goal = Node(problem.initial), Node(problem.goal)
+    if problem.goal_test(start.state):
+        return start
+    # јазлите од назад чуваат состојба од која со акцијата се стигнува до родителот
+    forward, backward = {start.state: start}, {goal.state: goal}
+    forward_layer, backward_layer = [start], [goal]
+    while forward_layer and backward_layer:
+        expand_forward = len(forward_layer) <= len(backward_layer)
+        if expand_forward:
+            layer, seen, other, moves = forward_layer, forward, backward, problem.successor
+        else:
+            layer, seen, other, moves = backward_layer, backward, forward, problem.predecessor
+        next_layer, meeting, best = [], None, sys.maxsize
+        for node in layer:
+            for action, state in moves(node.state).items():
+                if state in seen:
+                    continue
+                child = Node(state, node, action, node.path_cost + 1)
+                seen[state] = child
+                next_layer.append(child)
+                if state in other and child.path_cost + other[state].path_cost < best:
+                    meeting, best = state, child.path_cost + other[state].path_cost
+        if meeting is not None:
+            node, back = forward[meeting], backward[meeting]
+            while back.parent:
+                node = Node(back.parent.state, node, back.action,
+                            problem.path_cost(node.path_cost, node.state, back.action, back.parent.state))
+                back = back.parent
+            return node
+        if expand_forward:
+            forward_layer = next_layer
+        else:
+            backward_layer = next_layer
+    return None
+
+
+FACTORIALS = [1]
+for i in range(1, 21):
+    FACTORIALS.append(FACTORIALS[-1] * i)
+
+
+def partial_permutations(size, count):
+    """Number of ordered selections of count out of size elements."""
+    return FACTORIALS[size] // FACTORIALS[size - count]
+
+
 class lenta(Problem):
 
-    def __init__(self, initial, goal=None):
-        super().__init__(initial, goal)
+    def __init__(self, n, length):
+        """Tape of the given length with disks 1..n on the first n cells. The
+        disks have to end up on the last n cells in reverse order. A disk
+        moves left or right onto a neighbouring empty cell, or jumps over one
+        disk onto the empty cell behind it.
+
+        A tape is the tuple of cells of disks 1..n, a partial permutation of
+        0..length - 1, and the state is its rank among the
+        length! / (length - n)! such tuples: disk i contributes the number of
+        free cells left of it (skipping the cells of disks 1..i - 1) times
+        the weight (length - 1 - i)! / (length - n)!.
+        :param n: number of disks
+        :param length: number of cells on the tape
+        """
+        self.n = n
+        self.length = length
+        self.size = partial_permutations(length, n)
+        self.weights = [partial_permutations(length - 1 - i, n - 1 - i) for i in range(n)]
+        start = tuple(range(n))
+        goal = tuple(range(length - 1, length - 1 - n, -1))
+        super().__init__(self.rank(start), self.rank(goal))
+
+        # (from cell, to cell, cell jumped over or None) for every move
+        self.moves = []
+        for i in range(length):
+            for step in (-2, -1, 1, 2):
+                j = i + step
+                if 0 <= j < length:
+                    self.moves.append((i, j, i + step // 2 if abs(step) == 2 else None))
+
+    def rank(self, cells):
+        result = 0
+        for i, cell in enumerate(cells):
+            result += (cell - sum(1 for other in cells[:i] if other < cell)) * self.weights[i]
+        return result
+
+    def unrank(self, state):
+        free = list(range(self.length))
+        cells = []
+        for weight in self.weights:
+            digit, state = divmod(state, weight)
+            cells.append(free.pop(digit))
+        return cells
+
+    def tape(self, state):
+        result = [0] * self.length
+        for disk, cell in enumerate(self.unrank(state)):
+            result[cell] = disk + 1
+        return result
+
+    def moves_from(self, state):
+        """Yield (disk, from, to, new state) for every legal move. Moving disk
+        k from a to b only changes the free-cell count of disk k, by b - a
+        less the disks in between, and that of a disk jumped over that comes
+        after k, so the new rank is an update of the old one."""
+        cells = self.unrank(state)
+        tape = [-1] * self.length
+        for disk, cell in enumerate(cells):
+            tape[cell] = disk
+        weights = self.weights
+        for a, b, over in self.moves:
+            k = tape[a]
+            if k < 0 or tape[b] >= 0:
+                continue
+            delta = b - a
+            if over is not None:
+                m = tape[over]
+                if m < 0:
+                    continue
+                sign = 1 if delta > 0 else -1
+                if m < k:
+                    delta -= sign
+                    new_state = state + delta * weights[k]
+                else:
+                    new_state = state + delta * weights[k] + sign * weights[m]
+            else:
+                new_state = state + delta * weights[k]
+            yield k + 1, a, b, new_state
 
     def successor(self, state):
-        pass
+        return {f"D{disk}: {i} -> {j}": new_state for disk, i, j, new_state in self.moves_from(state)}
+
+    def predecessor(self, state):
+        # every move can be undone by moving the same disk back
+        return {f"D{disk}: {j} -> {i}": new_state for disk, i, j, new_state in self.moves_from(state)}
 
     def actions(self, state):
         return self.successor(state).keys()
@@ -490,9 +683,7 @@ class lenta(Problem):
 if __name__ == '__main__':
     n = int(input())
     l = int(input())
-    lentaBroevi = []
-    for i in range(1,n+1):
-        lentaBroevi.append(i)
-
-    print(lentaBroevi)
+    problem = lenta(n, l)
 
+    result = bitset_breadth_first_search(problem, problem.size)
+    print(result.solution() if result else None)
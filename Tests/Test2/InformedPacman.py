@@ -1,5 +1,9 @@
+# Го користи пакетот searching_framework од коренот на репозиториумот, па
+# се стартува од коренот: python -m Tests.Test2.InformedPacman
 import bisect
 
+from searching_framework import GridWorld
+
 """
 Дефинирање на класа за структурата на проблемот кој ќе го решаваме со пребарување.
 Класата Problem е апстрактна класа од која правиме наследување за дефинирање на основните 
@@ -280,36 +284,42 @@ class PriorityQueue(Queue):
         """
         assert order in [min, max]
         self.data = []
+        # јазлите во редицата според состојбата, за проверка со hash наместо со изминување
+        self.members = {}
         self.order = order
         self.f = f
 
     def append(self, item):
         bisect.insort_right(self.data, (self.f(item), item))
+        self.members[item] = item
 
     def extend(self, items):
         for item in items:
-            bisect.insort_right(self.data, (self.f(item), item))
+            self.append(item)
 
     def pop(self):
         if self.order == min:
-            return self.data.pop(0)[1]
-        return self.data.pop()[1]
+            item = self.data.pop(0)[1]
+        else:
+            item = self.data.pop()[1]
+        del self.members[item]
+        return item
 
     def __len__(self):
         return len(self.data)
 
     def __contains__(self, item):
-        return any(item == pair[1] for pair in self.data)
+        return item in self.members
 
     def __getitem__(self, key):
-        for _, item in self.data:
-            if item == key:
-                return item
+        return self.members.get(key)
 
     def __delitem__(self, key):
-        for i, (value, item) in enumerate(self.data):
-            if item == key:
-                self.data.pop(i)
+        item = self.members.pop(key)
+        i = bisect.bisect_left(self.data, (self.f(item), item))
+        while self.data[i][1] is not item:
+            i += 1
+        self.data.pop(i)
 
 
 from sys import maxsize as infinity
@@ -448,6 +458,12 @@ def recursive_best_first_search(problem, h=None):
     return result
 
 
+# Clockwise order, so turning right is +1 and turning left is -1
+HEADINGS = ("sever", "istok", "jug", "zapad")
+PACMAN_MOVES = ((0, 1), (1, 0), (0, -1), (-1, 0))
+TURNS = (("ProdolzhiPravo", 0), ("ProdolzhiNazad", 2), ("SvrtiLevo", -1), ("SvrtiDesno", 1))
+
+
 class Pacman(Problem):
     def __init__(self, stars_num, initial, goal=None):
         super().__init__(initial, goal)
@@ -456,148 +472,28 @@ class Pacman(Problem):
                           (0, 8), (8, 8), (9, 8), (0, 9), (1, 9), (2, 9), (3, 9), (4, 9), (6, 9)]
         self.grid_size = [10, 10]
         self.stars_num2 = stars_num
+        self.grid = GridWorld(self.grid_size[0], self.grid_size[1], self.obstacles)
+        self.moves = self.grid.neighbours(PACMAN_MOVES).tolist()
 
     def successor(self, state):
         successors = dict()
-        pacman_x = state[0]
-        pacman_y = state[1]
-        pacman_direction = state[2]
-        stars = state[3]
-
-        # east
-        # forward
-        if pacman_x + 1 < self.grid_size[0] and pacman_direction == "istok" and (
-                pacman_x + 1, pacman_y) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x + 1, pacman_y) in stars:
-                stars_new.remove((pacman_x + 1, pacman_y))
-            successors["ProdolzhiPravo"] = (pacman_x + 1, pacman_y, "istok", tuple(stars_new))
-
-        # backwards
-        if pacman_x - 1 >= 0 and pacman_direction == "istok" and (pacman_x - 1, pacman_y) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x - 1, pacman_y) in stars:
-                stars_new.remove((pacman_x - 1, pacman_y))
-            successors["ProdolzhiNazad"] = (pacman_x - 1, pacman_y, "zapad", tuple(stars_new))
-        # left
-        if pacman_y + 1 < self.grid_size[1] and pacman_direction == "istok" and (
-                pacman_x, pacman_y + 1) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x, pacman_y + 1) in stars:
-                stars_new.remove((pacman_x, pacman_y + 1))
-            successors["SvrtiLevo"] = (pacman_x, pacman_y + 1, "sever", tuple(stars_new))
-
-        # right
-        if pacman_y - 1 >= 0 and pacman_direction == "istok" and (pacman_x, pacman_y - 1) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x, pacman_y - 1) in stars:
-                stars_new.remove((pacman_x, pacman_y - 1))
-            successors["SvrtiDesno"] = (pacman_x, pacman_y - 1, "jug", tuple(stars_new))
-
-        # west
-        # forward
-        if pacman_x - 1 >= 0 and pacman_direction == "zapad" and (pacman_x - 1, pacman_y) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x - 1, pacman_y) in stars:
-                stars_new.remove((pacman_x - 1, pacman_y))
-            successors["ProdolzhiPravo"] = (pacman_x - 1, pacman_y, "zapad", tuple(stars_new))
-
-        # backwards
-        if pacman_x + 1 < self.grid_size[0] and pacman_direction == "zapad" and (
-                pacman_x + 1, pacman_y) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x + 1, pacman_y) in stars:
-                stars_new.remove((pacman_x + 1, pacman_y))
-            successors["ProdolzhiNazad"] = (pacman_x + 1, pacman_y, "istok", tuple(stars_new))
-
-        # left
-        if pacman_y - 1 >= 0 and pacman_direction == "zapad" and (pacman_x, pacman_y - 1) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x, pacman_y - 1) in stars:
-                stars_new.remove((pacman_x, pacman_y - 1))
-            successors["SvrtiLevo"] = (pacman_x, pacman_y - 1, "jug", tuple(stars_new))
-
-        # right
-        if pacman_y + 1 < self.grid_size[1] and pacman_direction == "zapad" and (
-                pacman_x, pacman_y + 1) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x, pacman_y + 1) in stars:
-                stars_new.remove((pacman_x, pacman_y + 1))
-            successors["SvrtiDesno"] = (pacman_x, pacman_y + 1, "sever", tuple(stars_new))
-
-        # north
-        # forward
-        if pacman_y + 1 < self.grid_size[1] and pacman_direction == "sever" and (
-                pacman_x, pacman_y + 1) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x, pacman_y + 1) in stars:
-                stars_new.remove((pacman_x, pacman_y + 1))
-            successors["ProdolzhiPravo"] = (pacman_x, pacman_y + 1, "sever", tuple(stars_new))
-
-        # backwards
-        if pacman_y - 1 >= 0 and pacman_direction == "sever" and (pacman_x, pacman_y - 1) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x, pacman_y - 1) in stars:
-                stars_new.remove((pacman_x, pacman_y - 1))
-            successors["ProdolzhiNazad"] = (pacman_x, pacman_y - 1, "jug", tuple(stars_new))
-
-        # left
-        if pacman_x - 1 >= 0 and pacman_direction == "sever" and (pacman_x - 1, pacman_y) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x - 1, pacman_y) in stars:
-                stars_new.remove((pacman_x - 1, pacman_y))
-            successors["SvrtiLevo"] = (pacman_x - 1, pacman_y, "zapad", tuple(stars_new))
-
-        # right
-        if pacman_x + 1 < self.grid_size[0] and pacman_direction == "sever" and (
-                pacman_x + 1, pacman_y) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x + 1, pacman_y) in stars:
-                stars_new.remove((pacman_x + 1, pacman_y))
-            successors["SvrtiDesno"] = (pacman_x + 1, pacman_y, "istok", tuple(stars_new))
-
-        # south
-        # forward
-        if pacman_y - 1 >= 0 and pacman_direction == "jug" and (
-                pacman_x, pacman_y - 1) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x, pacman_y - 1) in stars:
-                stars_new.remove((pacman_x, pacman_y - 1))
-            successors["ProdolzhiPravo"] = (pacman_x, pacman_y - 1, "jug", tuple(stars_new))
-
-        # backwards
-        if pacman_y + 1 < self.grid_size[1] and pacman_direction == "jug" and (
-                pacman_x, pacman_y + 1) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x, pacman_y + 1) in stars:
-                stars_new.remove((pacman_x, pacman_y + 1))
-            successors["ProdolzhiNazad"] = (pacman_x, pacman_y + 1, "sever", tuple(stars_new))
-
-        # right
-        if pacman_x - 1 >= 0 and pacman_direction == "jug" and (
-                pacman_x - 1, pacman_y) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x - 1, pacman_y) in stars:
-                stars_new.remove((pacman_x - 1, pacman_y))
-            successors["SvrtiDesno"] = (pacman_x - 1, pacman_y, "zapad", tuple(stars_new))
-
-        # left
-        if pacman_x + 1 < self.grid_size[0] and pacman_direction == "jug" and (
-                pacman_x + 1, pacman_y) not in self.obstacles:
-            stars_new = list(stars)
-            if (pacman_x + 1, pacman_y) in stars:
-                stars_new.remove((pacman_x + 1, pacman_y))
-            successors["SvrtiLevo"] = (pacman_x + 1, pacman_y, "istok", tuple(stars_new))
-
+        pacman_x, pacman_y, pacman_direction, stars = state
+        row = self.moves[self.grid.cell(pacman_x, pacman_y)]
+        heading = HEADINGS.index(pacman_direction)
+        for action, turn in TURNS:
+            new_heading = (heading + turn) % len(HEADINGS)
+            target = row[new_heading]
+            if target < 0:
+                continue
+            position = self.grid.position(target)
+            stars_new = tuple(star for star in stars if star != position)
+            successors[action] = position + (HEADINGS[new_heading], stars_new)
         return successors
 
     def h(self, node):
-        min_star = min(stars_list)
-        pacman_x_pos = node.state[0]
-        pacman_y_pos = node.state[1]
-        min1 = len(node.state[3]) / self.stars_num2
-        min2 = abs(pacman_x_pos - min_star[0]) + abs(pacman_y_pos - min_star[1])
-        return min(min1, min2)
+        # Pacman has to reach every remaining star, so the farthest one is a lower bound
+        cell = self.grid.cell(node.state[0], node.state[1])
+        return max((self.grid.distances([star])[cell] for star in node.state[3]), default=0)
 
     def actions(self, state):
         return self.successor(state).keys()
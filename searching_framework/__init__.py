@@ -0,0 +1,23 @@
+"""
+Search code shared between the labs, auditory exercises and exams.
+
+Run the scripts from the repository root (or add it to PYTHONPATH) so that
+`import searching_framework` resolves.
+"""
+
+from searching_framework.gridworld import GridWorld, MOVES_4, MOVES_8
+from searching_framework.dstar_lite import DStarLite
+from searching_framework.landmarks import Landmarks, grid_landmarks, graph_landmarks
+from searching_framework.hierarchical import HierarchicalPlanner, hierarchical_planner
+from searching_framework.parallel_search import parallel_breadth_first_search
+from searching_framework.external_search import external_breadth_first_search, external_reachability
+from searching_framework.utils import Checkpointer
+from searching_framework.uninformed_search import breadth_first_graph_search, depth_first_graph_search, \
+    depth_limited_search, iterative_deepening_search
+from searching_framework.informed_search import astar_search, greedy_best_first_graph_search
+from searching_framework.checkpoint import resume_search
+from searching_framework.local_search import hill_climbing, stochastic_hill_climbing, simulated_annealing, \
+    random_restarts, genetic_algorithm, ExponentialSchedule, LinearSchedule, LogarithmicSchedule
+from searching_framework.realtime_search import LRTAStar
+from searching_framework.solution_cache import SolutionCache
+from searching_framework.zobrist import ZobristHashing, ZobristKeys, ZobristState
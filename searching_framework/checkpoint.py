@@ -0,0 +1,49 @@
+"""
+Resuming searches from the checkpoints written through a Checkpointer.
+
+    checkpoint = Checkpointer("astar.ckpt", every=50000)
+    astar_search(problem, checkpoint=checkpoint)
+    ...  # the process dies
+    resume_search("astar.ckpt", problem)
+
+The resumed search keeps writing to the same file with the same interval.
+"""
+
+from searching_framework.informed_search import astar_search, best_first_graph_search, \
+    greedy_best_first_graph_search
+from searching_framework.uninformed_search import depth_limited_search, graph_search, \
+    iterative_deepening_search
+from searching_framework.utils import Checkpointer, FIFOQueue, Stack, load_checkpoint
+
+
+def resume_search(checkpoint_path, problem, h=None, f=None):
+    """Continue a search from its checkpoint exactly where it stopped.
+    :param checkpoint_path: file written by the interrupted search
+    :param problem: the same problem the search was started with
+    :param h: the heuristic, if it was not problem.h (astar and greedy)
+    :param f: the evaluation function (plain best_first_graph_search only)
+    :return: Node or None
+    :rtype: Node
+    """
+    record = load_checkpoint(checkpoint_path)
+    if record["initial"] != problem.initial:
+        raise ValueError("The checkpoint was written for a different initial state")
+    checkpoint = Checkpointer(checkpoint_path, record["every"], record["seconds"])
+    algorithm = record["algorithm"]
+    if algorithm == "breadth_first":
+        return graph_search(problem, FIFOQueue(), checkpoint, record)
+    if algorithm == "depth_first":
+        return graph_search(problem, Stack(), checkpoint, record)
+    if algorithm == "depth_limited":
+        return depth_limited_search(problem, record["limit"], checkpoint, record)
+    if algorithm == "iterative_deepening":
+        return iterative_deepening_search(problem, checkpoint, record)
+    if algorithm == "astar":
+        return astar_search(problem, h, checkpoint, record)
+    if algorithm == "greedy":
+        return greedy_best_first_graph_search(problem, h, checkpoint, record)
+    if algorithm == "best_first":
+        if f is None:
+            raise ValueError("Resuming best_first_graph_search needs its f")
+        return best_first_graph_search(problem, f, None, checkpoint, record)
+    raise ValueError(f"Unknown algorithm in checkpoint: {algorithm}")
@@ -0,0 +1,186 @@
+"""
+D* Lite incremental planner on top of GridWorld.
+
+The search runs backwards from the goal and keeps its g/rhs tables between
+queries, so after a few cells open or close (update_cells) or the agent
+moves (move_start), plan() only repairs the part of the search that the
+change affects instead of starting from scratch.
+"""
+
+import heapq
+import math
+
+import numpy as np
+
+from searching_framework.gridworld import MOVES_4
+
+INFINITY = math.inf
+
+
+def default_heuristic(grid, moves):
+    """A consistent lower bound on the cost between two cells for a move set:
+    Manhattan distance for the 4-neighbourhood, otherwise the number of
+    moves needed along the slower axis. Both are scaled by the cheapest
+    entry cost on the grid.
+    :param grid: GridWorld
+    :param moves: tuple of (dx, dy) moves
+    :return: function h(a, b) on packed cells
+    :rtype: function
+    """
+    width = grid.width
+    cheapest = float(grid.costs.min())
+    if set(moves) == set(MOVES_4):
+        def h(a, b):
+            ay, ax = divmod(a, width)
+            by, bx = divmod(b, width)
+            return cheapest * (abs(ax - bx) + abs(ay - by))
+        return h
+    step_x = max(abs(dx) for dx, _ in moves) or 1
+    step_y = max(abs(dy) for _, dy in moves) or 1
+
+    def h(a, b):
+        ay, ax = divmod(a, width)
+        by, bx = divmod(b, width)
+        return cheapest * max(-(-abs(ax - bx) // step_x), -(-abs(ay - by) // step_y))
+    return h
+
+
+class DStarLite:
+    def __init__(self, grid, start, goal, moves=MOVES_4, heuristic=None):
+        """Set up the planner for a path from start to goal.
+        :param grid: GridWorld; update_cells changes it in place
+        :param start: (x, y) of the agent
+        :param goal: (x, y) to reach
+        :param moves: tuple of (dx, dy) moves
+        :param heuristic: consistent h(a, b) on packed cells, a default bound
+                          for the move set if None
+        """
+        self.grid = grid
+        self.moves = tuple(moves)
+        self.h = heuristic or default_heuristic(grid, self.moves)
+        # plain lists, scalar lookups on them are much cheaper than on arrays
+        self.free = grid.free.reshape(-1).tolist()
+        self.costs = grid.costs.reshape(-1).tolist()
+        # successors and predecessors inside the board, whether free or not,
+        # because cells may open and close later
+        self.succ = self.adjacency(self.moves)
+        self.pred = self.adjacency(tuple((-dx, -dy) for dx, dy in self.moves))
+        self.start = grid.cell(*start)
+        self.goal = grid.cell(*goal)
+        self.last = self.start
+        self.km = 0
+        self.g = [INFINITY] * grid.size
+        self.rhs = [INFINITY] * grid.size
+        self.rhs[self.goal] = 0
+        # heap of (k1, k2, cell) with lazy deletion; queued holds the live key
+        self.heap = []
+        self.queued = {}
+        self.push(self.goal, (self.h(self.start, self.goal), 0))
+        self.expanded = 0
+
+    def adjacency(self, moves):
+        grid = self.grid
+        ys, xs = np.divmod(np.arange(grid.size), grid.width)
+        table = []
+        for dx, dy in moves:
+            nx, ny = xs + dx, ys + dy
+            inside = (nx >= 0) & (nx < grid.width) & (ny >= 0) & (ny < grid.height)
+            table.append(np.where(inside, ny * grid.width + nx, -1))
+        return [[int(cell) for cell in row if cell >= 0] for row in np.stack(table, axis=1).tolist()]
+
+    def cost(self, a, b):
+        if self.free[a] and self.free[b]:
+            return self.costs[b]
+        return INFINITY
+
+    def key(self, cell):
+        best = min(self.g[cell], self.rhs[cell])
+        return best + self.h(self.start, cell) + self.km, best
+
+    def push(self, cell, key):
+        self.queued[cell] = key
+        heapq.heappush(self.heap, (key[0], key[1], cell))
+
+    def top(self):
+        """Drop stale heap entries and return the live top (key, cell)."""
+        heap = self.heap
+        while heap:
+            k1, k2, cell = heap[0]
+            if self.queued.get(cell) == (k1, k2):
+                return (k1, k2), cell
+            heapq.heappop(heap)
+        return (INFINITY, INFINITY), None
+
+    def update_vertex(self, cell):
+        if cell != self.goal:
+            rhs = INFINITY
+            for s in self.succ[cell]:
+                value = self.cost(cell, s) + self.g[s]
+                if value < rhs:
+                    rhs = value
+            self.rhs[cell] = rhs
+        if self.g[cell] != self.rhs[cell]:
+            self.push(cell, self.key(cell))
+        else:
+            self.queued.pop(cell, None)
+
+    def compute_shortest_path(self):
+        g, rhs = self.g, self.rhs
+        while True:
+            k_old, u = self.top()
+            if u is None:
+                break
+            start = self.start
+            if not (k_old < self.key(start) or rhs[start] != g[start]):
+                break
+            self.expanded += 1
+            k_new = self.key(u)
+            if k_old < k_new:
+                self.push(u, k_new)
+            elif g[u] > rhs[u]:
+                g[u] = rhs[u]
+                del self.queued[u]
+                for s in self.pred[u]:
+                    self.update_vertex(s)
+            else:
+                g[u] = INFINITY
+                self.update_vertex(u)
+                for s in self.pred[u]:
+                    self.update_vertex(s)
+
+    def plan(self):
+        """Bring the search up to date and read the path off the g table.
+        :return: list of (x, y) cells from the start to the goal, or None
+                 if the goal can not be reached
+        :rtype: list
+        """
+        self.compute_shortest_path()
+        if self.g[self.start] == INFINITY:
+            return None
+        cell = self.start
+        path = [self.grid.position(cell)]
+        while cell != self.goal:
+            cell = min(self.succ[cell], key=lambda s: self.cost(cell, s) + self.g[s])
+            path.append(self.grid.position(cell))
+        return path
+
+    def move_start(self, start):
+        """The agent moved; keep the old keys valid by raising km."""
+        start = self.grid.cell(*start)
+        self.km += self.h(self.last, start)
+        self.last = self.start = start
+
+    def update_cells(self, changes):
+        """Open or close cells and repair the affected entries.
+        :param changes: iterable of ((x, y), free) pairs
+        """
+        changes = list(changes)
+        self.grid.set_free(changes)
+        for (x, y), free in changes:
+            self.free[self.grid.cell(x, y)] = bool(free)
+        for (x, y), _ in changes:
+            cell = self.grid.cell(x, y)
+            # both the edges out of the cell and into it changed cost
+            self.update_vertex(cell)
+            for s in self.pred[cell]:
+                self.update_vertex(s)
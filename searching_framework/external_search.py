@@ -0,0 +1,201 @@
+"""
+External-memory breadth-first search.
+
+Every BFS layer lives on disk as a sorted file of fixed-width state codes
+(uint64). The next layer is produced by streaming the current layer,
+writing the encoded children in sorted runs of bounded size, merging the
+runs and subtracting the previous layers with a sorted merge. The merge
+reads all runs and earlier layers at once and splits chunk_size between
+them, so memory stays at about two chunks of codes (the read blocks and
+the output block) however large a layer gets.
+
+The problem provides the encoding with pack_state(state) -> int and
+unpack_state(code) -> state, with codes below 2 ** 64. Problems whose
+states already are such integers need neither.
+
+Duplicates of a state can only show up in the two layers before it when
+every move can be undone (undirected state graphs, e.g. the 8-puzzle).
+For one-way moves pass locality=None to subtract every earlier layer.
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from searching_framework.utils import Node
+
+CODE = np.dtype("<u8")
+
+
+def packer(problem):
+    pack = getattr(problem, "pack_state", None)
+    unpack = getattr(problem, "unpack_state", None)
+    return pack or int, unpack or int
+
+
+def read_sorted(path, block):
+    """Stream the codes of a sorted layer or run file in blocks."""
+    with open(path, "rb") as stream:
+        while True:
+            codes = np.fromfile(stream, dtype=CODE, count=block)
+            if codes.size == 0:
+                return
+            yield from codes.tolist()
+
+
+def write_run(codes, path):
+    np.unique(np.array(codes, dtype=CODE)).tofile(path)
+
+
+def subtract(merged, previous):
+    """Sorted set difference of the stream merged and the sorted streams in
+    previous, dropping repeats in merged as well."""
+    others = heapq.merge(*previous)
+    other = next(others, None)
+    last = None
+    for code in merged:
+        if code == last:
+            continue
+        last = code
+        while other is not None and other < code:
+            other = next(others, None)
+        if other != code:
+            yield code
+
+
+class LayerFiles:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, depth):
+        return os.path.join(self.directory, f"layer_{depth}.bin")
+
+    def run_path(self, index):
+        return os.path.join(self.directory, f"run_{index}.bin")
+
+
+def external_layers(problem, directory, chunk_size=1 << 20, locality=2, find_goal=True):
+    """Breadth-first layers of the state space, one file per layer.
+    :param problem: Problem with successor() and optionally pack_state/unpack_state
+    :param directory: where the layer files are written
+    :param chunk_size: number of codes kept in memory per sorted run, and
+                       in all read blocks of a merge together
+    :param locality: number of earlier layers a new state is checked
+                     against, None for all of them
+    :param find_goal: whether to test the new states with goal_test
+    :return: generator of (depth, path, goal code or None); stops after the
+             first layer that contains a goal or when the space is exhausted
+    """
+    pack, unpack = packer(problem)
+    files = LayerFiles(directory)
+    initial = pack(problem.initial)
+    np.array([initial], dtype=CODE).tofile(files.path(0))
+    depth = 0
+    goal = initial if find_goal and problem.goal_test(problem.initial) else None
+    yield depth, files.path(0), goal
+    while goal is None:
+        # expand the current layer into sorted runs
+        runs, buffer = [], []
+        for code in read_sorted(files.path(depth), chunk_size):
+            for child in problem.successor(unpack(code)).values():
+                buffer.append(pack(child))
+            if len(buffer) >= chunk_size:
+                runs.append(files.run_path(len(runs)))
+                write_run(buffer, runs[-1])
+                buffer = []
+        if buffer:
+            runs.append(files.run_path(len(runs)))
+            write_run(buffer, runs[-1])
+        earliest = 0 if locality is None else max(0, depth + 1 - locality)
+        streams = [files.path(d) for d in range(earliest, depth + 1)]
+        read_block = max(1, chunk_size // (len(runs) + len(streams)))
+        previous = [read_sorted(path, read_block) for path in streams]
+        merged = heapq.merge(*(read_sorted(run, read_block) for run in runs))
+        depth += 1
+        size = 0
+        with open(files.path(depth), "wb") as out:
+            block = []
+            for code in subtract(merged, previous):
+                block.append(code)
+                if find_goal and goal is None and problem.goal_test(unpack(code)):
+                    goal = code
+                if len(block) >= chunk_size:
+                    np.array(block, dtype=CODE).tofile(out)
+                    size += len(block)
+                    block = []
+            np.array(block, dtype=CODE).tofile(out)
+            size += len(block)
+        for run in runs:
+            os.remove(run)
+        if size == 0:
+            return
+        yield depth, files.path(depth), goal
+
+
+def rebuild_path(problem, directory, depth, goal, chunk_size=1 << 20):
+    """Walk back from the goal layer by layer: in each earlier layer find a
+    state that has the current one as a successor. Costs one scan per layer.
+    :return: Node for the goal with the full parent chain
+    :rtype: Node
+    """
+    pack, unpack = packer(problem)
+    files = LayerFiles(directory)
+    steps = []
+    target = goal
+    for d in range(depth - 1, -1, -1):
+        link = None
+        for code in read_sorted(files.path(d), chunk_size):
+            for action, child in problem.successor(unpack(code)).items():
+                if pack(child) == target:
+                    link = code, action
+                    break
+            if link is not None:
+                break
+        steps.append((link[1], unpack(target)))
+        target = link[0]
+    node = Node(problem.initial)
+    for action, state in reversed(steps):
+        node = Node(state, node, action, problem.path_cost(node.path_cost, node.state, action, state))
+    return node
+
+
+def external_breadth_first_search(problem, directory=None, chunk_size=1 << 20, locality=2):
+    """Breadth-first graph search with the frontier and visited layers on
+    disk. Finds the same depth of solution as breadth_first_graph_search.
+    :param problem: the problem to solve
+    :type problem: Problem
+    :param directory: directory for the layer files, a temporary one that is
+                      removed afterwards if None
+    :param chunk_size: number of codes kept in memory per sorted run
+    :param locality: earlier layers to deduplicate against, None for all
+    :return: Node or None
+    :rtype: Node
+    """
+    cleanup = directory is None
+    directory = directory or tempfile.mkdtemp(prefix="bfs_")
+    try:
+        for depth, _, goal in external_layers(problem, directory, chunk_size, locality):
+            if goal is not None:
+                return rebuild_path(problem, directory, depth, goal, chunk_size)
+        return None
+    finally:
+        if cleanup:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def external_reachability(problem, directory=None, chunk_size=1 << 20, locality=2):
+    """Number of states at every depth of the whole reachable state space.
+    :return: list of layer sizes
+    :rtype: list
+    """
+    cleanup = directory is None
+    directory = directory or tempfile.mkdtemp(prefix="bfs_")
+    try:
+        return [os.path.getsize(path) // CODE.itemsize
+                for _, path, _ in external_layers(problem, directory, chunk_size, locality, False)]
+    finally:
+        if cleanup:
+            shutil.rmtree(directory, ignore_errors=True)
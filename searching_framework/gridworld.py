@@ -0,0 +1,151 @@
+"""
+Shared grid substrate for the grid problems: bounds and obstacle checks,
+neighbour tables and distance maps. Needs numpy. Pacman
+(Tests/Test2/InformedPacman.py) is built on it; the other grid scripts
+(Snake, Football, Explorer, Rock, Molecule, GhostOnSkates, Stars) carry
+their own checks and do not import this package. Explorer, Rock and
+GhostOnSkates use numpy for h_batch when it is installed and fall back to
+the standard library when it is not (see README.md).
+
+Cells are packed as y * width + x, the same way the individual problems pack
+them, and the arrays are indexed as grid[y, x].
+"""
+
+import heapq
+
+import numpy as np
+
+MOVES_4 = ((1, 0), (-1, 0), (0, 1), (0, -1))
+MOVES_8 = MOVES_4 + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class GridWorld:
+    def __init__(self, width, height, blocked=(), costs=None):
+        """Create a grid with the given obstacles and optional entry costs.
+        :param width: number of columns
+        :param height: number of rows
+        :param blocked: (x, y) cells that can not be entered
+        :param costs: optional array of shape (height, width) with the cost
+                      of entering every cell, 1 everywhere if None
+        """
+        self.width = width
+        self.height = height
+        self.free = np.ones((height, width), dtype=bool)
+        for x, y in blocked:
+            if self.inside(x, y):
+                self.free[y, x] = False
+        if costs is None:
+            self.costs = np.ones((height, width), dtype=np.float64)
+        else:
+            self.costs = np.asarray(costs, dtype=np.float64).reshape(height, width)
+        self.neighbour_cache = {}
+        self.distance_cache = {}
+
+    @property
+    def size(self):
+        return self.width * self.height
+
+    def cell(self, x, y):
+        return y * self.width + x
+
+    def position(self, cell):
+        return cell % self.width, cell // self.width
+
+    def inside(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_free(self, x, y):
+        """Bounds and obstacle check for a single cell.
+        :rtype: bool
+        """
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.free[y, x])
+
+    def valid(self, xs, ys):
+        """Vectorized is_free for a batch of candidate cells.
+        :param xs: array of columns
+        :param ys: array of rows
+        :return: boolean array, True where the cell is inside and free
+        :rtype: numpy.ndarray
+        """
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        result = np.zeros(xs.shape, dtype=bool)
+        result[inside] = self.free[ys[inside], xs[inside]]
+        return result
+
+    def set_free(self, changes):
+        """Open or close cells and drop the cached tables that depend on them.
+        :param changes: iterable of ((x, y), free) pairs
+        """
+        for (x, y), free in changes:
+            self.free[y, x] = free
+        self.neighbour_cache.clear()
+        self.distance_cache.clear()
+
+    def neighbours(self, moves=MOVES_4):
+        """Neighbour table for a move set: row c holds, for every move, the
+        cell reached from cell c, or -1 if it is outside or blocked. The table
+        is built once per move set with array operations.
+        :param moves: tuple of (dx, dy) moves, e.g. MOVES_4, MOVES_8 or jumps
+        :return: int array of shape (width * height, len(moves))
+        :rtype: numpy.ndarray
+        """
+        moves = tuple(moves)
+        if moves not in self.neighbour_cache:
+            ys, xs = np.divmod(np.arange(self.size), self.width)
+            table = np.full((self.size, len(moves)), -1, dtype=np.int64)
+            for i, (dx, dy) in enumerate(moves):
+                ok = self.valid(xs + dx, ys + dy)
+                table[ok, i] = (ys[ok] + dy) * self.width + xs[ok] + dx
+            self.neighbour_cache[moves] = table
+        return self.neighbour_cache[moves]
+
+    def distances(self, sources, moves=MOVES_4, reverse=False):
+        """Shortest path costs from the source cells to every cell. With unit
+        costs this is a breadth-first search that expands whole layers with
+        array operations; otherwise Dijkstra over the entry costs. Results are
+        cached per (sources, moves, reverse).
+        :param sources: iterable of (x, y) cells
+        :param moves: tuple of (dx, dy) moves
+        :param reverse: if True, the distances are from every cell to the
+                        sources (only matters for asymmetric move sets)
+        :return: float array of length width * height, inf if unreachable
+        :rtype: numpy.ndarray
+        """
+        sources = tuple(sorted(self.cell(x, y) for x, y in sources if self.is_free(x, y)))
+        moves = tuple(moves)
+        key = (sources, moves, reverse)
+        if key in self.distance_cache:
+            return self.distance_cache[key]
+        table = self.neighbours(tuple((-dx, -dy) for dx, dy in moves) if reverse else moves)
+        distances = np.full(self.size, np.inf)
+        if np.all(self.costs == 1):
+            frontier = np.array(sources, dtype=np.int64)
+            distances[frontier] = 0
+            step = 0
+            while frontier.size:
+                step += 1
+                reached = table[frontier].ravel()
+                reached = np.unique(reached[reached >= 0])
+                frontier = reached[np.isinf(distances[reached])]
+                distances[frontier] = step
+        else:
+            costs = self.costs.ravel()
+            for source in sources:
+                distances[source] = 0
+            heap = [(0.0, source) for source in sources]
+            while heap:
+                d, cell = heapq.heappop(heap)
+                if d > distances[cell]:
+                    continue
+                for target in table[cell]:
+                    if target < 0:
+                        continue
+                    # with reverse moves we walk backwards, so we pay for leaving the cell we came from
+                    new_d = d + (costs[cell] if reverse else costs[target])
+                    if new_d < distances[target]:
+                        distances[target] = new_d
+                        heapq.heappush(heap, (new_d, int(target)))
+        self.distance_cache[key] = distances
+        return distances
@@ -0,0 +1,324 @@
+"""
+Measure how good a heuristic is on small instances of its problem.
+
+    report = profile_heuristic(problem)          # problem.h
+    print(format_table([report]))
+
+The true cost-to-go h* is computed by enumerating the reachable state space
+from problem.initial and running Dijkstra backwards from the goal states
+over the reversed edges, and every reachable state is checked: violations
+tend to sit next to the goal, where a uniform sample rarely lands. When the
+space is larger than max_states, states are sampled with random walks and
+h* is computed per sampled state with a forward uniform-cost search that
+gives up after max_states expansions (such states count as unresolved).
+
+The report of a heuristic h contains
+    admissible violations   checked states with h(s) > h*(s)
+    max overestimate        largest h(s) - h*(s)
+    consistency violations  edges s -> s' (from checked states) with
+                            h(s) > c(s, s') + h(s')
+    mean h/h*               over checked states with 0 < h* < inf
+    expanded, depth, EBF    A* from problem.initial with h: the expansions,
+                            the solution depth and the effective branching
+                            factor b* with N + 1 = 1 + b* + ... + b*^depth
+
+Running the module profiles every h() in the repository on a small fixed
+instance of its problem and prints one table:
+
+    python -m searching_framework.heuristic_profiler
+"""
+
+import heapq
+import importlib.util
+import math
+import os
+import random
+import sys
+from collections import defaultdict
+from itertools import count
+
+from searching_framework.utils import Node
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the scripts use sys.maxsize as infinity
+INFINITE = sys.maxsize
+
+
+def evaluate(h, state):
+    value = h(Node(state))
+    return math.inf if value is None or value >= INFINITE else value
+
+
+def edges(problem, state):
+    return [(child, problem.path_cost(0, state, action, child))
+            for action, child in problem.successor(state).items()]
+
+
+def enumerate_states(problem, max_states):
+    """Reachable states with their reversed edges, None if there are more
+    than max_states."""
+    reverse = defaultdict(list)
+    seen = {problem.initial}
+    queue = [problem.initial]
+    for state in queue:
+        for child, cost in edges(problem, state):
+            reverse[child].append((state, cost))
+            if child not in seen:
+                if len(seen) >= max_states:
+                    return None
+                seen.add(child)
+                queue.append(child)
+    return queue, reverse
+
+
+def reverse_costs(problem, states, reverse):
+    """h* of every state by Dijkstra from all goal states over reverse."""
+    tie = count()
+    costs = {}
+    heap = [(0, next(tie), state) for state in states if problem.goal_test(state)]
+    while heap:
+        cost, _, state = heapq.heappop(heap)
+        if state in costs:
+            continue
+        costs[state] = cost
+        for parent, step in reverse[state]:
+            if parent not in costs:
+                heapq.heappush(heap, (cost + step, next(tie), parent))
+    return costs
+
+
+def forward_cost(problem, state, max_expansions):
+    """h* of one state by uniform-cost search, None if it gave up."""
+    tie = count()
+    heap = [(0, next(tie), state)]
+    done = set()
+    while heap and len(done) < max_expansions:
+        cost, _, current = heapq.heappop(heap)
+        if current in done:
+            continue
+        if problem.goal_test(current):
+            return cost
+        done.add(current)
+        for child, step in edges(problem, current):
+            if child not in done:
+                heapq.heappush(heap, (cost + step, next(tie), child))
+    return math.inf if not heap else None
+
+
+def random_walk_states(problem, samples, walk_length, rng):
+    states = []
+    for _ in range(samples):
+        state = problem.initial
+        for _ in range(rng.randrange(walk_length + 1)):
+            children = list(problem.successor(state).values())
+            if not children:
+                break
+            state = rng.choice(children)
+        states.append(state)
+    return states
+
+
+def astar_expansions(problem, h, max_expansions):
+    """A* from problem.initial counting expansions.
+    :return: (expanded, solution depth or None)
+    :rtype: tuple
+    """
+    tie = count()
+    start = Node(problem.initial)
+    heap = [(evaluate(h, start.state), next(tie), start)]
+    best = {start.state: 0}
+    expanded = 0
+    while heap and expanded < max_expansions:
+        _, _, node = heapq.heappop(heap)
+        if best.get(node.state, math.inf) < node.path_cost:
+            continue
+        if problem.goal_test(node.state):
+            return expanded, node.depth
+        expanded += 1
+        for child in node.expand(problem):
+            if child.path_cost < best.get(child.state, math.inf):
+                best[child.state] = child.path_cost
+                estimate = evaluate(h, child.state)
+                if estimate < math.inf:
+                    heapq.heappush(heap, (child.path_cost + estimate, next(tie), child))
+    return expanded, None
+
+
+def effective_branching_factor(expanded, depth):
+    """b* with expanded + 1 = 1 + b* + b*^2 + ... + b*^depth, by bisection."""
+    if not depth:
+        return None
+    target = expanded + 1
+
+    def total(b):
+        return sum(b ** i for i in range(depth + 1))
+
+    low, high = 0.0, max(2.0, float(expanded))
+    for _ in range(100):
+        middle = (low + high) / 2
+        if total(middle) < target:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def profile_heuristic(problem, h=None, name=None, samples=500, max_states=200000, walk_length=50, seed=0):
+    """Profile one heuristic on one problem instance.
+    :param problem: a small instance of the problem
+    :type problem: Problem
+    :param h: heuristic h(node), problem.h if None
+    :param name: label for the table
+    :param samples: number of sampled states when the space is too large
+                    to enumerate; otherwise all states are checked
+    :param max_states: size limit for enumerating the state space, and the
+                       expansion limit of the per-state and A* searches
+    :param walk_length: longest random walk used to sample states when the
+                        space is too large to enumerate
+    :param seed: seed of the sampling
+    :return: the measurements, see the module docstring
+    :rtype: dict
+    """
+    h = h or problem.h
+    rng = random.Random(seed)
+    enumerated = enumerate_states(problem, max_states)
+    if enumerated is not None:
+        states, reverse = enumerated
+        costs = reverse_costs(problem, states, reverse)
+        sampled = states
+        truth = {state: costs.get(state, math.inf) for state in states}
+    else:
+        sampled = random_walk_states(problem, samples, walk_length, rng)
+        truth = {state: forward_cost(problem, state, max_states) for state in set(sampled)}
+
+    violations, overestimate, ratios, unresolved = 0, 0, [], 0
+    for state in sampled:
+        optimal = truth[state]
+        if optimal is None:
+            unresolved += 1
+            continue
+        value = evaluate(h, state)
+        if value > optimal:
+            violations += 1
+            overestimate = max(overestimate, value - optimal)
+        if 0 < optimal < math.inf:
+            ratios.append(value / optimal)
+
+    checked, inconsistent = 0, 0
+    for state in sampled:
+        value = evaluate(h, state)
+        if value == math.inf:
+            continue
+        for child, cost in edges(problem, state):
+            checked += 1
+            if value > cost + evaluate(h, child):
+                inconsistent += 1
+
+    expanded, depth = astar_expansions(problem, h, max_states)
+    return {
+        "name": name or type(problem).__name__,
+        "states": len(enumerated[0]) if enumerated is not None else None,
+        "sampled": len(sampled) - unresolved,
+        "unresolved": unresolved,
+        "admissible_violations": violations,
+        "max_overestimate": overestimate,
+        "edges": checked,
+        "consistency_violations": inconsistent,
+        "mean_ratio": sum(ratios) / len(ratios) if ratios else None,
+        "min_ratio": min(ratios) if ratios else None,
+        "expanded": expanded,
+        "depth": depth,
+        "ebf": effective_branching_factor(expanded, depth),
+    }
+
+
+COLUMNS = (
+    ("heuristic", "name", "{}"),
+    ("states", "states", "{}"),
+    ("checked", "sampled", "{}"),
+    ("h>h*", "admissible_violations", "{}"),
+    ("max over", "max_overestimate", "{:g}"),
+    ("inconsistent", "consistency_violations", "{}"),
+    ("edges", "edges", "{}"),
+    ("mean h/h*", "mean_ratio", "{:.3f}"),
+    ("min h/h*", "min_ratio", "{:.3f}"),
+    ("A* expanded", "expanded", "{}"),
+    ("depth", "depth", "{}"),
+    ("EBF", "ebf", "{:.3f}"),
+)
+
+
+def format_table(reports):
+    rows = [[title for title, _, _ in COLUMNS]]
+    for report in reports:
+        rows.append(["-" if report[key] is None else form.format(report[key]) for _, key, form in COLUMNS])
+    widths = [max(len(row[i]) for row in rows) for i in range(len(COLUMNS))]
+    lines = ["  ".join(cell.ljust(width) if i == 0 else cell.rjust(width)
+                       for i, (cell, width) in enumerate(zip(row, widths))) for row in rows]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def load_script(path):
+    """Import one of the repository scripts by its path relative to the
+    root, with its directory on sys.path for its sibling imports."""
+    path = os.path.join(REPO_ROOT, path)
+    directory = os.path.dirname(path)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    name = "profiled_" + os.path.relpath(path, REPO_ROOT).replace(os.sep, "_").replace(".", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ROCK_ALLOWED = [(1, 0), (2, 0), (3, 0), (1, 1), (2, 1), (0, 2), (2, 2), (4, 2), (1, 3), (3, 3), (4, 3), (0, 4),
+                (2, 4), (2, 5), (3, 5), (0, 6), (2, 6), (1, 7), (3, 7)]
+MOLECULE_OBSTACLES = [[0, 1], [1, 1], [1, 3], [2, 5], [3, 1], [3, 6], [4, 2], [5, 6], [6, 1], [6, 2], [6, 3],
+                      [7, 3], [7, 6], [8, 5]]
+
+# (label, script, instance built from the loaded module)
+REPO_HEURISTICS = (
+    ("Pacman", "Tests/Test2/InformedPacman.py",
+     lambda m: m.Pacman(3, (0, 0, "istok", ((2, 2), (7, 3), (5, 8))))),
+    ("Snake", "Labs/Lab1/snakeInformed.py",
+     lambda m: m.Snake(2, ((0, 7), ((0, 8), (0, 9)), "down", ((2, 5), (4, 7))))),
+    ("GhostOnSkates (primerKol)", "ExamsPractice/primerKol/ghostSkates.py",
+     lambda m: m.GhostOnSkates((0, 0), [(1, 1), (3, 2), (2, 4), (5, 3)], 7, (6, 6))),
+    ("GhostOnSkates (Aud6)", "Auds/Aud6/Vezhbi1/GhostOnSkates.py",
+     lambda m: m.GhostOnSkates((0, 0), [(1, 1), (3, 2), (2, 4), (5, 3)], 7, (6, 6))),
+    ("Rock", "ExamsPractice/IspitJun/kachuvachkoCoveche.py",
+     lambda m: m.Rock(ROCK_ALLOWED, ((2, 0), (1, 8, "desno")))),
+    ("Football", "ExamsPractice/vezhbi/Soccer.py",
+     lambda m: m.Football(((3, 3), (5, 3)), ((0, 2), (1, 2)), ((7, 2), (7, 3)))),
+    ("Stars", "Auds/Aud3/stars.py",
+     lambda m: m.Stars((0, 0, 2, 0, ((1, 1), (4, 3), (6, 6))))),
+    ("Puzzle (misplaced)", "Auds/Aud4/puzzle.py",
+     lambda m: m.Puzzle("1234*5786", "*12345678")),
+    ("Puzzle_h2 (Manhattan)", "Auds/Aud4/puzzle.py",
+     lambda m: m.Puzzle_h2("1234*5786", "*12345678")),
+    ("Molecule", "Auds/Aud4/Molekuli.py",
+     lambda m: m.Molecule(MOLECULE_OBSTACLES, (2, 1, 7, 2, 4, 4))),
+    ("Explorer", "Auds/Aud4/choveche.py",
+     lambda m: m.Explorer((0, 2, (2, 5, -1), (5, 0, 1)), [7, 4])),
+    ("Farmer", "Auds/Aud4/farmer.py",
+     lambda m: m.Farmer(("e", "e", "e", "e"), ("w", "w", "w", "w"))),
+    ("RiverCrossing", "Auds/Aud4/farmer.py",
+     lambda m: m.RiverCrossing(["farmer", "volk", "jare", "zelka"],
+                               rules=[(("volk", "jare"), ("farmer",)), (("jare", "zelka"), ("farmer",))],
+                               capacity=2, drivers=["farmer"])),
+)
+
+
+def profile_repository(samples=500, max_states=200000, seed=0):
+    reports = []
+    for label, script, build in REPO_HEURISTICS:
+        problem = build(load_script(script))
+        reports.append(profile_heuristic(problem, name=label, samples=samples, max_states=max_states, seed=seed))
+    return reports
+
+
+if __name__ == "__main__":
+    print(format_table(profile_repository()))
@@ -0,0 +1,250 @@
+"""
+Hierarchical path-finding (HPA*) on top of GridWorld.
+
+The grid is split into square clusters. Wherever a move crosses from one
+cluster into another, the crossing cells are grouped into entrances and one
+or two representative crossings per entrance become nodes of an abstract
+graph. Nodes of the same cluster are linked with the cost of the shortest
+path that stays inside the cluster. A query searches this small graph and
+only then turns the abstract path into grid cells, one cluster at a time.
+
+The abstraction is cached per map, so it is built once for all queries.
+"""
+
+import heapq
+
+import numpy as np
+
+from searching_framework.dstar_lite import default_heuristic
+from searching_framework.gridworld import MOVES_4
+
+INFINITY = float("inf")
+
+# entrances longer than this get a crossing at both ends instead of one in the middle
+LONG_ENTRANCE = 6
+
+# abstractions per map, see hierarchical_planner
+ABSTRACTION_CACHE = {}
+
+
+class HierarchicalPlanner:
+    def __init__(self, grid, cluster_size=10, moves=MOVES_4):
+        """Build the abstract graph for a grid. Use hierarchical_planner to
+        get a cached instance.
+        :param grid: GridWorld; it must not change afterwards
+        :param cluster_size: side of the square clusters
+        :param moves: tuple of (dx, dy) moves, jumps included
+        """
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.moves = tuple(moves)
+        self.h = default_heuristic(grid, self.moves)
+        self.costs = grid.costs.reshape(-1).tolist()
+        self.succ = [[cell for cell in row if cell >= 0] for row in grid.neighbours(self.moves).tolist()]
+        reverse = tuple((-dx, -dy) for dx, dy in self.moves)
+        self.pred = [[cell for cell in row if cell >= 0] for row in grid.neighbours(reverse).tolist()]
+        ys, xs = np.divmod(np.arange(grid.size), grid.width)
+        columns = -(-grid.width // cluster_size)
+        self.cluster = ((ys // cluster_size) * columns + xs // cluster_size).tolist()
+        # abstract graph: edges[node] -> {node: cost}
+        self.edges = {}
+        # cluster -> abstract nodes inside it
+        self.members = {}
+        # refined paths between nodes of one cluster, filled in lazily
+        self.segments = {}
+        self.build()
+
+    def build(self):
+        free = self.grid.free.reshape(-1).tolist()
+        crossings = {}
+        for cell, is_free in enumerate(free):
+            if not is_free:
+                continue
+            for target in self.succ[cell]:
+                if self.cluster[target] != self.cluster[cell]:
+                    crossings.setdefault((self.cluster[cell], self.cluster[target]), []).append((cell, target))
+        for group in crossings.values():
+            for entrance in self.entrances(group):
+                picked = [entrance[len(entrance) // 2]]
+                if len(entrance) > LONG_ENTRANCE:
+                    picked = [entrance[0], entrance[-1]]
+                for cell, target in picked:
+                    self.add_node(cell)
+                    self.add_node(target)
+                    self.edges[cell][target] = self.costs[target]
+        for cluster, nodes in self.members.items():
+            for node in nodes:
+                distances, _ = self.cluster_search(node, nodes)
+                for other in nodes:
+                    if other != node and other in distances:
+                        cost = distances[other]
+                        if cost < self.edges[node].get(other, INFINITY):
+                            self.edges[node][other] = cost
+
+    def entrances(self, crossings):
+        """Split the crossings between two clusters into entrances: runs whose
+        source cells touch each other along the border."""
+        width = self.grid.width
+        crossings.sort()
+        groups = []
+        for cell, target in crossings:
+            if groups:
+                last = groups[-1][-1][0]
+                ly, lx = divmod(last, width)
+                cy, cx = divmod(cell, width)
+                if abs(lx - cx) <= 1 and abs(ly - cy) <= 1:
+                    groups[-1].append((cell, target))
+                    continue
+            groups.append([(cell, target)])
+        return groups
+
+    def add_node(self, cell):
+        if cell not in self.edges:
+            self.edges[cell] = {}
+            self.members.setdefault(self.cluster[cell], []).append(cell)
+
+    def cluster_search(self, source, targets, reverse=False):
+        """Dijkstra from source that never leaves the cluster of source. With
+        reverse=True it follows the moves backwards, i.e. it finds the
+        distances from the cells to source.
+        :return: (distances, parents) dictionaries over the visited cells
+        :rtype: tuple
+        """
+        cluster = self.cluster[source]
+        succ = self.pred if reverse else self.succ
+        costs = self.costs
+        distances = {source: 0}
+        parents = {source: None}
+        remaining = set(targets)
+        remaining.discard(source)
+        heap = [(0, source)]
+        while heap and remaining:
+            d, cell = heapq.heappop(heap)
+            if d > distances[cell]:
+                continue
+            remaining.discard(cell)
+            for target in succ[cell]:
+                if self.cluster[target] != cluster:
+                    continue
+                new_d = d + (costs[cell] if reverse else costs[target])
+                if new_d < distances.get(target, INFINITY):
+                    distances[target] = new_d
+                    parents[target] = cell
+                    heapq.heappush(heap, (new_d, target))
+        return distances, parents
+
+    def plan(self, start, goal):
+        """Search the abstract graph. Start and goal are linked into it only
+        for this query.
+        :param start: (x, y)
+        :param goal: (x, y)
+        :return: (waypoints, cost) with the packed cells of the abstract path,
+                 or (None, infinity) if there is none
+        :rtype: tuple
+        """
+        grid = self.grid
+        start, goal = grid.cell(*start), grid.cell(*goal)
+        if not (grid.free.flat[start] and grid.free.flat[goal]):
+            return None, INFINITY
+        extra = {}
+        to_goal = {}
+        nodes = self.members.get(self.cluster[start], [])
+        distances, _ = self.cluster_search(start, nodes + [goal])
+        extra[start] = {node: distances[node] for node in nodes if node in distances}
+        if goal in distances:
+            extra[start][goal] = distances[goal]
+        nodes = self.members.get(self.cluster[goal], [])
+        distances, _ = self.cluster_search(goal, nodes, reverse=True)
+        for node in nodes:
+            if node in distances:
+                to_goal[node] = distances[node]
+
+        def neighbours(node):
+            if node in extra:
+                yield from extra[node].items()
+            yield from self.edges.get(node, {}).items()
+            if node in to_goal:
+                yield goal, to_goal[node]
+
+        g = {start: 0}
+        parents = {start: None}
+        heap = [(self.h(start, goal), start)]
+        while heap:
+            f, node = heapq.heappop(heap)
+            if node == goal:
+                waypoints = []
+                while node is not None:
+                    waypoints.append(node)
+                    node = parents[node]
+                waypoints.reverse()
+                return waypoints, g[goal]
+            if f - self.h(node, goal) > g[node]:
+                continue
+            for other, cost in neighbours(node):
+                new_g = g[node] + cost
+                if new_g < g.get(other, INFINITY):
+                    g[other] = new_g
+                    parents[other] = node
+                    heapq.heappush(heap, (new_g + self.h(other, goal), other))
+        return None, INFINITY
+
+    def refine(self, waypoints):
+        """Turn abstract waypoints into grid cells, one segment at a time, so
+        an agent can start moving before the whole path is known. Segments
+        inside a cluster are cached.
+        :param waypoints: packed cells from plan()
+        :return: generator of (x, y) cells, the start included
+        """
+        position = self.grid.position
+        yield position(waypoints[0])
+        for a, b in zip(waypoints, waypoints[1:]):
+            if self.cluster[a] != self.cluster[b]:
+                yield position(b)
+                continue
+            key = (a, b)
+            if key not in self.segments:
+                _, parents = self.cluster_search(a, [b])
+                segment = []
+                cell = b
+                while cell != a:
+                    segment.append(cell)
+                    cell = parents[cell]
+                segment.reverse()
+                self.segments[key] = segment
+            for cell in self.segments[key]:
+                yield position(cell)
+
+    def flat_path(self, start, goal):
+        """Exact path read off the grid distance field to the goal. Used when
+        the abstraction misses a path: a crossing that was not picked as a
+        representative, or one-way moves that leave a cluster and come back.
+        """
+        grid = self.grid
+        distances = grid.distances([goal], self.moves, reverse=True).tolist()
+        cell = grid.cell(*start)
+        if distances[cell] == INFINITY:
+            return None
+        path = [start]
+        while distances[cell] > 0:
+            cell = next(s for s in self.succ[cell] if distances[s] + self.costs[s] == distances[cell])
+            path.append(grid.position(cell))
+        return path
+
+    def find_path(self, start, goal):
+        """Path found through the abstraction, as a list of (x, y) cells from
+        start to goal, or None if the goal can not be reached."""
+        waypoints, _ = self.plan(start, goal)
+        if waypoints is None:
+            return self.flat_path(start, goal)
+        return list(self.refine(waypoints))
+
+
+def hierarchical_planner(grid, cluster_size=10, moves=MOVES_4):
+    """HierarchicalPlanner for the grid, built once per map and reused.
+    :rtype: HierarchicalPlanner
+    """
+    moves = tuple(moves)
+    key = (grid.width, grid.height, grid.free.tobytes(), grid.costs.tobytes(), moves, cluster_size)
+    if key not in ABSTRACTION_CACHE:
+        ABSTRACTION_CACHE[key] = HierarchicalPlanner(grid, cluster_size, moves)
+    return ABSTRACTION_CACHE[key]
@@ -0,0 +1,172 @@
+import numpy as np
+
+from searching_framework.utils import Node, PriorityQueue, pack_nodes, unpack_nodes
+
+"""
+Информирано пребарување во рамки на граф, со можност за checkpoint.
+Ако е зададен checkpoint (Checkpointer), состојбата на пребарувањето
+периодично се запишува на диск и може да се продолжи со resume_search.
+"""
+
+
+def memoize(fn, slot=None):
+    """ Запамети ја пресметаната вредност за која била листа од
+    аргументи. Ако е специфициран slot, зачувај го резултатот во
+    тој slot на првиот аргумент. Ако slot е None, зачувај ги
+    резултатите во речник.
+
+    :param fn: зададена функција
+    :type fn: function
+    :param slot: име на атрибут во кој се чуваат резултатите од функцијата
+    :type slot: str
+    :return: функција со модификација за зачувување на резултатите
+    :rtype: function
+    """
+    if slot:
+        def memoized_fn(obj, *args):
+            if hasattr(obj, slot):
+                return getattr(obj, slot)
+            else:
+                val = fn(obj, *args)
+                setattr(obj, slot, val)
+                return val
+    else:
+        def memoized_fn(*args):
+            if args not in memoized_fn.cache:
+                memoized_fn.cache[args] = fn(*args)
+            return memoized_fn.cache[args]
+
+        memoized_fn.cache = {}
+    return memoized_fn
+
+
+def best_first_graph_search(problem, f, f_batch=None, checkpoint=None, resume=None, algorithm="best_first"):
+    """Пребарувај низ следбениците на даден проблем за да најдеш цел. Користи
+     функција за евалуација за да се одлучи кој е сосед најмногу ветува и
+     потоа да се истражи. Ако до дадена состојба стигнат два пата, употреби
+     го најдобриот пат.
+
+    :param problem: даден проблем
+    :type problem: Problem
+    :param f: дадена функција за евалуација (проценка)
+    :type f: function
+    :param f_batch: опционална функција која ги проценува сите деца од едно
+                    проширување со еден повик и враќа листа од f вредности
+    :type f_batch: function
+    :param checkpoint: каде и колку често да се зачувува состојбата
+    :type checkpoint: Checkpointer
+    :param resume: вчитан checkpoint од кој се продолжува
+    :type resume: dict
+    :param algorithm: име на алгоритмот што се запишува во checkpoint
+    :type algorithm: str
+    :return: Node or None
+    :rtype: Node
+    """
+    f = memoize(f, 'f')
+    frontier = PriorityQueue(min, f)
+    if resume is None:
+        node = Node(problem.initial)
+        if problem.goal_test(node.state):
+            return node
+        frontier.append(node)
+        # јазлите во frontier според нивната состојба
+        in_frontier = {node.state: node}
+        explored = set()
+        expanded = 0
+    else:
+        nodes = unpack_nodes(resume["nodes"])
+        # редоследот и f вредностите во frontier остануваат исти како при зачувувањето
+        for value, i in resume["frontier"]:
+            nodes[i].f = value
+            frontier.data.append((value, nodes[i]))
+        in_frontier = {state: nodes[i] for state, i in resume["in_frontier"].items()}
+        explored = resume["explored"]
+        expanded = resume["expanded"]
+    while frontier:
+        node = frontier.pop()
+        if in_frontier.get(node.state) is not node:
+            # јазелот бил заменет со подобар пат до истата состојба
+            continue
+        if problem.goal_test(node.state):
+            return node
+        del in_frontier[node.state]
+        explored.add(node.state)
+        children = node.expand(problem)
+        if f_batch is not None:
+            fresh = [child for child in children if child.state not in explored]
+            # вредностите се запишуваат во слотот 'f', па memoize повеќе не ја повикува f
+            for child, value in zip(fresh, f_batch(fresh) if fresh else ()):
+                child.f = value
+        for child in children:
+            if child.state not in explored and child.state not in in_frontier:
+                frontier.append(child)
+                in_frontier[child.state] = child
+            elif child.state in in_frontier:
+                incumbent = in_frontier[child.state]
+                if f(child) < f(incumbent):
+                    frontier.append(child)
+                    in_frontier[child.state] = child
+        expanded += 1
+        if checkpoint is not None and checkpoint.due():
+            table, index = pack_nodes(item for _, item in frontier.data)
+            checkpoint.save({
+                "algorithm": algorithm,
+                "initial": problem.initial,
+                "nodes": table,
+                "frontier": [(value, index[id(item)]) for value, item in frontier.data],
+                "in_frontier": {state: index[id(item)] for state, item in in_frontier.items()},
+                "explored": explored,
+                "expanded": expanded,
+            })
+    return None
+
+
+def greedy_best_first_graph_search(problem, h=None, checkpoint=None, resume=None):
+    """ Greedy best-first пребарување се остварува ако се специфицира дека f(n) = h(n).
+
+    Ако h не е зададена, а проблемот има метод h_batch(states), децата од
+    секое проширување се проценуваат заедно со еден NumPy повик.
+
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика
+    :type h: function
+    :param checkpoint: каде и колку често да се зачувува состојбата
+    :type checkpoint: Checkpointer
+    :param resume: вчитан checkpoint од кој се продолжува
+    :type resume: dict
+    :return: Node or None
+    """
+    h_batch = None if h else getattr(problem, 'h_batch', None)
+    h = memoize(h or problem.h, 'h')
+    f_batch = None
+    if h_batch is not None:
+        def f_batch(nodes):
+            return np.asarray(h_batch([n.state for n in nodes])).tolist()
+    return best_first_graph_search(problem, h, f_batch, checkpoint, resume, "greedy")
+
+
+def astar_search(problem, h=None, checkpoint=None, resume=None):
+    """ A* пребарување е best-first graph пребарување каде f(n) = g(n) + h(n).
+
+    Ако h не е зададена, а проблемот има метод h_batch(states), децата од
+    секое проширување се проценуваат заедно со еден NumPy повик.
+
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика
+    :type h: function
+    :param checkpoint: каде и колку често да се зачувува состојбата
+    :type checkpoint: Checkpointer
+    :param resume: вчитан checkpoint од кој се продолжува
+    :type resume: dict
+    :return: Node or None
+    """
+    h_batch = None if h else getattr(problem, 'h_batch', None)
+    h = memoize(h or problem.h, 'h')
+    f_batch = None
+    if h_batch is not None:
+        def f_batch(nodes):
+            values = np.asarray(h_batch([n.state for n in nodes])).tolist()
+            return [n.path_cost + value for n, value in zip(nodes, values)]
+    return best_first_graph_search(problem, lambda n: n.path_cost + h(n), f_batch, checkpoint, resume, "astar")
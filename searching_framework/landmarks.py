@@ -0,0 +1,195 @@
+"""
+ALT (A*, landmarks, triangle inequality) heuristics.
+
+For a landmark L the triangle inequality gives two lower bounds on the cost
+from v to the goal t: d(v, L) - d(t, L) and d(L, t) - d(L, v). The
+heuristic is the largest of these over a handful of landmarks chosen by
+farthest-point selection. Distances are exact and stored as uint16 arrays,
+one row per landmark; costs are assumed to be integers.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from searching_framework.gridworld import MOVES_4
+
+UNREACHABLE = np.iinfo(np.uint16).max
+
+# landmark tables per board, see grid_landmarks
+LANDMARK_CACHE = {}
+
+
+def pack(distances):
+    """Store a distance field as uint16, UNREACHABLE where it is infinite."""
+    distances = np.asarray(distances, dtype=np.float64)
+    finite = np.isfinite(distances)
+    if finite.any() and distances[finite].max() >= UNREACHABLE:
+        raise ValueError("Distances do not fit in uint16")
+    table = np.full(len(distances), UNREACHABLE, dtype=np.uint16)
+    table[finite] = distances[finite]
+    return table
+
+
+def farthest_landmarks(distances_from, first, k):
+    """Farthest-point selection: start from the cell farthest from first, then
+    keep adding the cell whose distance to the nearest landmark is largest.
+    :param distances_from: function cell -> float array of distances from it
+    :param first: any reachable cell
+    :param k: number of landmarks
+    :return: list of cells
+    :rtype: list
+    """
+    field = distances_from(first)
+    reachable = np.isfinite(field)
+    nearest = np.where(reachable, field, -1.0)
+    landmarks = []
+    for _ in range(k):
+        candidate = int(np.argmax(nearest))
+        if nearest[candidate] <= 0 and landmarks:
+            break
+        landmarks.append(candidate)
+        field = distances_from(candidate)
+        nearest = np.minimum(nearest, np.where(reachable, field, -1.0))
+    return landmarks
+
+
+class Landmarks:
+    def __init__(self, landmarks, forward, backward, index):
+        """
+        :param landmarks: landmark cells
+        :param forward: uint16 array (k, cells) with d(L, v)
+        :param backward: uint16 array (k, cells) with d(v, L)
+        :param index: function state -> cell, None for states it does not know
+        """
+        self.landmarks = landmarks
+        self.forward = forward
+        self.backward = backward
+        self.index = index
+        self.goal_cache = {}
+
+    def goal_table(self, goal):
+        """ALT bound from every cell to the goal cell, computed once per goal.
+        :param goal: goal cell
+        :return: list of lower bounds indexed by cell
+        :rtype: list
+        """
+        if goal not in self.goal_cache:
+            forward = self.forward.astype(np.int32)
+            backward = self.backward.astype(np.int32)
+            known = (forward != UNREACHABLE) & (forward[:, goal:goal + 1] != UNREACHABLE)
+            ahead = np.where(known, forward[:, goal:goal + 1] - forward, 0)
+            known = (backward != UNREACHABLE) & (backward[:, goal:goal + 1] != UNREACHABLE)
+            behind = np.where(known, backward - backward[:, goal:goal + 1], 0)
+            bound = np.maximum(np.maximum(ahead, behind).max(axis=0), 0)
+            self.goal_cache[goal] = bound.tolist()
+        return self.goal_cache[goal]
+
+    def heuristic(self, goal, base=None):
+        """Admissible h(node) for astar_search towards the given goal state.
+        :param goal: goal state
+        :param base: optional admissible h(node) of the problem itself; the
+                     larger of the two estimates is used
+        :return: function h(node)
+        :rtype: function
+        """
+        goal = self.index(goal)
+        if goal is None:
+            raise ValueError("The goal state is not in the landmark tables")
+        table = self.goal_table(goal)
+        index = self.index
+
+        def h(node):
+            cell = index(node.state)
+            value = 0 if cell is None else table[cell]
+            return value if base is None else max(value, base(node))
+        return h
+
+
+def grid_landmarks(grid, k=4, moves=MOVES_4, index=None):
+    """Landmark tables for a GridWorld, cached per board and move set.
+    :param grid: GridWorld
+    :param k: number of landmarks
+    :param moves: tuple of (dx, dy) moves
+    :param index: function state -> packed cell; by default the state starts
+                  with (x, y)
+    :return: Landmarks
+    :rtype: Landmarks
+    """
+    moves = tuple(moves)
+    key = (grid.width, grid.height, grid.free.tobytes(), grid.costs.tobytes(), moves, k)
+    if key not in LANDMARK_CACHE:
+        free = np.flatnonzero(grid.free.ravel())
+        if free.size == 0:
+            raise ValueError("The grid has no free cells")
+        # spread the landmarks out ignoring move direction, otherwise on
+        # one-way boards they all pile up where the moves lead
+        both = tuple(dict.fromkeys(moves + tuple((-dx, -dy) for dx, dy in moves)))
+        landmarks = farthest_landmarks(lambda cell: grid.distances([grid.position(cell)], both),
+                                       int(free[0]), k)
+        forward = np.stack([pack(grid.distances([grid.position(cell)], moves)) for cell in landmarks])
+        backward = np.stack([pack(grid.distances([grid.position(cell)], moves, reverse=True))
+                             for cell in landmarks])
+        LANDMARK_CACHE[key] = (landmarks, forward, backward)
+    landmarks, forward, backward = LANDMARK_CACHE[key]
+    if index is None:
+        def index(state):
+            return grid.cell(state[0], state[1])
+    return Landmarks(landmarks, forward, backward, index)
+
+
+def compile_graph(problem):
+    """Enumerate every state reachable from problem.initial.
+    :param problem: Problem with successor()
+    :return: (states, index, successors) where successors[i] lists the
+             indices reachable from states[i] in one step
+    :rtype: tuple
+    """
+    states = [problem.initial]
+    index = {problem.initial: 0}
+    successors = []
+    i = 0
+    while i < len(states):
+        row = []
+        for state in problem.successor(states[i]).values():
+            if state not in index:
+                index[state] = len(states)
+                states.append(state)
+            row.append(index[state])
+        successors.append(row)
+        i += 1
+    return states, index, successors
+
+
+def graph_distances(successors, source):
+    distances = np.full(len(successors), np.inf)
+    distances[source] = 0
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        step = distances[current] + 1
+        for nxt in successors[current]:
+            if distances[nxt] == np.inf:
+                distances[nxt] = step
+                queue.append(nxt)
+    return distances
+
+
+def graph_landmarks(problem, k=4):
+    """Landmark tables over the compiled state graph of a small problem with
+    unit step costs. States the compiled graph does not contain get h = 0.
+    :param problem: Problem with successor()
+    :param k: number of landmarks
+    :return: Landmarks
+    :rtype: Landmarks
+    """
+    states, index, successors = compile_graph(problem)
+    predecessors = [[] for _ in states]
+    for i, row in enumerate(successors):
+        for j in row:
+            predecessors[j].append(i)
+    both = [row + back for row, back in zip(successors, predecessors)]
+    landmarks = farthest_landmarks(lambda cell: graph_distances(both, cell), 0, k)
+    forward = np.stack([pack(graph_distances(successors, cell)) for cell in landmarks])
+    backward = np.stack([pack(graph_distances(predecessors, cell)) for cell in landmarks])
+    return Landmarks(landmarks, forward, backward, index.get)
@@ -0,0 +1,225 @@
+"""
+Local search over Problem.value(state): hill climbing, simulated annealing
+and a genetic algorithm, for instances where complete search is hopeless.
+
+The problem provides
+    successor(state)     the neighbourhood, as for the other searches
+    value(state)         the quantity to maximize
+    random_state(rng)    a random starting state, for the restarts
+and for genetic_algorithm additionally
+    gene_pool            the values a gene can take (states are fixed-length
+                         sequences of genes)
+    value_batch(array)   optional, values of a whole population at once,
+                         one individual per row
+
+Restarts run in forked worker processes when workers > 1, so the problem
+does not have to be picklable, but the states it returns do.
+"""
+
+import math
+import multiprocessing
+import random
+
+import numpy as np
+
+
+def best_neighbour(problem, neighbours):
+    best, best_value = None, -math.inf
+    for neighbour in neighbours:
+        value = problem.value(neighbour)
+        if value > best_value:
+            best, best_value = neighbour, value
+    return best, best_value
+
+
+def hill_climbing(problem, state=None, rng=random, stochastic=False, max_steps=100000):
+    """Steepest-ascent hill climbing, or stochastic hill climbing that moves
+    to a random uphill neighbour.
+    :param problem: problem with successor() and value()
+    :param state: starting state, problem.initial if None
+    :param rng: random.Random used by the stochastic variant
+    :param stochastic: pick a random uphill neighbour instead of the best one
+    :param max_steps: upper bound on the number of moves
+    :return: (state, value) of the local maximum that was reached
+    :rtype: tuple
+    """
+    current = problem.initial if state is None else state
+    value = problem.value(current)
+    for _ in range(max_steps):
+        neighbours = problem.successor(current).values()
+        if stochastic:
+            uphill = [(neighbour, v) for neighbour in neighbours for v in [problem.value(neighbour)] if v > value]
+            if not uphill:
+                break
+            current, value = rng.choice(uphill)
+        else:
+            best, best_value = best_neighbour(problem, neighbours)
+            if best is None or best_value <= value:
+                break
+            current, value = best, best_value
+    return current, value
+
+
+def stochastic_hill_climbing(problem, state=None, rng=random, max_steps=100000):
+    return hill_climbing(problem, state, rng, True, max_steps)
+
+
+class ExponentialSchedule:
+    """T(t) = k * exp(-lam * t), zero after limit steps."""
+
+    def __init__(self, k=20, lam=0.005, limit=1000):
+        self.k, self.lam, self.limit = k, lam, limit
+
+    def __call__(self, t):
+        return self.k * math.exp(-self.lam * t) if t < self.limit else 0
+
+
+class LinearSchedule:
+    """T(t) falls linearly from t0 to zero at limit."""
+
+    def __init__(self, t0=20, limit=1000):
+        self.t0, self.limit = t0, limit
+
+    def __call__(self, t):
+        return self.t0 * (1 - t / self.limit) if t < self.limit else 0
+
+
+class LogarithmicSchedule:
+    """T(t) = c / log(t + 2), zero after limit steps."""
+
+    def __init__(self, c=20, limit=1000):
+        self.c, self.limit = c, limit
+
+    def __call__(self, t):
+        return self.c / math.log(t + 2) if t < self.limit else 0
+
+
+def simulated_annealing(problem, state=None, rng=random, schedule=None):
+    """Simulated annealing: move to a random neighbour, always if it is
+    better and with probability exp(delta / T) if it is worse.
+    :param problem: problem with successor() and value()
+    :param state: starting state, problem.initial if None
+    :param rng: random.Random for the moves
+    :param schedule: temperature as a function of the step, ExponentialSchedule()
+                     if None; the search stops when it reaches zero
+    :return: (state, value) of the best state seen
+    :rtype: tuple
+    """
+    schedule = schedule or ExponentialSchedule()
+    current = problem.initial if state is None else state
+    value = problem.value(current)
+    best, best_value = current, value
+    t = 0
+    while True:
+        temperature = schedule(t)
+        if temperature <= 0:
+            break
+        neighbours = list(problem.successor(current).values())
+        if not neighbours:
+            break
+        candidate = rng.choice(neighbours)
+        candidate_value = problem.value(candidate)
+        delta = candidate_value - value
+        if delta > 0 or rng.random() < math.exp(delta / temperature):
+            current, value = candidate, candidate_value
+            if value > best_value:
+                best, best_value = current, value
+        t += 1
+    return best, best_value
+
+
+# the problem of the forked restart workers, set by set_worker_problem
+WORKER_PROBLEM = None
+
+
+def set_worker_problem(problem):
+    global WORKER_PROBLEM
+    WORKER_PROBLEM = problem
+
+
+def run_restart(task):
+    search, seed, options = task
+    rng = random.Random(seed)
+    state = WORKER_PROBLEM.random_state(rng)
+    return search(WORKER_PROBLEM, state, rng, **options)
+
+
+def random_restarts(problem, search=hill_climbing, restarts=10, workers=1, seed=None, **options):
+    """Run a local search from several random starting states and keep the
+    best result. Restart i uses random.Random(seed + i), so the result does
+    not depend on the number of workers.
+    :param problem: problem with random_state(rng)
+    :param search: hill_climbing, stochastic_hill_climbing or simulated_annealing
+    :param restarts: number of starting states
+    :param workers: number of processes
+    :param seed: base seed, random if None
+    :param options: passed on to search, e.g. schedule=LinearSchedule()
+    :return: (state, value) of the best local maximum
+    :rtype: tuple
+    """
+    if seed is None:
+        seed = random.randrange(1 << 30)
+    tasks = [(search, seed + i, options) for i in range(restarts)]
+    if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+        with context.Pool(workers, initializer=set_worker_problem, initargs=(problem,)) as pool:
+            results = pool.map(run_restart, tasks)
+    else:
+        set_worker_problem(problem)
+        results = [run_restart(task) for task in tasks]
+    return max(results, key=lambda result: result[1])
+
+
+def population_values(problem, population):
+    value_batch = getattr(problem, "value_batch", None)
+    if value_batch is not None:
+        return np.asarray(value_batch(population), dtype=np.float64)
+    return np.array([problem.value(tuple(row.tolist())) for row in population], dtype=np.float64)
+
+
+def genetic_algorithm(problem, population_size=100, generations=500, mutation_rate=0.01,
+                      elite=2, tournament=3, target=None, seed=None):
+    """Genetic algorithm on fixed-length gene sequences. The population is a
+    NumPy array with one individual per row; selection (tournaments),
+    one-point crossover and mutation work on the whole array at once and the
+    fitness of a generation is one value_batch call when the problem has it.
+    :param problem: problem with gene_pool, value() and optionally value_batch()
+    :param population_size: number of individuals
+    :param generations: number of generations
+    :param mutation_rate: probability that a gene is replaced by a random one
+    :param elite: number of best individuals copied to the next generation
+    :param tournament: individuals compared in every selection
+    :param target: stop as soon as an individual reaches this value
+    :param seed: seed for numpy.random.default_rng
+    :return: (state, value) of the best individual, state as a tuple
+    :rtype: tuple
+    """
+    rng = np.random.default_rng(seed)
+    gene_pool = np.asarray(problem.gene_pool)
+    length = len(problem.initial)
+    population = gene_pool[rng.integers(len(gene_pool), size=(population_size, length))]
+    population[0] = problem.initial
+    columns = np.arange(length)
+    best, best_value = None, -math.inf
+    for _ in range(generations):
+        values = population_values(problem, population)
+        order = np.argsort(values)[::-1]
+        if values[order[0]] > best_value:
+            best, best_value = population[order[0]].copy(), float(values[order[0]])
+        if target is not None and best_value >= target:
+            break
+        contestants = rng.integers(population_size, size=(population_size, tournament))
+        winners = contestants[np.arange(population_size), np.argmax(values[contestants], axis=1)]
+        mothers, fathers = population[winners[0::2]], population[winners[1::2]]
+        pairs = min(len(mothers), len(fathers))
+        mothers, fathers = mothers[:pairs], fathers[:pairs]
+        cut = rng.integers(1, max(length, 2), size=(pairs, 1))
+        left = columns < cut
+        children = np.concatenate([np.where(left, mothers, fathers), np.where(left, fathers, mothers)])
+        mutate = rng.random(children.shape) < mutation_rate
+        children[mutate] = gene_pool[rng.integers(len(gene_pool), size=int(mutate.sum()))]
+        population = np.concatenate([population[order[:elite]], children])[:population_size]
+        if len(population) < population_size:
+            extra = gene_pool[rng.integers(len(gene_pool), size=(population_size - len(population), length))]
+            population = np.concatenate([population, extra])
+    return tuple(best.tolist()), best_value
@@ -0,0 +1,208 @@
+"""
+Layer-synchronous breadth-first search over several worker processes.
+
+The visited set is split by hash(state) into one partition per worker and
+every worker owns its partition: the states it first reached, their parent
+links and its part of the current frontier. For every layer each worker
+expands its own frontier, buckets the children by owner and puts every
+bucket straight into the inbox queue of its owner. The owners then drop the
+states they have already seen and keep the rest as their part of the next
+layer. The calling process only coordinates the layers: neither the
+frontier nor the children pass through it.
+
+The workers are forked, so the problem does not have to be picklable and
+hash() agrees between processes. Where fork is not available (Windows) the
+same partitions run one after another in the calling process.
+"""
+
+import multiprocessing
+import os
+import queue
+
+from searching_framework.utils import Node
+
+
+class Partition:
+    def __init__(self, problem, index, inboxes):
+        """The part of the search owned by one worker.
+        :param problem: the problem being solved
+        :param index: number of this partition
+        :param inboxes: one queue per partition that the buckets for it are
+                        put into
+        """
+        self.problem = problem
+        self.index = index
+        self.count = len(inboxes)
+        self.inboxes = inboxes
+        # state -> (parent state, action), None for the initial state
+        self.parents = {}
+        self.frontier = []
+        self.own = []
+
+    def seed(self, state):
+        self.parents[state] = None
+        self.frontier = [state]
+
+    def expand(self):
+        """Expand the owned frontier, bucket the children by owner and send
+        every other partition its bucket. Children owned by this partition
+        that it has already seen are dropped here.
+        :return: number of generated children
+        :rtype: int
+        """
+        count, index, parents = self.count, self.index, self.parents
+        buckets = [[] for _ in range(count)]
+        generated = set()
+        for state in self.frontier:
+            for action, child in self.problem.successor(state).items():
+                if child in generated:
+                    continue
+                generated.add(child)
+                owner = hash(child) % count
+                if owner == index and child in parents:
+                    continue
+                buckets[owner].append((child, state, action))
+        self.frontier = []
+        for owner, bucket in enumerate(buckets):
+            if owner != index:
+                self.inboxes[owner].put(bucket)
+        self.own = buckets[index]
+        return len(generated)
+
+    def merge(self):
+        """Receive the buckets of the other partitions and keep the children
+        this partition has not seen before as its part of the next layer.
+        Must be called after every partition has expanded the layer.
+        :return: (number of new states, a goal state among them or None)
+        :rtype: tuple
+        """
+        parents, goal_test = self.parents, self.problem.goal_test
+        inbox = self.inboxes[self.index]
+        buckets = [self.own] + [inbox.get() for _ in range(self.count - 1)]
+        self.own = []
+        goal = None
+        for bucket in buckets:
+            for child, parent, action in bucket:
+                if child not in parents:
+                    parents[child] = (parent, action)
+                    self.frontier.append(child)
+                    if goal is None and goal_test(child):
+                        goal = child
+        return len(self.frontier), goal
+
+    def parent(self, state):
+        return self.parents.get(state)
+
+
+def serve(connection, problem, index, inboxes):
+    partition = Partition(problem, index, inboxes)
+    while True:
+        message, payload = connection.recv()
+        if message == "stop":
+            break
+        connection.send(getattr(partition, message)(*payload))
+
+
+class RemotePartition:
+    """Calls the methods of a Partition that lives in a worker process."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def send(self, message, *payload):
+        self.connection.send((message, payload))
+
+    def receive(self):
+        return self.connection.recv()
+
+    def call(self, message, *payload):
+        self.send(message, *payload)
+        return self.receive()
+
+
+class LocalPartition:
+    """Same interface as RemotePartition for a Partition in this process."""
+
+    def __init__(self, partition):
+        self.partition = partition
+        self.result = None
+
+    def send(self, message, *payload):
+        self.result = getattr(self.partition, message)(*payload)
+
+    def receive(self):
+        return self.result
+
+    def call(self, message, *payload):
+        self.send(message, *payload)
+        return self.receive()
+
+
+def parallel_breadth_first_search(problem, workers=None):
+    """Breadth-first graph search that expands every layer in parallel. It
+    finds the same depth of solution as breadth_first_graph_search.
+    :param problem: the problem to solve
+    :type problem: Problem
+    :param workers: number of processes, all cores if None
+    :type workers: int
+    :return: Node or None
+    :rtype: Node
+    """
+    if problem.goal_test(problem.initial):
+        return Node(problem.initial)
+    count = workers or os.cpu_count() or 1
+    processes = []
+    if count > 1 and "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+        # Queue.put hands the bucket to a feeder thread, so a worker never
+        # blocks on an owner that is still expanding
+        inboxes = [context.Queue() for _ in range(count)]
+        partitions = []
+        for index in range(count):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(target=serve, args=(child_end, problem, index, inboxes), daemon=True)
+            process.start()
+            processes.append(process)
+            partitions.append(RemotePartition(parent_end))
+    else:
+        inboxes = [queue.SimpleQueue() for _ in range(count)]
+        partitions = [LocalPartition(Partition(problem, index, inboxes)) for index in range(count)]
+    try:
+        partitions[hash(problem.initial) % count].call("seed", problem.initial)
+        while True:
+            for partition in partitions:
+                partition.send("expand")
+            for partition in partitions:
+                partition.receive()
+            for partition in partitions:
+                partition.send("merge")
+            results = [partition.receive() for partition in partitions]
+            goal = next((goal for _, goal in results if goal is not None), None)
+            if goal is not None:
+                return build_node(problem, partitions, goal)
+            if not any(size for size, _ in results):
+                return None
+    finally:
+        for partition in partitions:
+            if isinstance(partition, RemotePartition):
+                partition.send("stop")
+        for process in processes:
+            process.join()
+
+
+def build_node(problem, partitions, goal):
+    """Follow the parent links from the goal back to the initial state and
+    rebuild the chain of Nodes, so that solution() and path() work."""
+    steps = []
+    state = goal
+    while True:
+        link = partitions[hash(state) % len(partitions)].call("parent", state)
+        if link is None:
+            break
+        parent, action = link
+        steps.append((action, state))
+        state = parent
+    node = Node(problem.initial)
+    for action, state in reversed(steps):
+        node = Node(state, node, action, problem.path_cost(node.path_cost, node.state, action, state))
+    return node
@@ -0,0 +1,136 @@
+"""
+Learning Real-Time A* (LRTA*): choose one move at a time from a bounded
+lookahead instead of planning the whole path first.
+
+    agent = LRTAStar(problem, lookahead=3, node_budget=200)
+    state = problem.initial
+    while not problem.goal_test(state):
+        action = agent.step(state)
+        state = problem.successor(state)[action]
+
+Every step looks ahead from the current state, backs the cheapest
+g + H of the lookahead frontier up to the current state and raises H there
+to it. The learned values H live in agent.table and start from problem.h, so
+repeated trials from the same start converge to an optimal path; the table
+can be saved and loaded to carry the learning over between runs.
+
+Works with the Explorer, Rock and Football problems as they are: they
+provide successor(), goal_test(), path_cost() and h(node).
+"""
+
+import math
+import os
+import pickle
+
+from searching_framework.utils import Node
+
+
+class LRTAStar:
+    def __init__(self, problem, h=None, lookahead=1, node_budget=None, table=None):
+        """
+        :param problem: the problem to act in
+        :type problem: Problem
+        :param h: initial heuristic h(node), problem.h if None
+        :param lookahead: depth of the lookahead search
+        :param node_budget: nodes generated per step after which the lookahead
+                            stops expanding (it can overshoot by one branching
+                            factor); the children of the current state are
+                            always generated
+        :param table: learned values from earlier runs, state -> H
+        :type table: dict
+        """
+        self.problem = problem
+        self.h = h or problem.h
+        self.lookahead = max(1, lookahead)
+        self.node_budget = node_budget
+        self.table = {} if table is None else table
+        self.generated = 0
+
+    def estimate(self, state):
+        value = self.table.get(state)
+        if value is None:
+            value = 0 if self.problem.goal_test(state) else self.h(Node(state))
+        return value
+
+    def children(self, state):
+        successors = self.problem.successor(state)
+        self.generated += len(successors)
+        return [(action, child, self.problem.path_cost(0, state, action, child))
+                for action, child in successors.items()]
+
+    def backed_up(self, state, depth):
+        """Cheapest g + H over the lookahead frontier below state, but never
+        less than H of state itself: the learned values of the states on the
+        frontier can be lower than the value already learned for state, and
+        backing such a value up would undo what earlier steps learned, so the
+        agent could walk the same cycle forever."""
+        if depth == 0 or self.problem.goal_test(state) or \
+                (self.node_budget is not None and self.generated >= self.node_budget):
+            return self.estimate(state)
+        children = self.children(state)
+        if not children:
+            return math.inf
+        return max(self.estimate(state), min(cost + self.backed_up(child, depth - 1) for _, child, cost in children))
+
+    def step(self, state):
+        """Next action from state within the node budget. Updates the
+        learned H of state.
+        :param state: the current state
+        :return: the action to take, None if there is no move
+        """
+        self.generated = 0
+        best_action, best_value = None, math.inf
+        for action, child, cost in self.children(state):
+            value = cost + self.backed_up(child, self.lookahead - 1)
+            if value < best_value:
+                best_action, best_value = action, value
+        self.table[state] = max(self.estimate(state), best_value)
+        return best_action
+
+    def trial(self, state=None, max_steps=10000):
+        """Act from state (problem.initial if None) until a goal is reached.
+        :return: Node for the reached goal with the path that was walked,
+                 None if max_steps ran out or the agent got stuck
+        :rtype: Node
+        """
+        node = Node(self.problem.initial if state is None else state)
+        for _ in range(max_steps):
+            if self.problem.goal_test(node.state):
+                return node
+            action = self.step(node.state)
+            if action is None:
+                return None
+            node = node.child_node(self.problem, action)
+        return node if self.problem.goal_test(node.state) else None
+
+    def train(self, trials=100, state=None, max_steps=10000):
+        """Repeat trials until the walked path stops changing. A trial that
+        runs into a dead end still teaches the table to avoid it next time.
+        :return: the Node of the last successful trial, None if none succeeded
+        :rtype: Node
+        """
+        previous, last = None, None
+        for _ in range(trials):
+            node = self.trial(state, max_steps)
+            if node is None:
+                previous = None
+                continue
+            last = node
+            solution = node.solution()
+            if solution == previous:
+                break
+            previous = solution
+        return last
+
+    def save(self, path):
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as stream:
+            pickle.dump(self.table, stream, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    @staticmethod
+    def load_table(path):
+        if not os.path.exists(path):
+            return {}
+        with open(path, "rb") as stream:
+            return pickle.load(stream)
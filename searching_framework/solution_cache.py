@@ -0,0 +1,258 @@
+"""
+Persistent cache of solved instances in a local SQLite file.
+
+    cache = SolutionCache("solutions.db")
+    node = cache.solve(problem, astar_search)
+
+An entry is keyed by a SHA-256 over the problem class, its static
+parameters (the attributes of the problem other than initial and goal),
+the initial state, the goal, the algorithm and the arguments it was
+called with (functions such as a custom h= by qualified name and file).
+It stores the action sequence, the path cost and statistics of the
+original run. Before an entry is returned its actions are replayed through
+problem.successor and the end state is checked with goal_test, so a stale
+entry (the problem class changed) is dropped instead of returned.
+
+Attributes whose name contains "cache" are left out of the key, since they
+fill up during a search. A problem can choose its static parameters
+itself by defining cache_params() -> any value of the kinds encoded below.
+
+When the stored entries exceed max_bytes, the least recently used ones
+are evicted.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import time
+
+import numpy as np
+
+from searching_framework.utils import Node
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    key TEXT PRIMARY KEY,
+    problem TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    actions BLOB NOT NULL,
+    path_cost REAL,
+    stats TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+def encode(value, digest, seen):
+    """Feed a canonical encoding of value into digest: equal values give
+    equal bytes in every process (unlike hash(), which is salted for str),
+    sets and dicts independently of their iteration order."""
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, bytearray, range)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, (tuple, list)):
+        digest.update(f"{type(value).__name__}[{len(value)}]".encode())
+        for item in value:
+            encode(item, digest, seen)
+    elif isinstance(value, (set, frozenset)):
+        digest.update(f"set[{len(value)}]".encode())
+        for item in sorted(fingerprint(item, seen) for item in value):
+            digest.update(item.encode())
+    elif isinstance(value, dict):
+        digest.update(f"dict[{len(value)}]".encode())
+        for key, item in sorted((fingerprint(key, seen), item) for key, item in value.items()):
+            digest.update(key.encode())
+            encode(item, digest, seen)
+    elif isinstance(value, np.ndarray):
+        digest.update(f"ndarray{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, np.generic):
+        encode(value.item(), digest, seen)
+    elif callable(value) and hasattr(value, "__qualname__"):
+        # functions, methods and classes by name: two heuristics passed as
+        # h= must not share an entry
+        digest.update(f"callable:{callable_name(value)};".encode())
+    elif hasattr(value, "__dict__") and id(value) not in seen:
+        seen.add(id(value))
+        digest.update(f"object:{type(value).__qualname__}".encode())
+        encode(static_params(value), digest, seen)
+    else:
+        # modules, objects already encoded on this path
+        digest.update(f"other:{type(value).__qualname__};".encode())
+
+
+def fingerprint(value, seen=None):
+    digest = hashlib.sha256()
+    encode(value, digest, set() if seen is None else seen)
+    return digest.hexdigest()
+
+
+def static_params(obj):
+    if hasattr(obj, "cache_params"):
+        return obj.cache_params()
+    return {name: item for name, item in vars(obj).items()
+            if name not in ("initial", "goal") and "cache" not in name}
+
+
+def problem_name(problem):
+    """Class name with the file it is defined in; scripts are loaded as
+    __main__ or under any module name, so the file is the stable part."""
+    cls = type(problem)
+    source = cls.__module__
+    for item in vars(cls).values():
+        if inspect.isfunction(item):
+            source = os.path.basename(item.__code__.co_filename)
+            break
+    return f"{source}:{cls.__qualname__}"
+
+
+def callable_name(value):
+    """Qualified name with the file the code is in, for the same reason as
+    problem_name."""
+    code = getattr(getattr(value, "__func__", value), "__code__", None)
+    if code is None:
+        return f"{getattr(value, '__module__', None)}:{value.__qualname__}"
+    return f"{os.path.basename(code.co_filename)}:{value.__qualname__}"
+
+
+def algorithm_name(algorithm):
+    if isinstance(algorithm, str):
+        return algorithm
+    return getattr(algorithm, "__qualname__", repr(algorithm))
+
+
+def is_node(value):
+    """Whether a search returned a solution: a Node of this package or of
+    the framework copy in a script, not None or 'cutoff'."""
+    return isinstance(value, Node) or callable(getattr(value, "solution", None))
+
+
+def replay(problem, actions):
+    """Apply the actions from the initial state.
+    :return: Node for the reached goal, None if an action is not available
+             or the last state is not a goal
+    :rtype: Node
+    """
+    node = Node(problem.initial)
+    for action in actions:
+        state = problem.successor(node.state).get(action)
+        if state is None:
+            return None
+        node = Node(state, node, action, problem.path_cost(node.path_cost, node.state, action, state))
+    return node if problem.goal_test(node.state) else None
+
+
+class SolutionCache:
+    def __init__(self, path="solutions.db", max_bytes=64 << 20):
+        """
+        :param path: SQLite file, created if missing
+        :param max_bytes: size of the stored action sequences above which the
+                          least recently used entries are evicted
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.connection = sqlite3.connect(path)
+        # a lost bookkeeping update after a crash is harmless, a sync per hit is not
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(SCHEMA)
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def key(self, problem, algorithm, args=(), kwargs=None):
+        """
+        :param args: positional arguments of the search after the problem
+        :param kwargs: keyword arguments of the search; depth_limited_search
+                       with limit=2 and limit=20 are different entries
+        """
+        digest = hashlib.sha256()
+        encode((problem_name(problem), algorithm_name(algorithm)), digest, set())
+        seen = {id(problem)}
+        encode(static_params(problem), digest, seen)
+        encode(problem.initial, digest, seen)
+        encode(problem.goal, digest, seen)
+        encode(tuple(args), digest, seen)
+        encode(kwargs or {}, digest, seen)
+        return digest.hexdigest()
+
+    def get(self, problem, algorithm, key=None):
+        """Cached solution of problem by algorithm, checked by replay.
+        :return: (Node, stats) or None
+        :rtype: tuple
+        """
+        key = key or self.key(problem, algorithm)
+        row = self.connection.execute("SELECT actions, stats FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        node = replay(problem, pickle.loads(row[0]))
+        if node is None:
+            self.connection.execute("DELETE FROM solutions WHERE key = ?", (key,))
+            self.connection.commit()
+            return None
+        self.connection.execute("UPDATE solutions SET used = ?, hits = hits + 1 WHERE key = ?", (time.time(), key))
+        self.connection.commit()
+        return node, json.loads(row[1])
+
+    def put(self, problem, algorithm, node, stats=None, key=None):
+        """Store the solution in node. Anything but a Node (None, 'cutoff'
+        of a depth-limited search) is not stored."""
+        if not is_node(node):
+            return
+        key = key or self.key(problem, algorithm)
+        actions = pickle.dumps(node.solution(), pickle.HIGHEST_PROTOCOL)
+        stats = json.dumps(stats or {}, default=str)
+        now = time.time()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO solutions (key, problem, algorithm, actions, path_cost, stats, size, created, used)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, problem_name(problem), algorithm_name(algorithm), actions, node.path_cost, stats,
+             len(actions) + len(stats), now, now))
+        self.evict()
+        self.connection.commit()
+
+    def evict(self):
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM solutions").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.connection.execute("SELECT key, size FROM solutions ORDER BY used").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.connection.execute("DELETE FROM solutions WHERE key = ?", (key,))
+            total -= size
+
+    def solve(self, problem, search, *args, **kwargs):
+        """search(problem, *args, **kwargs), answered from the cache when the
+        same instance was solved with the same algorithm and arguments
+        before.
+        :return: whatever search returns
+        :rtype: Node
+        """
+        key = self.key(problem, search, args, kwargs)
+        cached = self.get(problem, search, key)
+        if cached is not None:
+            return cached[0]
+        start = time.perf_counter()
+        node = search(problem, *args, **kwargs)
+        if is_node(node):
+            self.put(problem, search, node, {
+                "seconds": time.perf_counter() - start,
+                "length": len(node.solution()),
+            }, key)
+        return node
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
@@ -0,0 +1,156 @@
+import sys
+
+from searching_framework.utils import FIFOQueue, Node, Stack, pack_nodes, unpack_nodes
+
+"""
+Неинформирано пребарување во рамки на граф, со можност за checkpoint.
+Ако е зададен checkpoint (Checkpointer), состојбата на пребарувањето
+периодично се запишува на диск и може да се продолжи со resume_search.
+"""
+
+
+def graph_search(problem, fringe, checkpoint=None, resume=None):
+    """Пребарувај низ следбениците на даден проблем за да најдеш цел.
+     Ако до дадена состојба стигнат два пата, употреби го најдобриот пат.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param fringe:  празна редица (queue)
+    :type fringe: FIFOQueue or Stack
+    :param checkpoint: каде и колку често да се зачувува состојбата
+    :type checkpoint: Checkpointer
+    :param resume: вчитан checkpoint од кој се продолжува
+    :type resume: dict
+    :return: Node or None
+    :rtype: Node
+    """
+    if resume is None:
+        closed = set()
+        expanded = 0
+        fringe.append(Node(problem.initial))
+    else:
+        nodes = unpack_nodes(resume["nodes"])
+        fringe.extend(nodes[i] for i in resume["fringe"])
+        closed = resume["closed"]
+        expanded = resume["expanded"]
+    while fringe:
+        node = fringe.pop()
+        if problem.goal_test(node.state):
+            return node
+        if node.state not in closed:
+            closed.add(node.state)
+            fringe.extend(node.expand(problem))
+            expanded += 1
+            if checkpoint is not None and checkpoint.due():
+                table, index = pack_nodes(fringe.data)
+                checkpoint.save({
+                    "algorithm": "breadth_first" if isinstance(fringe, FIFOQueue) else "depth_first",
+                    "initial": problem.initial,
+                    "nodes": table,
+                    "fringe": [index[id(item)] for item in fringe.data],
+                    "closed": closed,
+                    "expanded": expanded,
+                })
+    return None
+
+
+def breadth_first_graph_search(problem, checkpoint=None):
+    """Експандирај го прво најплиткиот јазол во пребарувачкиот граф.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param checkpoint: каде и колку често да се зачувува состојбата
+    :type checkpoint: Checkpointer
+    :return: Node or None
+    :rtype: Node
+    """
+    return graph_search(problem, FIFOQueue(), checkpoint)
+
+
+def depth_first_graph_search(problem, checkpoint=None):
+    """Експандирај го прво најдлабокиот јазол во пребарувачкиот граф.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param checkpoint: каде и колку често да се зачувува состојбата
+    :type checkpoint: Checkpointer
+    :return: Node or None
+    :rtype: Node
+    """
+    return graph_search(problem, Stack(), checkpoint)
+
+
+def depth_limited_search(problem, limit=50, checkpoint=None, resume=None, algorithm="depth_limited"):
+    """Експандирај го прво најдлабокиот јазол во пребарувачкиот граф
+    со ограничена длабочина. Рекурзијата е заменета со експлицитен стек
+    од (јазол, неистражени деца), за да може стекот да се зачува.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param limit: лимит за длабочината
+    :type limit: int
+    :param checkpoint: каде и колку често да се зачувува состојбата
+    :type checkpoint: Checkpointer
+    :param resume: вчитан checkpoint од кој се продолжува
+    :type resume: dict
+    :return: Node, 'cutoff' or None
+    :rtype: Node
+    """
+    if resume is None:
+        node = Node(problem.initial)
+        if problem.goal_test(node.state):
+            return node
+        if node.depth == limit:
+            return 'cutoff'
+        stack = [(node, node.expand(problem)[::-1])]
+        cutoff_occurred = False
+        expanded = 1
+    else:
+        nodes = unpack_nodes(resume["nodes"])
+        stack = [(nodes[i], [nodes[j] for j in children]) for i, children in resume["stack"]]
+        cutoff_occurred = resume["cutoff"]
+        expanded = resume["expanded"]
+    while stack:
+        children = stack[-1][1]
+        if not children:
+            stack.pop()
+            continue
+        node = children.pop()
+        if problem.goal_test(node.state):
+            return node
+        if node.depth == limit:
+            cutoff_occurred = True
+            continue
+        stack.append((node, node.expand(problem)[::-1]))
+        expanded += 1
+        if checkpoint is not None and checkpoint.due():
+            table, index = pack_nodes(item for frame, children in stack for item in [frame] + children)
+            checkpoint.save({
+                "algorithm": algorithm,
+                "initial": problem.initial,
+                "limit": limit,
+                "nodes": table,
+                "stack": [(index[id(frame)], [index[id(child)] for child in children])
+                          for frame, children in stack],
+                "cutoff": cutoff_occurred,
+                "expanded": expanded,
+            })
+    if cutoff_occurred:
+        return 'cutoff'
+    return None
+
+
+def iterative_deepening_search(problem, checkpoint=None, resume=None):
+    """Експандирај го прво најдлабокиот јазол во пребарувачкиот граф
+    со ограничена длабочина, со итеративно зголемување на длабочината.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param checkpoint: каде и колку често да се зачувува состојбата
+    :type checkpoint: Checkpointer
+    :param resume: вчитан checkpoint од кој се продолжува
+    :type resume: dict
+    :return: Node or None
+    :rtype: Node
+    """
+    start = 0 if resume is None else resume["limit"]
+    for depth in range(start, sys.maxsize):
+        result = depth_limited_search(problem, depth, checkpoint, resume, "iterative_deepening")
+        resume = None
+        if result != 'cutoff':
+            return result